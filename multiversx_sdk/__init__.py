@@ -1,171 +1,343 @@
-from multiversx_sdk.account_management import (
-    AccountController,
-    AccountTransactionsFactory,
-)
-from multiversx_sdk.accounts import Account, LedgerAccount
-from multiversx_sdk.core import (
-    Address,
-    AddressComputer,
-    AddressFactory,
-    CodeMetadata,
-    LibraryConfig,
-    Message,
-    MessageComputer,
-    SmartContractResult,
-    Token,
-    TokenComputer,
-    TokenIdentifierParts,
-    TokenTransfer,
-    Transaction,
-    TransactionComputer,
-    TransactionEvent,
-    TransactionEventsParser,
-    TransactionLogs,
-    TransactionOnNetwork,
-    TransactionsFactoryConfig,
-    TransactionStatus,
-    find_events_by_first_topic,
-    find_events_by_identifier,
-)
-from multiversx_sdk.delegation import (
-    CreateNewDelegationContractOutcome,
-    DelegationController,
-    DelegationTransactionsFactory,
-    DelegationTransactionsOutcomeParser,
-)
-from multiversx_sdk.entrypoints import (
-    DevnetEntrypoint,
-    LocalnetEntrypoint,
-    MainnetEntrypoint,
-    NetworkEntrypoint,
-    TestnetEntrypoint,
-)
-from multiversx_sdk.gas_estimator import GasLimitEstimator
-from multiversx_sdk.governance import (
-    CloseProposalOutcome,
-    DelegatedVoteInfo,
-    DelegateVoteOutcome,
-    GovernanceConfig,
-    GovernanceController,
-    GovernanceTransactionsFactory,
-    GovernanceTransactionsOutcomeParser,
-    NewProposalOutcome,
-    ProposalInfo,
-    VoteOutcome,
-    VoteType,
-)
-from multiversx_sdk.ledger.ledger_app import LedgerApp
-from multiversx_sdk.multisig import (
-    Action,
-    ActionFullInfo,
-    AddBoardMember,
-    AddProposer,
-    CallActionData,
-    ChangeQuorum,
-    EsdtTokenPayment,
-    EsdtTransferExecuteData,
-    MultisigController,
-    MultisigTransactionsFactory,
-    MultisigTransactionsOutcomeParser,
-    RemoveUser,
-    SCDeployFromSource,
-    SCUpgradeFromSource,
-    SendAsyncCall,
-    SendTransferExecuteEgld,
-    SendTransferExecuteEsdt,
-    UserRole,
-)
-from multiversx_sdk.native_auth.config import (
-    NativeAuthClientConfig,
-    NativeAuthServerConfig,
-)
-from multiversx_sdk.native_auth.native_auth_client import NativeAuthClient
-from multiversx_sdk.native_auth.native_auth_server import NativeAuthServer
-from multiversx_sdk.network_providers import (
-    AccountAwaiter,
-    AccountOnNetwork,
-    AccountStorage,
-    AccountStorageEntry,
-    ApiNetworkProvider,
-    AwaitingOptions,
-    BlockCoordinates,
-    BlockOnNetwork,
-    FungibleTokenMetadata,
-    GenericResponse,
-    NetworkConfig,
-    NetworkProviderConfig,
-    NetworkProviderError,
-    NetworkStatus,
-    ProxyNetworkProvider,
-    RequestsRetryOptions,
-    TokenAmountOnNetwork,
-    TokensCollectionMetadata,
-    TransactionAwaiter,
-    TransactionCostResponse,
-    TransactionDecoder,
-    TransactionMetadata,
-)
-from multiversx_sdk.smart_contracts import (
-    DeployedSmartContract,
-    ParsedSmartContractCallOutcome,
-    SmartContractController,
-    SmartContractDeployOutcome,
-    SmartContractQuery,
-    SmartContractQueryResponse,
-    SmartContractTransactionsFactory,
-    SmartContractTransactionsOutcomeParser,
-)
-from multiversx_sdk.token_management import (
-    AddQuantityOutcome,
-    BurnOutcome,
-    BurnQuantityOutcome,
-    ChangeTokenToDynamicOutcome,
-    FreezeOutcome,
-    IssueFungibleOutcome,
-    IssueNonFungibleOutcome,
-    IssueSemiFungibleOutcome,
-    MetadataRecreateOutcome,
-    MintOutcome,
-    ModifyCreatorOutcome,
-    ModifyRoyaltiesOutcome,
-    NFTCreateOutcome,
-    PauseOutcome,
-    RegisterAndSetAllRolesOutcome,
-    RegisterDynamicOutcome,
-    RegisterMetaEsdtOutcome,
-    SetNewUrisOutcome,
-    SetSpecialRoleOutcome,
-    TokenManagementController,
-    TokenManagementTransactionsFactory,
-    TokenManagementTransactionsOutcomeParser,
-    TokenType,
-    UnFreezeOutcome,
-    UnPauseOutcome,
-    UpdateAttributesOutcome,
-    UpdateMetadataOutcome,
-    WipeOutcome,
-)
-from multiversx_sdk.transfers import TransfersController, TransferTransactionsFactory
-from multiversx_sdk.validators import (
-    ValidatorsController,
-    ValidatorsSigners,
-    ValidatorsTransactionsFactory,
-)
-from multiversx_sdk.wallet import (
-    KeyPair,
-    Mnemonic,
-    UserPEM,
-    UserPublicKey,
-    UserSecretKey,
-    UserSigner,
-    UserVerifier,
-    UserWallet,
-    ValidatorPEM,
-    ValidatorPublicKey,
-    ValidatorSecretKey,
-    ValidatorSigner,
-    ValidatorVerifier,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.account_management import (
+        AccountController,
+        AccountTransactionsFactory,
+    )
+    from multiversx_sdk.accounts import Account, LedgerAccount, SigningPool
+    from multiversx_sdk.core import (
+        Address,
+        AddressComputer,
+        AddressFactory,
+        CodeMetadata,
+        LibraryConfig,
+        Message,
+        MessageComputer,
+        SmartContractResult,
+        Token,
+        TokenComputer,
+        TokenIdentifierParts,
+        TokenTransfer,
+        Transaction,
+        TransactionBatch,
+        TransactionComputer,
+        TransactionEvent,
+        TransactionEventsParser,
+        TransactionLogs,
+        TransactionOnNetwork,
+        TransactionsFactoryConfig,
+        TransactionStatus,
+        find_events_by_first_topic,
+        find_events_by_identifier,
+    )
+    from multiversx_sdk.delegation import (
+        CreateNewDelegationContractOutcome,
+        DelegationController,
+        DelegationTransactionsFactory,
+        DelegationTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.entrypoints import (
+        CoSigningEngine,
+        CoSigningStats,
+        DevnetEntrypoint,
+        LocalnetEntrypoint,
+        MainnetEntrypoint,
+        NetworkEntrypoint,
+        TestnetEntrypoint,
+    )
+    from multiversx_sdk.gas_estimator import GasLimitEstimator
+    from multiversx_sdk.governance import (
+        CloseProposalOutcome,
+        DelegatedVoteInfo,
+        DelegateVoteOutcome,
+        GovernanceConfig,
+        GovernanceController,
+        GovernanceTransactionsFactory,
+        GovernanceTransactionsOutcomeParser,
+        NewProposalOutcome,
+        ProposalInfo,
+        VoteOutcome,
+        VoteType,
+    )
+    from multiversx_sdk.ledger.ledger_app import LedgerApp
+    from multiversx_sdk.multisig import (
+        Action,
+        ActionFullInfo,
+        AddBoardMember,
+        AddProposer,
+        CallActionData,
+        ChangeQuorum,
+        EsdtTokenPayment,
+        EsdtTransferExecuteData,
+        MultisigController,
+        MultisigTransactionsFactory,
+        MultisigTransactionsOutcomeParser,
+        RemoveUser,
+        SCDeployFromSource,
+        SCUpgradeFromSource,
+        SendAsyncCall,
+        SendTransferExecuteEgld,
+        SendTransferExecuteEsdt,
+        UserRole,
+    )
+    from multiversx_sdk.native_auth.config import (
+        NativeAuthClientConfig,
+        NativeAuthServerConfig,
+    )
+    from multiversx_sdk.native_auth.native_auth_client import NativeAuthClient
+    from multiversx_sdk.native_auth.native_auth_server import NativeAuthServer
+    from multiversx_sdk.network_providers import (
+        AccountAwaiter,
+        AccountOnNetwork,
+        AccountStorage,
+        AccountStorageEntry,
+        ApiNetworkProvider,
+        AwaitingOptions,
+        BlockCoordinates,
+        BlockOnNetwork,
+        FungibleTokenMetadata,
+        GenericResponse,
+        NetworkConfig,
+        NetworkProviderConfig,
+        NetworkProviderError,
+        NetworkStatus,
+        ProxyNetworkProvider,
+        RequestsRetryOptions,
+        TokenAmountOnNetwork,
+        TokensCollectionMetadata,
+        TransactionAwaiter,
+        TransactionCostResponse,
+        TransactionDecoder,
+        TransactionMetadata,
+    )
+    from multiversx_sdk.smart_contracts import (
+        DeployedSmartContract,
+        ParsedSmartContractCallOutcome,
+        SmartContractController,
+        SmartContractDeployOutcome,
+        SmartContractQuery,
+        SmartContractQueryResponse,
+        SmartContractTransactionsFactory,
+        SmartContractTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.token_management import (
+        AddQuantityOutcome,
+        BurnOutcome,
+        BurnQuantityOutcome,
+        ChangeTokenToDynamicOutcome,
+        FreezeOutcome,
+        IssueFungibleOutcome,
+        IssueNonFungibleOutcome,
+        IssueSemiFungibleOutcome,
+        MetadataRecreateOutcome,
+        MintOutcome,
+        ModifyCreatorOutcome,
+        ModifyRoyaltiesOutcome,
+        NFTCreateOutcome,
+        PauseOutcome,
+        RegisterAndSetAllRolesOutcome,
+        RegisterDynamicOutcome,
+        RegisterMetaEsdtOutcome,
+        SetNewUrisOutcome,
+        SetSpecialRoleOutcome,
+        TokenManagementController,
+        TokenManagementTransactionsFactory,
+        TokenManagementTransactionsOutcomeParser,
+        TokenType,
+        UnFreezeOutcome,
+        UnPauseOutcome,
+        UpdateAttributesOutcome,
+        UpdateMetadataOutcome,
+        WipeOutcome,
+    )
+    from multiversx_sdk.transfers import (
+        TransfersController,
+        TransferTransactionsFactory,
+    )
+    from multiversx_sdk.validators import (
+        ValidatorsController,
+        ValidatorsSigners,
+        ValidatorsTransactionsFactory,
+    )
+    from multiversx_sdk.wallet import (
+        KeyPair,
+        KeystoreProvisioner,
+        KeystoreProvisioningStats,
+        Mnemonic,
+        UserKeysGenerator,
+        UserPEM,
+        UserPublicKey,
+        UserSecretKey,
+        UserSigner,
+        UserVerifier,
+        UserWallet,
+        ValidatorPEM,
+        ValidatorPublicKey,
+        ValidatorSecretKey,
+        ValidatorSigner,
+        ValidatorVerifier,
+    )
+
+_EXPORTS = {
+    "AccountController": "multiversx_sdk.account_management.account_controller",
+    "AccountTransactionsFactory": "multiversx_sdk.account_management.account_transactions_factory",
+    "Account": "multiversx_sdk.accounts.account",
+    "LedgerAccount": "multiversx_sdk.accounts.ledger_account",
+    "SigningPool": "multiversx_sdk.accounts.signing_pool",
+    "Address": "multiversx_sdk.core.address",
+    "AddressComputer": "multiversx_sdk.core.address",
+    "AddressFactory": "multiversx_sdk.core.address",
+    "CodeMetadata": "multiversx_sdk.core.code_metadata",
+    "LibraryConfig": "multiversx_sdk.core.config",
+    "Message": "multiversx_sdk.core.message",
+    "MessageComputer": "multiversx_sdk.core.message",
+    "SmartContractResult": "multiversx_sdk.core.transaction_on_network",
+    "Token": "multiversx_sdk.core.tokens",
+    "TokenComputer": "multiversx_sdk.core.tokens",
+    "TokenIdentifierParts": "multiversx_sdk.core.tokens",
+    "TokenTransfer": "multiversx_sdk.core.tokens",
+    "Transaction": "multiversx_sdk.core.transaction",
+    "TransactionBatch": "multiversx_sdk.core.transaction_batch",
+    "TransactionComputer": "multiversx_sdk.core.transaction_computer",
+    "TransactionEvent": "multiversx_sdk.core.transaction_on_network",
+    "TransactionEventsParser": "multiversx_sdk.core.transaction_events_parser",
+    "TransactionLogs": "multiversx_sdk.core.transaction_on_network",
+    "TransactionOnNetwork": "multiversx_sdk.core.transaction_on_network",
+    "TransactionsFactoryConfig": "multiversx_sdk.core.transactions_factory_config",
+    "TransactionStatus": "multiversx_sdk.core.transaction_on_network",
+    "find_events_by_first_topic": "multiversx_sdk.core.transaction_on_network",
+    "find_events_by_identifier": "multiversx_sdk.core.transaction_on_network",
+    "CreateNewDelegationContractOutcome": "multiversx_sdk.delegation.delegation_transactions_outcome_parser_types",
+    "DelegationController": "multiversx_sdk.delegation.delegation_controller",
+    "DelegationTransactionsFactory": "multiversx_sdk.delegation.delegation_transactions_factory",
+    "DelegationTransactionsOutcomeParser": "multiversx_sdk.delegation.delegation_transactions_outcome_parser",
+    "DevnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "LocalnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "MainnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "NetworkEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "CoSigningEngine": "multiversx_sdk.entrypoints.co_signing_engine",
+    "CoSigningStats": "multiversx_sdk.entrypoints.co_signing_engine",
+    "TestnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "GasLimitEstimator": "multiversx_sdk.gas_estimator.gas_limit_estimator",
+    "CloseProposalOutcome": "multiversx_sdk.governance.resources",
+    "DelegatedVoteInfo": "multiversx_sdk.governance.resources",
+    "DelegateVoteOutcome": "multiversx_sdk.governance.resources",
+    "GovernanceConfig": "multiversx_sdk.governance.resources",
+    "GovernanceController": "multiversx_sdk.governance.governance_controller",
+    "GovernanceTransactionsFactory": "multiversx_sdk.governance.governance_transactions_factory",
+    "GovernanceTransactionsOutcomeParser": "multiversx_sdk.governance.governance_transactions_outcome_parser",
+    "NewProposalOutcome": "multiversx_sdk.governance.resources",
+    "ProposalInfo": "multiversx_sdk.governance.resources",
+    "VoteOutcome": "multiversx_sdk.governance.resources",
+    "VoteType": "multiversx_sdk.governance.resources",
+    "LedgerApp": "multiversx_sdk.ledger.ledger_app",
+    "Action": "multiversx_sdk.multisig.resources",
+    "ActionFullInfo": "multiversx_sdk.multisig.resources",
+    "AddBoardMember": "multiversx_sdk.multisig.resources",
+    "AddProposer": "multiversx_sdk.multisig.resources",
+    "CallActionData": "multiversx_sdk.multisig.resources",
+    "ChangeQuorum": "multiversx_sdk.multisig.resources",
+    "EsdtTokenPayment": "multiversx_sdk.multisig.resources",
+    "EsdtTransferExecuteData": "multiversx_sdk.multisig.resources",
+    "MultisigController": "multiversx_sdk.multisig.multisig_controller",
+    "MultisigTransactionsFactory": "multiversx_sdk.multisig.multisig_transactions_factory",
+    "MultisigTransactionsOutcomeParser": "multiversx_sdk.multisig.multisig_transactions_outcome_parser",
+    "RemoveUser": "multiversx_sdk.multisig.resources",
+    "SCDeployFromSource": "multiversx_sdk.multisig.resources",
+    "SCUpgradeFromSource": "multiversx_sdk.multisig.resources",
+    "SendAsyncCall": "multiversx_sdk.multisig.resources",
+    "SendTransferExecuteEgld": "multiversx_sdk.multisig.resources",
+    "SendTransferExecuteEsdt": "multiversx_sdk.multisig.resources",
+    "UserRole": "multiversx_sdk.multisig.resources",
+    "NativeAuthClientConfig": "multiversx_sdk.native_auth.config",
+    "NativeAuthServerConfig": "multiversx_sdk.native_auth.config",
+    "NativeAuthClient": "multiversx_sdk.native_auth.native_auth_client",
+    "NativeAuthServer": "multiversx_sdk.native_auth.native_auth_server",
+    "AccountAwaiter": "multiversx_sdk.network_providers.account_awaiter",
+    "AccountOnNetwork": "multiversx_sdk.network_providers.resources",
+    "AccountStorage": "multiversx_sdk.network_providers.resources",
+    "AccountStorageEntry": "multiversx_sdk.network_providers.resources",
+    "ApiNetworkProvider": "multiversx_sdk.network_providers.api_network_provider",
+    "AwaitingOptions": "multiversx_sdk.network_providers.resources",
+    "BlockCoordinates": "multiversx_sdk.network_providers.resources",
+    "BlockOnNetwork": "multiversx_sdk.network_providers.resources",
+    "FungibleTokenMetadata": "multiversx_sdk.network_providers.resources",
+    "GenericResponse": "multiversx_sdk.network_providers.resources",
+    "NetworkConfig": "multiversx_sdk.network_providers.resources",
+    "NetworkProviderConfig": "multiversx_sdk.network_providers.config",
+    "NetworkProviderError": "multiversx_sdk.network_providers.errors",
+    "NetworkStatus": "multiversx_sdk.network_providers.resources",
+    "ProxyNetworkProvider": "multiversx_sdk.network_providers.proxy_network_provider",
+    "RequestsRetryOptions": "multiversx_sdk.network_providers.config",
+    "TokenAmountOnNetwork": "multiversx_sdk.network_providers.resources",
+    "TokensCollectionMetadata": "multiversx_sdk.network_providers.resources",
+    "TransactionAwaiter": "multiversx_sdk.network_providers.transaction_awaiter",
+    "TransactionCostResponse": "multiversx_sdk.network_providers.resources",
+    "TransactionDecoder": "multiversx_sdk.network_providers.transaction_decoder",
+    "TransactionMetadata": "multiversx_sdk.network_providers.transaction_decoder",
+    "DeployedSmartContract": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+    "ParsedSmartContractCallOutcome": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+    "SmartContractController": "multiversx_sdk.smart_contracts.smart_contract_controller",
+    "SmartContractDeployOutcome": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+    "SmartContractQuery": "multiversx_sdk.smart_contracts.smart_contract_query",
+    "SmartContractQueryResponse": "multiversx_sdk.smart_contracts.smart_contract_query",
+    "SmartContractTransactionsFactory": "multiversx_sdk.smart_contracts.smart_contract_transactions_factory",
+    "SmartContractTransactionsOutcomeParser": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser",
+    "AddQuantityOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "BurnOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "BurnQuantityOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ChangeTokenToDynamicOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "FreezeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueNonFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueSemiFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "MetadataRecreateOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "MintOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ModifyCreatorOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ModifyRoyaltiesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "NFTCreateOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "PauseOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterAndSetAllRolesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterDynamicOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterMetaEsdtOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "SetNewUrisOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "SetSpecialRoleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "TokenManagementController": "multiversx_sdk.token_management.token_management_controller",
+    "TokenManagementTransactionsFactory": "multiversx_sdk.token_management.token_management_transactions_factory",
+    "TokenManagementTransactionsOutcomeParser": "multiversx_sdk.token_management.token_management_transactions_outcome_parser",
+    "TokenType": "multiversx_sdk.token_management.token_management_transactions_factory",
+    "UnFreezeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UnPauseOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UpdateAttributesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UpdateMetadataOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "WipeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "TransfersController": "multiversx_sdk.transfers.transfers_controller",
+    "TransferTransactionsFactory": "multiversx_sdk.transfers.transfer_transactions_factory",
+    "ValidatorsController": "multiversx_sdk.validators.validators_controller",
+    "ValidatorsSigners": "multiversx_sdk.validators.validators_signers",
+    "ValidatorsTransactionsFactory": "multiversx_sdk.validators.validators_transactions_factory",
+    "KeyPair": "multiversx_sdk.wallet.keypair",
+    "KeystoreProvisioner": "multiversx_sdk.wallet.keystore_provisioner",
+    "KeystoreProvisioningStats": "multiversx_sdk.wallet.keystore_provisioner",
+    "Mnemonic": "multiversx_sdk.wallet.mnemonic",
+    "UserKeysGenerator": "multiversx_sdk.wallet.user_keys_generator",
+    "UserPEM": "multiversx_sdk.wallet.user_pem",
+    "UserPublicKey": "multiversx_sdk.wallet.user_keys",
+    "UserSecretKey": "multiversx_sdk.wallet.user_keys",
+    "UserSigner": "multiversx_sdk.wallet.user_signer",
+    "UserVerifier": "multiversx_sdk.wallet.user_verifer",
+    "UserWallet": "multiversx_sdk.wallet.user_wallet",
+    "ValidatorPEM": "multiversx_sdk.wallet.validator_pem",
+    "ValidatorPublicKey": "multiversx_sdk.wallet.validator_keys",
+    "ValidatorSecretKey": "multiversx_sdk.wallet.validator_keys",
+    "ValidatorSigner": "multiversx_sdk.wallet.validator_signer",
+    "ValidatorVerifier": "multiversx_sdk.wallet.validator_verifier",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "Account",
@@ -173,6 +345,7 @@ __all__ = [
     "AddressFactory",
     "AddressComputer",
     "Transaction",
+    "TransactionBatch",
     "TransactionComputer",
     "Message",
     "MessageComputer",
@@ -208,6 +381,9 @@ __all__ = [
     "ValidatorPEM",
     "UserWallet",
     "UserPEM",
+    "UserKeysGenerator",
+    "KeystoreProvisioner",
+    "KeystoreProvisioningStats",
     "DelegationTransactionsOutcomeParser",
     "find_events_by_identifier",
     "find_events_by_first_topic",
@@ -222,6 +398,8 @@ __all__ = [
     "DevnetEntrypoint",
     "MainnetEntrypoint",
     "NetworkEntrypoint",
+    "CoSigningEngine",
+    "CoSigningStats",
     "TestnetEntrypoint",
     "AccountController",
     "DelegationController",
@@ -268,6 +446,7 @@ __all__ = [
     "KeyPair",
     "LedgerApp",
     "LedgerAccount",
+    "SigningPool",
     "LocalnetEntrypoint",
     "ModifyRoyaltiesOutcome",
     "SetNewUrisOutcome",
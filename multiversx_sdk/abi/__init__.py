@@ -1,42 +1,91 @@
-from multiversx_sdk.abi.abi import Abi
-from multiversx_sdk.abi.abi_definition import AbiDefinition
-from multiversx_sdk.abi.address_value import AddressValue
-from multiversx_sdk.abi.array_value import ArrayValue
-from multiversx_sdk.abi.bigint_value import BigIntValue
-from multiversx_sdk.abi.biguint_value import BigUIntValue
-from multiversx_sdk.abi.bool_value import BoolValue
-from multiversx_sdk.abi.bytes_value import BytesValue
-from multiversx_sdk.abi.code_metadata_value import CodeMetadataValue
-from multiversx_sdk.abi.codec import Codec
-from multiversx_sdk.abi.counted_variadic_values import CountedVariadicValues
-from multiversx_sdk.abi.enum_value import EnumValue
-from multiversx_sdk.abi.explicit_enum_value import ExplicitEnumValue
-from multiversx_sdk.abi.fields import Field
-from multiversx_sdk.abi.list_value import ListValue
-from multiversx_sdk.abi.managed_decimal_signed_value import ManagedDecimalSignedValue
-from multiversx_sdk.abi.managed_decimal_value import ManagedDecimalValue
-from multiversx_sdk.abi.multi_value import MultiValue
-from multiversx_sdk.abi.option_value import OptionValue
-from multiversx_sdk.abi.optional_value import OptionalValue
-from multiversx_sdk.abi.serializer import Serializer
-from multiversx_sdk.abi.small_int_values import (
-    I8Value,
-    I16Value,
-    I32Value,
-    I64Value,
-    U8Value,
-    U16Value,
-    U32Value,
-    U64Value,
-)
-from multiversx_sdk.abi.string_value import StringValue
-from multiversx_sdk.abi.struct_value import StructValue
-from multiversx_sdk.abi.token_identifier_value import TokenIdentifierValue
-from multiversx_sdk.abi.tuple_value import TupleValue
-from multiversx_sdk.abi.variadic_values import VariadicValues
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.abi.abi import Abi
+    from multiversx_sdk.abi.abi_definition import AbiDefinition
+    from multiversx_sdk.abi.address_value import AddressValue
+    from multiversx_sdk.abi.array_value import ArrayValue
+    from multiversx_sdk.abi.bigint_value import BigIntValue
+    from multiversx_sdk.abi.biguint_value import BigUIntValue
+    from multiversx_sdk.abi.bool_value import BoolValue
+    from multiversx_sdk.abi.bytes_value import BytesValue
+    from multiversx_sdk.abi.code_metadata_value import CodeMetadataValue
+    from multiversx_sdk.abi.codec import Codec
+    from multiversx_sdk.abi.codegen import AbiCodeGenerator
+    from multiversx_sdk.abi.counted_variadic_values import CountedVariadicValues
+    from multiversx_sdk.abi.enum_value import EnumValue
+    from multiversx_sdk.abi.explicit_enum_value import ExplicitEnumValue
+    from multiversx_sdk.abi.fields import Field
+    from multiversx_sdk.abi.list_value import ListValue
+    from multiversx_sdk.abi.managed_decimal_signed_value import (
+        ManagedDecimalSignedValue,
+    )
+    from multiversx_sdk.abi.managed_decimal_value import ManagedDecimalValue
+    from multiversx_sdk.abi.multi_value import MultiValue
+    from multiversx_sdk.abi.option_value import OptionValue
+    from multiversx_sdk.abi.optional_value import OptionalValue
+    from multiversx_sdk.abi.serializer import Serializer
+    from multiversx_sdk.abi.small_int_values import (
+        I8Value,
+        I16Value,
+        I32Value,
+        I64Value,
+        U8Value,
+        U16Value,
+        U32Value,
+        U64Value,
+    )
+    from multiversx_sdk.abi.string_value import StringValue
+    from multiversx_sdk.abi.struct_value import StructValue
+    from multiversx_sdk.abi.token_identifier_value import TokenIdentifierValue
+    from multiversx_sdk.abi.tuple_value import TupleValue
+    from multiversx_sdk.abi.variadic_values import VariadicValues
+
+_EXPORTS = {
+    "Abi": "multiversx_sdk.abi.abi",
+    "AbiDefinition": "multiversx_sdk.abi.abi_definition",
+    "AddressValue": "multiversx_sdk.abi.address_value",
+    "ArrayValue": "multiversx_sdk.abi.array_value",
+    "BigIntValue": "multiversx_sdk.abi.bigint_value",
+    "BigUIntValue": "multiversx_sdk.abi.biguint_value",
+    "BoolValue": "multiversx_sdk.abi.bool_value",
+    "BytesValue": "multiversx_sdk.abi.bytes_value",
+    "CodeMetadataValue": "multiversx_sdk.abi.code_metadata_value",
+    "Codec": "multiversx_sdk.abi.codec",
+    "AbiCodeGenerator": "multiversx_sdk.abi.codegen",
+    "CountedVariadicValues": "multiversx_sdk.abi.counted_variadic_values",
+    "EnumValue": "multiversx_sdk.abi.enum_value",
+    "ExplicitEnumValue": "multiversx_sdk.abi.explicit_enum_value",
+    "Field": "multiversx_sdk.abi.fields",
+    "ListValue": "multiversx_sdk.abi.list_value",
+    "ManagedDecimalSignedValue": "multiversx_sdk.abi.managed_decimal_signed_value",
+    "ManagedDecimalValue": "multiversx_sdk.abi.managed_decimal_value",
+    "MultiValue": "multiversx_sdk.abi.multi_value",
+    "OptionValue": "multiversx_sdk.abi.option_value",
+    "OptionalValue": "multiversx_sdk.abi.optional_value",
+    "Serializer": "multiversx_sdk.abi.serializer",
+    "I8Value": "multiversx_sdk.abi.small_int_values",
+    "I16Value": "multiversx_sdk.abi.small_int_values",
+    "I32Value": "multiversx_sdk.abi.small_int_values",
+    "I64Value": "multiversx_sdk.abi.small_int_values",
+    "U8Value": "multiversx_sdk.abi.small_int_values",
+    "U16Value": "multiversx_sdk.abi.small_int_values",
+    "U32Value": "multiversx_sdk.abi.small_int_values",
+    "U64Value": "multiversx_sdk.abi.small_int_values",
+    "StringValue": "multiversx_sdk.abi.string_value",
+    "StructValue": "multiversx_sdk.abi.struct_value",
+    "TokenIdentifierValue": "multiversx_sdk.abi.token_identifier_value",
+    "TupleValue": "multiversx_sdk.abi.tuple_value",
+    "VariadicValues": "multiversx_sdk.abi.variadic_values",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "Abi",
+    "AbiCodeGenerator",
     "AbiDefinition",
     "AddressValue",
     "ArrayValue",
@@ -1,7 +1,11 @@
-from copy import deepcopy
+import hashlib
+import json
+import logging
+import os
+import tempfile
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, cast
+from typing import Any, Optional, Sequence
 
 from multiversx_sdk.abi.abi_definition import (
     AbiDefinition,
@@ -19,11 +23,17 @@ from multiversx_sdk.abi.biguint_value import BigUIntValue
 from multiversx_sdk.abi.bool_value import BoolValue
 from multiversx_sdk.abi.bytes_value import BytesValue
 from multiversx_sdk.abi.code_metadata_value import CodeMetadataValue
+from multiversx_sdk.abi.compiled_codecs import (
+    CodecsCompiler,
+    EndpointCodec,
+    EventCodec,
+    PayloadClasses,
+    TypeCodec,
+)
 from multiversx_sdk.abi.counted_variadic_values import CountedVariadicValues
 from multiversx_sdk.abi.enum_value import EnumValue
 from multiversx_sdk.abi.explicit_enum_value import ExplicitEnumValue
 from multiversx_sdk.abi.fields import Field
-from multiversx_sdk.abi.interface import IPayloadHolder, ISingleValue
 from multiversx_sdk.abi.list_value import ListValue
 from multiversx_sdk.abi.managed_decimal_signed_value import ManagedDecimalSignedValue
 from multiversx_sdk.abi.managed_decimal_value import ManagedDecimalValue
@@ -49,47 +59,131 @@ from multiversx_sdk.abi.type_formula import TypeFormula
 from multiversx_sdk.abi.type_formula_parser import TypeFormulaParser
 from multiversx_sdk.abi.variadic_values import VariadicValues
 
+# Bumped when the content of the ABI cache files changes its shape (see `Abi.load()`).
+ABI_CACHE_VERSION = 1
+
+# The types handled by `Abi._create_prototype()`, other than the custom types (and the arrays, e.g. "array32").
+BUILTIN_TYPE_NAMES = frozenset(
+    [
+        "bool",
+        "u8",
+        "u16",
+        "u32",
+        "u64",
+        "i8",
+        "i16",
+        "i32",
+        "i64",
+        "BigUint",
+        "BigInt",
+        "bytes",
+        "utf-8 string",
+        "Address",
+        "TokenIdentifier",
+        "TokenId",
+        "EgldOrEsdtTokenIdentifier",
+        "EsdtTokenIdentifier",
+        "CodeMetadata",
+        "tuple",
+        "Option",
+        "List",
+        "optional",
+        "variadic",
+        "counted-variadic",
+        "multi",
+        "ManagedDecimal",
+        "ManagedDecimalSigned",
+    ]
+)
+
+
+logger = logging.getLogger("abi")
+
 
 class Abi:
     def __init__(self, definition: AbiDefinition) -> None:
-        self._type_formula_parser = TypeFormulaParser()
+        # The types are validated when first parsed (on first use of an endpoint, event or custom type).
+        self._type_formula_parser = TypeFormulaParser(self._validate_type_formula)
         self._serializer = Serializer()
 
         self.definition = definition
-        self.custom_types_prototypes_by_name: dict[str, Any] = {}
-        self.endpoints_prototypes_by_name: dict[str, EndpointPrototype] = {}
-        self.events_prototypes_by_name: dict[str, EventPrototype] = {}
 
-        for name in definition.types.enums:
-            self.custom_types_prototypes_by_name[name] = self._create_custom_type_prototype(name)
+        # The names and the (parsed) types of the fields of the custom types, computed once per type
+        # (for enums, by discriminant), since prototypes are created for each decoded value.
+        self._struct_fields_formulas_by_name: dict[str, list[tuple[str, TypeFormula]]] = {}
+        self._enum_fields_formulas_by_name: dict[str, dict[int, list[tuple[str, TypeFormula]]]] = {}
 
-        for struct_type in definition.types.structs:
-            self.custom_types_prototypes_by_name[struct_type] = self._create_custom_type_prototype(struct_type)
+        # The prototypes (value objects) are kept as the reference; encoding and decoding use the compiled codecs.
+        # The dictionaries of prototypes are filled on first access, the codecs are compiled on first use (by name),
+        # since most applications only use a few endpoints of an ABI.
+        self._custom_types_prototypes_by_name: Optional[dict[str, Any]] = None
+        self._endpoints_prototypes_by_name: Optional[dict[str, EndpointPrototype]] = None
+        self._events_prototypes_by_name: Optional[dict[str, EventPrototype]] = None
 
-        self.constructor_prototype = EndpointPrototype(
-            input_parameters=self._create_endpoint_input_prototypes(definition.constructor),
-            output_parameters=self._create_endpoint_output_prototypes(definition.constructor),
-        )
+        self._codecs_compiler = CodecsCompiler(definition, self._type_formula_parser, self._create_prototype)
+        self._endpoints_codecs_by_name: dict[str, EndpointCodec] = {}
+        self._events_codecs_by_name: dict[str, EventCodec] = {}
 
-        self.upgrade_constructor_prototype = EndpointPrototype(
-            input_parameters=self._create_endpoint_input_prototypes(definition.upgrade_constructor),
-            output_parameters=self._create_endpoint_output_prototypes(definition.upgrade_constructor),
-        )
+        self._constructor_prototype: Optional[EndpointPrototype] = None
+        self._upgrade_constructor_prototype: Optional[EndpointPrototype] = None
+        self._constructor_codec: Optional[EndpointCodec] = None
+        self._upgrade_constructor_codec: Optional[EndpointCodec] = None
+
+        # Codecs that decode collections of fixed-size items as NumPy arrays (compiled on demand).
+        self._numpy_codecs_compiler: Optional[CodecsCompiler] = None
+        self._numpy_endpoints_codecs_by_name: dict[str, EndpointCodec] = {}
+
+    @property
+    def custom_types_prototypes_by_name(self) -> dict[str, Any]:
+        if self._custom_types_prototypes_by_name is None:
+            names = list(self.definition.types.enums) + list(self.definition.types.structs)
+            self._custom_types_prototypes_by_name = {name: self._create_custom_type_prototype(name) for name in names}
+
+        return self._custom_types_prototypes_by_name
 
-        for endpoint in definition.endpoints:
-            input_prototype = self._create_endpoint_input_prototypes(endpoint)
-            output_prototype = self._create_endpoint_output_prototypes(endpoint)
+    @custom_types_prototypes_by_name.setter
+    def custom_types_prototypes_by_name(self, value: dict[str, Any]) -> None:
+        self._custom_types_prototypes_by_name = value
 
-            endpoint_prototype = EndpointPrototype(input_parameters=input_prototype, output_parameters=output_prototype)
+    @property
+    def endpoints_prototypes_by_name(self) -> dict[str, "EndpointPrototype"]:
+        if self._endpoints_prototypes_by_name is None:
+            self._endpoints_prototypes_by_name = {
+                endpoint.name: self._create_endpoint_prototype(endpoint) for endpoint in self.definition.endpoints
+            }
 
-            self.endpoints_prototypes_by_name[endpoint.name] = endpoint_prototype
+        return self._endpoints_prototypes_by_name
 
-        for event in definition.events:
-            prototype = self._create_event_input_prototypes(event)
+    @endpoints_prototypes_by_name.setter
+    def endpoints_prototypes_by_name(self, value: dict[str, "EndpointPrototype"]) -> None:
+        self._endpoints_prototypes_by_name = value
 
-            event_prototype = EventPrototype(fields=prototype)
+    @property
+    def events_prototypes_by_name(self) -> dict[str, "EventPrototype"]:
+        if self._events_prototypes_by_name is None:
+            self._events_prototypes_by_name = {
+                event.identifier: self._create_event_prototype(event) for event in self.definition.events
+            }
 
-            self.events_prototypes_by_name[event.identifier] = event_prototype
+        return self._events_prototypes_by_name
+
+    @events_prototypes_by_name.setter
+    def events_prototypes_by_name(self, value: dict[str, "EventPrototype"]) -> None:
+        self._events_prototypes_by_name = value
+
+    @property
+    def constructor_prototype(self) -> "EndpointPrototype":
+        if self._constructor_prototype is None:
+            self._constructor_prototype = self._create_endpoint_prototype(self.definition.constructor)
+
+        return self._constructor_prototype
+
+    @property
+    def upgrade_constructor_prototype(self) -> "EndpointPrototype":
+        if self._upgrade_constructor_prototype is None:
+            self._upgrade_constructor_prototype = self._create_endpoint_prototype(self.definition.upgrade_constructor)
+
+        return self._upgrade_constructor_prototype
 
     def _create_custom_type_prototype(self, name: str) -> Any:
         if name in self.definition.types.enums:
@@ -114,34 +208,54 @@ class Abi:
         return ExplicitEnumValue()
 
     def _provide_fields_for_enum_prototype(self, discriminant: int, enum_definition: EnumDefinition) -> list[Field]:
-        for variant in enum_definition.variants:
-            if variant.discriminant != discriminant:
-                continue
+        fields_formulas = self._get_enum_fields_formulas(enum_definition).get(discriminant)
 
-            fields_prototypes: list[Field] = []
+        if fields_formulas is None:
+            raise ValueError(
+                f"cannot provide fields from enum {enum_definition.name}: variant with discriminant {discriminant} not found"
+            )
 
-            for field_definition in variant.fields:
-                type_formula = self._type_formula_parser.parse_expression(field_definition.type)
-                field_value_prototype = self._create_prototype(type_formula)
-                field_prototype = Field(name=field_definition.name, value=field_value_prototype)
-                fields_prototypes.append(field_prototype)
+        return [Field(name=name, value=self._create_prototype(type_formula)) for name, type_formula in fields_formulas]
 
-            return fields_prototypes
+    def _get_enum_fields_formulas(self, enum_definition: EnumDefinition) -> dict[int, list[tuple[str, TypeFormula]]]:
+        fields_formulas_by_discriminant = self._enum_fields_formulas_by_name.get(enum_definition.name)
 
-        raise ValueError(
-            f"cannot provide fields from enum {enum_definition.name}: variant with discriminant {discriminant} not found"
-        )
+        if fields_formulas_by_discriminant is None:
+            fields_formulas_by_discriminant = {}
+
+            for variant in enum_definition.variants:
+                # If discriminants repeat, the first variant is used.
+                fields_formulas_by_discriminant.setdefault(
+                    variant.discriminant,
+                    [(field.name, self._type_formula_parser.parse_expression(field.type)) for field in variant.fields],
+                )
+
+            self._enum_fields_formulas_by_name[enum_definition.name] = fields_formulas_by_discriminant
+
+        return fields_formulas_by_discriminant
 
     def _create_struct_prototype(self, struct_definition: StructDefinition) -> Any:
-        fields_prototypes: list[Field] = []
+        fields_formulas = self._struct_fields_formulas_by_name.get(struct_definition.name)
+
+        if fields_formulas is None:
+            fields_formulas = [
+                (field.name, self._type_formula_parser.parse_expression(field.type))
+                for field in struct_definition.fields
+            ]
+            self._struct_fields_formulas_by_name[struct_definition.name] = fields_formulas
 
-        for field_definition in struct_definition.fields:
-            type_formula = self._type_formula_parser.parse_expression(field_definition.type)
-            field_value_prototype = self._create_prototype(type_formula)
-            field_prototype = Field(name=field_definition.name, value=field_value_prototype)
-            fields_prototypes.append(field_prototype)
+        return StructValue(
+            [Field(name=name, value=self._create_prototype(type_formula)) for name, type_formula in fields_formulas]
+        )
+
+    def _create_endpoint_prototype(self, endpoint: EndpointDefinition) -> "EndpointPrototype":
+        return EndpointPrototype(
+            input_parameters=self._create_endpoint_input_prototypes(endpoint),
+            output_parameters=self._create_endpoint_output_prototypes(endpoint),
+        )
 
-        return StructValue(fields_prototypes)
+    def _create_event_prototype(self, event: EventDefinition) -> "EventPrototype":
+        return EventPrototype(fields=self._create_event_input_prototypes(event))
 
     def _create_endpoint_input_prototypes(self, endpoint: EndpointDefinition) -> list[Any]:
         prototypes: list[Any] = []
@@ -170,6 +284,13 @@ class Abi:
 
         return prototypes
 
+    def _compile_endpoint_codec(self, name: str, endpoint: EndpointDefinition) -> EndpointCodec:
+        return self._codecs_compiler.compile_endpoint(
+            name=name,
+            inputs=[parameter.type for parameter in endpoint.inputs],
+            outputs=[parameter.type for parameter in endpoint.outputs],
+        )
+
     def _create_parameter_prototype(self, parameter: ParameterDefinition) -> Any:
         type_formula = self._type_formula_parser.parse_expression(parameter.type)
         return self._create_prototype(type_formula)
@@ -179,111 +300,190 @@ class Abi:
         return self._create_prototype(type_formula)
 
     def encode_constructor_input_parameters(self, values: list[Any]) -> list[bytes]:
-        return self._do_encode_endpoint_input_parameters("constructor", self.constructor_prototype, values)
+        if self._constructor_codec is None:
+            self._constructor_codec = self._compile_endpoint_codec("constructor", self.definition.constructor)
+
+        return self._constructor_codec.encode_inputs(values)
 
     def encode_upgrade_constructor_input_parameters(self, values: list[Any]) -> list[bytes]:
-        return self._do_encode_endpoint_input_parameters("upgrade", self.upgrade_constructor_prototype, values)
+        if self._upgrade_constructor_codec is None:
+            self._upgrade_constructor_codec = self._compile_endpoint_codec(
+                "upgrade", self.definition.upgrade_constructor
+            )
+
+        return self._upgrade_constructor_codec.encode_inputs(values)
 
     def encode_endpoint_input_parameters(self, endpoint_name: str, values: list[Any]) -> list[bytes]:
-        endpoint_prototype = self._get_endpoint_prototype(endpoint_name)
-        return self._do_encode_endpoint_input_parameters(endpoint_name, endpoint_prototype, values)
-
-    def _do_encode_endpoint_input_parameters(
-        self,
-        endpoint_name: str,
-        endpoint_prototype: "EndpointPrototype",
-        values: list[Any],
-    ):
-        if len(values) != len(endpoint_prototype.input_parameters):
-            raise ValueError(
-                f"for {endpoint_name}, invalid value length: expected {len(endpoint_prototype.input_parameters)}, got {len(values)}"
-            )
+        endpoint_codec = self._get_endpoint_codec(endpoint_name)
+        return endpoint_codec.encode_inputs(values)
+
+    def decode_endpoint_output_parameters(
+        self, endpoint_name: str, encoded_values: list[bytes], numpy_arrays: bool = False
+    ) -> list[Any]:
+        """
+        Decodes the output parameters (e.g. the return data of a view function) of an endpoint.
+
+        Args:
+            endpoint_name (str): the name of the endpoint
+            encoded_values (list[bytes]): the encoded output parameters
+            numpy_arrays (bool): if set, collections of fixed-size items (e.g. `List<u64>`, `variadic<Address>`) are decoded as NumPy arrays (requires `numpy`)
+        """
+        if numpy_arrays:
+            endpoint_codec = self._get_numpy_endpoint_codec(endpoint_name)
+        else:
+            endpoint_codec = self._get_endpoint_codec(endpoint_name)
+
+        return endpoint_codec.decode_outputs(encoded_values)
+
+    def decode_endpoint_outputs_columnar(
+        self, endpoint_name: str, many_encoded_values: Sequence[Sequence[bytes]], numpy_arrays: bool = False
+    ) -> dict[str, Any]:
+        """
+        Decodes the output parameters of many calls of the same endpoint (e.g. the return data of many queries), in one pass.
+        The values are returned as columns: for each output parameter (by name, or by position, if the name is missing),
+        the values of all calls, in the original order.
+
+        Args:
+            endpoint_name (str): the name of the endpoint
+            many_encoded_values: the encoded output parameters, for each call
+            numpy_arrays (bool): if set, the columns of fixed-size integers (e.g. u32, i64) are returned as NumPy arrays (requires `numpy`)
+        """
+        endpoint_codec = self._get_endpoint_codec(endpoint_name)
+        columns = endpoint_codec.decode_outputs_columnar(many_encoded_values, numpy_arrays)
+        return dict(zip(self._get_endpoint_outputs_names(endpoint_name), columns))
 
-        input_values = deepcopy(endpoint_prototype.input_parameters)
-        input_values_as_native_object_holders = cast(list[IPayloadHolder], input_values)
+    def decode_event(self, event_name: str, topics: list[bytes], additional_data: list[bytes]) -> SimpleNamespace:
+        event_codec = self._get_event_codec(event_name)
+        return event_codec.decode(topics, additional_data)
+
+    def decode_events(
+        self, event_name: str, events: Sequence[tuple[Sequence[bytes], Sequence[bytes]]]
+    ) -> list[SimpleNamespace]:
+        """
+        Decodes many events of the same kind, in one pass.
+
+        Args:
+            event_name (str): the identifier of the event, as found in the ABI
+            events: the topics (without the identifier) and the additional data of each event
+        """
+        event_codec = self._get_event_codec(event_name)
+        decode = event_codec.decode
+        return [decode(topics, additional_data) for topics, additional_data in events]
+
+    def decode_events_columnar(
+        self, event_name: str, events: Sequence[tuple[Sequence[bytes], Sequence[bytes]]], numpy_arrays: bool = False
+    ) -> dict[str, Any]:
+        """
+        Same as `decode_events()`, but the values are returned as columns: for each field of the event,
+        the values of all events, in the original order.
+
+        Args:
+            event_name (str): the identifier of the event, as found in the ABI
+            events: the topics (without the identifier) and the additional data of each event
+            numpy_arrays (bool): if set, the columns of fixed-size integers (e.g. u32, i64) are returned as NumPy arrays (requires `numpy`)
+        """
+        event_codec = self._get_event_codec(event_name)
+        return event_codec.decode_columnar(events, numpy_arrays)
 
-        # Populate the input values with the provided arguments
-        for i, arg in enumerate(values):
-            input_values_as_native_object_holders[i].set_payload(arg)
+    def encode_custom_type(self, name: str, values: list[Any]):
+        custom_type = self._get_custom_type_codec(name)
+        buffer = bytearray()
+        custom_type.encode_top_level(values, buffer)
+        return buffer.hex()
 
-        input_values_encoded = self._serializer.serialize_to_parts(input_values)
-        return input_values_encoded
+    def decode_custom_type(self, name: str, data: bytes) -> Any:
+        custom_type = self._get_custom_type_codec(name)
+        return custom_type.decode_top_level(data)
 
-    def decode_endpoint_output_parameters(self, endpoint_name: str, encoded_values: list[bytes]) -> list[Any]:
-        endpoint_prototype = self._get_endpoint_prototype(endpoint_name)
-        output_values = deepcopy(endpoint_prototype.output_parameters)
-        self._serializer.deserialize_parts(encoded_values, output_values)
+    def _get_custom_type_codec(self, name: str) -> TypeCodec:
+        # Explicit enums are not handled (as custom types) by "encode_custom_type()" and "decode_custom_type()".
+        if name not in self.definition.types.enums and name not in self.definition.types.structs:
+            raise Exception(f'Missing custom type! No custom type found for name: "{name}"')
 
-        output_values_as_native_object_holders = cast(list[IPayloadHolder], output_values)
-        output_native_values = [value.get_payload() for value in output_values_as_native_object_holders]
-        return output_native_values
+        return self._codecs_compiler.compile_custom_type(name)
 
-    def decode_event(self, event_name: str, topics: list[bytes], additional_data: list[bytes]) -> SimpleNamespace:
-        result = SimpleNamespace()
-        event_definition = self.definition.get_event_definition(event_name)
-        event_prototype = self._get_event_prototype(event_name)
+    def _get_endpoint_prototype(self, endpoint_name: str) -> "EndpointPrototype":
+        endpoint_prototype = self.endpoints_prototypes_by_name.get(endpoint_name)
 
-        indexed_inputs = [input for input in event_definition.inputs if input.indexed]
-        indexed_inputs_names = [item.name for item in indexed_inputs]
+        if not endpoint_prototype:
+            raise ValueError(f"endpoint '{endpoint_name}' not found")
 
-        fields = deepcopy(event_prototype.fields)
+        return endpoint_prototype
 
-        output_values = [field.value for field in fields if field.name in indexed_inputs_names]
-        self._serializer.deserialize_parts(topics, output_values)
+    def _get_endpoint_codec(self, endpoint_name: str) -> EndpointCodec:
+        endpoint_codec = self._endpoints_codecs_by_name.get(endpoint_name)
 
-        output_values_as_native_object_holders = cast(list[IPayloadHolder], output_values)
-        output_native_values = [value.get_payload() for value in output_values_as_native_object_holders]
+        if endpoint_codec:
+            return endpoint_codec
 
-        for i in range(len(indexed_inputs)):
-            setattr(result, indexed_inputs[i].name, output_native_values[i])
+        endpoint = next((item for item in self.definition.endpoints if item.name == endpoint_name), None)
 
-        non_indexed_inputs = [input for input in event_definition.inputs if not input.indexed]
-        non_indexed_inputs_names = [item.name for item in non_indexed_inputs]
+        if not endpoint:
+            raise ValueError(f"endpoint '{endpoint_name}' not found")
 
-        output_values = [field.value for field in fields if field.name in non_indexed_inputs_names]
-        self._serializer.deserialize_parts(additional_data, output_values)
+        endpoint_codec = self._compile_endpoint_codec(endpoint_name, endpoint)
+        self._endpoints_codecs_by_name[endpoint_name] = endpoint_codec
+        return endpoint_codec
 
-        output_values_as_native_object_holders = cast(list[IPayloadHolder], output_values)
-        output_native_values = [value.get_payload() for value in output_values_as_native_object_holders]
+    def _get_endpoint_outputs_names(self, endpoint_name: str) -> list[str]:
+        endpoint = next(item for item in self.definition.endpoints if item.name == endpoint_name)
+        names = [parameter.name or str(i) for i, parameter in enumerate(endpoint.outputs)]
 
-        for i in range(len(non_indexed_inputs)):
-            setattr(result, non_indexed_inputs[i].name, output_native_values[i])
+        # Outputs are rarely named. Also, names could repeat: in such cases, the positions are used instead.
+        if len(set(names)) != len(names):
+            return [str(i) for i in range(len(names))]
 
-        return result
+        return names
 
-    def encode_custom_type(self, name: str, values: list[Any]):
-        try:
-            custom_type: IPayloadHolder = self.custom_types_prototypes_by_name[name]
-        except KeyError:
-            raise Exception(f'Missing custom type! No custom type found for name: "{name}"')
+    def _get_numpy_endpoint_codec(self, endpoint_name: str) -> EndpointCodec:
+        endpoint_codec = self._numpy_endpoints_codecs_by_name.get(endpoint_name)
 
-        custom_type.set_payload(values)
-        return self._serializer.serialize([custom_type])
+        if endpoint_codec:
+            return endpoint_codec
 
-    def decode_custom_type(self, name: str, data: bytes) -> Any:
-        try:
-            custom_type: ISingleValue = self.custom_types_prototypes_by_name[name]
-        except KeyError:
-            raise Exception(f'Missing custom type! No custom type found for name: "{name}"')
+        endpoint = next((item for item in self.definition.endpoints if item.name == endpoint_name), None)
 
-        custom_type.decode_top_level(data)
-        return custom_type.get_payload()
+        if not endpoint:
+            raise ValueError(f"endpoint '{endpoint_name}' not found")
 
-    def _get_custom_type_prototype(self, type_name: str) -> Any:
-        type_prototype = self.custom_types_prototypes_by_name.get(type_name)
+        if not self._numpy_codecs_compiler:
+            self._numpy_codecs_compiler = self._create_codecs_compiler(numpy_arrays=True)
 
-        if not type_prototype:
-            return self._create_custom_type_prototype(type_name)
+        endpoint_codec = self._numpy_codecs_compiler.compile_endpoint(
+            name=endpoint.name,
+            inputs=[parameter.type for parameter in endpoint.inputs],
+            outputs=[parameter.type for parameter in endpoint.outputs],
+        )
 
-        return type_prototype
+        self._numpy_endpoints_codecs_by_name[endpoint_name] = endpoint_codec
+        return endpoint_codec
+
+    def _create_codecs_compiler(
+        self, numpy_arrays: bool = False, payload_classes: Optional[PayloadClasses] = None
+    ) -> CodecsCompiler:
+        """
+        Creates a separate compiler (with its own custom types codecs), for the codecs with non-default options.
+        """
+        return CodecsCompiler(
+            self.definition,
+            self._type_formula_parser,
+            self._create_prototype,
+            numpy_arrays=numpy_arrays,
+            payload_classes=payload_classes,
+        )
 
-    def _get_endpoint_prototype(self, endpoint_name: str) -> "EndpointPrototype":
-        endpoint_prototype = self.endpoints_prototypes_by_name.get(endpoint_name)
+    def _get_event_codec(self, event_name: str) -> EventCodec:
+        event_codec = self._events_codecs_by_name.get(event_name)
 
-        if not endpoint_prototype:
-            raise ValueError(f"endpoint '{endpoint_name}' not found")
+        if event_codec:
+            return event_codec
 
-        return endpoint_prototype
+        # Raises the appropriate error (event not found, or more than one event found).
+        event = self.definition.get_event_definition(event_name)
+
+        event_codec = self._codecs_compiler.compile_event(event)
+        self._events_codecs_by_name[event_name] = event_codec
+        return event_codec
 
     def _get_event_prototype(self, event_name: str) -> "EventPrototype":
         event_prototype = self.events_prototypes_by_name.get(event_name)
@@ -380,14 +580,136 @@ class Abi:
             else:
                 return ManagedDecimalSignedValue(scale=int(scale), is_variable=False)
 
-        # Handle custom types
-        type_prototype = self._get_custom_type_prototype(name)
-        return deepcopy(type_prototype)
+        # Handle custom types (created from the formulas of their fields, which is cheaper than copying a prototype)
+        return self._create_custom_type_prototype(name)
 
     @classmethod
-    def load(cls, path: Path) -> "Abi":
-        definition = AbiDefinition.load(path)
-        return cls(definition)
+    def load(cls, path: Path, cache_dir: Optional[Path] = None) -> "Abi":
+        """
+        Loads an ABI file.
+
+        Args:
+            path (Path): the path of the ABI file
+            cache_dir (Optional[Path]): if set, the parsed type formulas of the ABI are cached (as JSON) in this directory,
+                keyed by the hash of the content of the file. Subsequent loads (e.g. when workers start) read the cache instead of parsing the types again.
+        """
+        if cache_dir is None:
+            definition = AbiDefinition.load(path)
+            return cls(definition)
+
+        content = Path(path).read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        cache_path = Path(cache_dir) / f"{content_hash}.v{ABI_CACHE_VERSION}.json"
+
+        abi = cls(AbiDefinition.from_dict(json.loads(content)))
+        type_formulas_by_expression = _read_abi_cache(cache_path, content_hash, abi._type_formula_parser)
+
+        if type_formulas_by_expression is None:
+            # The ABI itself parses the types on first use (as when loaded without a cache).
+            _write_abi_cache(cache_path, content_hash, abi._parse_type_expressions())
+        else:
+            # Validated on first use, as the formulas parsed by the ABI itself.
+            abi._type_formula_parser.add_preparsed_formulas(type_formulas_by_expression)
+
+        return abi
+
+    def _parse_type_expressions(self) -> dict[str, TypeFormula]:
+        """Parses (without validating) all the type expressions of the ABI."""
+        definition = self.definition
+        endpoints = [definition.constructor, definition.upgrade_constructor] + definition.endpoints
+
+        expressions = [parameter.type for endpoint in endpoints for parameter in endpoint.inputs + endpoint.outputs]
+        expressions += [item.type for event in definition.events for item in event.inputs]
+        expressions += [field.type for struct in definition.types.structs.values() for field in struct.fields]
+        expressions += [
+            field.type
+            for enum in definition.types.enums.values()
+            for variant in enum.variants
+            for field in variant.fields
+        ]
+
+        parser = TypeFormulaParser()
+        return {expression: parser.parse_expression(expression) for expression in expressions}
+
+    def _validate_type_formula(self, type_formula: TypeFormula, expression: str) -> None:
+        name = type_formula.name
+
+        if name in ["ManagedDecimal", "ManagedDecimalSigned"]:
+            # The type parameter is the scale (e.g. "18", or "usize"), not a type.
+            return
+
+        is_array = name.startswith("array") and name[5:].isdigit()
+        is_custom_type = (
+            name in self.definition.types.enums
+            or name in self.definition.types.explicit_enums
+            or name in self.definition.types.structs
+        )
+
+        if name not in BUILTIN_TYPE_NAMES and not is_array and not is_custom_type:
+            raise ValueError(f"unknown type {name} (in type expression {expression})")
+
+        for type_parameter in type_formula.type_parameters:
+            self._validate_type_formula(type_parameter, expression)
+
+
+def _read_abi_cache(
+    path: Path, content_hash: str, type_formula_parser: TypeFormulaParser
+) -> Optional[dict[str, TypeFormula]]:
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text())
+
+        if data["version"] != ABI_CACHE_VERSION or data["contentHash"] != content_hash:
+            raise ValueError("unexpected version or content hash")
+        if not isinstance(data["typeFormulas"], dict):
+            raise ValueError("unexpected type formulas")
+
+        return {
+            expression: _type_formula_from_json(item, type_formula_parser)
+            for expression, item in data["typeFormulas"].items()
+        }
+    except Exception as error:
+        # E.g. a corrupted (or truncated) file: it's replaced.
+        logger.warning(f"cannot read ABI cache {path}: {error}")
+        return None
+
+
+def _write_abi_cache(path: Path, content_hash: str, type_formulas_by_expression: dict[str, TypeFormula]) -> None:
+    data = {
+        "version": ABI_CACHE_VERSION,
+        "contentHash": content_hash,
+        "typeFormulas": {
+            expression: _type_formula_to_json(type_formula)
+            for expression, type_formula in type_formulas_by_expression.items()
+        },
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file, then moved (atomically), so that concurrent readers never see partial content.
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as file:
+            json.dump(data, file)
+
+        os.replace(file.name, path)
+    except OSError as error:
+        logger.warning(f"cannot write ABI cache {path}: {error}")
+
+
+def _type_formula_to_json(type_formula: TypeFormula) -> list[Any]:
+    return [type_formula.name, [_type_formula_to_json(item) for item in type_formula.type_parameters]]
+
+
+def _type_formula_from_json(data: Any, type_formula_parser: TypeFormulaParser) -> TypeFormula:
+    if not isinstance(data, list) or len(data) != 2 or not isinstance(data[0], str) or not isinstance(data[1], list):
+        raise ValueError(f"unexpected type formula: {data}")
+
+    name, type_parameters = data
+    return type_formula_parser.intern_type_formula(
+        name, [_type_formula_from_json(item, type_formula_parser) for item in type_parameters]
+    )
 
 
 class EndpointPrototype:
@@ -1,3 +1,4 @@
+import json
 import re
 from decimal import Decimal
 from pathlib import Path
@@ -23,6 +24,7 @@ from multiversx_sdk.abi.small_int_values import U32Value, U64Value
 from multiversx_sdk.abi.string_value import StringValue
 from multiversx_sdk.abi.struct_value import StructValue
 from multiversx_sdk.abi.token_identifier_value import TokenIdentifierValue
+from multiversx_sdk.abi.type_formula_parser import TypeFormulaParser
 from multiversx_sdk.abi.variadic_values import VariadicValues
 from multiversx_sdk.core.address import Address
 
@@ -527,3 +529,125 @@ def test_map_token_identifier():
     assert abi.endpoints_prototypes_by_name["foo"].input_parameters[0] == TokenIdentifierValue()
     assert abi.endpoints_prototypes_by_name["foobar"].input_parameters[0] == TokenIdentifierValue()
     assert abi.endpoints_prototypes_by_name["esdt"].input_parameters[0] == TokenIdentifierValue()
+
+
+def test_prototypes_and_codecs_are_created_lazily():
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+
+    assert "getPendingActionFullInfo" in abi.endpoints_prototypes_by_name
+    assert len(abi.endpoints_prototypes_by_name) == len(abi.definition.endpoints)
+    assert sorted(abi.custom_types_prototypes_by_name) == sorted(
+        list(abi.definition.types.enums) + list(abi.definition.types.structs)
+    )
+    assert abi._codecs_compiler.custom_types_codecs_by_name == {}
+
+    abi.decode_endpoint_output_parameters("getQuorum", [bytes([0x02])])
+    assert abi._codecs_compiler.custom_types_codecs_by_name == {}
+
+    prototype = abi.endpoints_prototypes_by_name["getPendingActionFullInfo"]
+    assert prototype is abi.endpoints_prototypes_by_name["getPendingActionFullInfo"]
+
+    with pytest.raises(ValueError, match="endpoint 'missing' not found"):
+        abi.encode_endpoint_input_parameters("missing", [])
+
+
+def test_types_are_validated_on_first_use():
+    definition = AbiDefinition.from_dict(
+        {
+            "endpoints": [
+                {"name": "foo", "inputs": [{"type": "List<Bar>"}], "outputs": []},
+                {"name": "bar", "inputs": [{"type": "List<u8"}], "outputs": []},
+                {"name": "baz", "inputs": [{"type": "u32"}], "outputs": []},
+            ],
+            "types": {
+                "Bar": {
+                    "type": "struct",
+                    "fields": [{"name": "baz", "type": "Option<Baz>"}],
+                }
+            },
+        }
+    )
+
+    # The types are not parsed by the constructor.
+    abi = Abi(definition)
+    assert abi._type_formula_parser.type_formulas_by_expression == {}
+    assert abi.encode_endpoint_input_parameters("baz", [7]) == [bytes([7])]
+
+    with pytest.raises(ValueError, match="unknown type Baz \\(in type expression Option<Baz>\\)"):
+        abi.encode_endpoint_input_parameters("foo", [[]])
+
+    with pytest.raises(ValueError):
+        Abi(definition).endpoints_prototypes_by_name
+
+    with pytest.raises(ValueError):
+        abi.encode_endpoint_input_parameters("bar", [[]])
+
+
+def test_prototypes_are_mutable_dictionaries():
+    abi = Abi.load(testdata / "adder.abi.json")
+    prototype = abi.endpoints_prototypes_by_name["add"]
+
+    abi.endpoints_prototypes_by_name["other"] = prototype
+    assert abi.endpoints_prototypes_by_name == {
+        "getSum": abi.endpoints_prototypes_by_name["getSum"],
+        "add": prototype,
+        "other": prototype,
+    }
+
+    abi.endpoints_prototypes_by_name = {}
+    assert abi.endpoints_prototypes_by_name == {}
+
+
+def test_load_with_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = testdata / "multisig-full.abi.json"
+
+    first = Abi.load(path, cache_dir=tmp_path)
+    endpoints_names = first.endpoints_prototypes_by_name.keys()
+    [cache_file] = list(tmp_path.iterdir())
+    assert cache_file.suffix == ".json"
+
+    # The second load reads the parsed type formulas from the cache (as data).
+    def parse_expression(self: TypeFormulaParser, expression: str):
+        raise AssertionError(f"unexpected parsing of {expression}")
+
+    with monkeypatch.context() as context:
+        context.setattr(TypeFormulaParser, "_parse_expression", parse_expression)
+        second = Abi.load(path, cache_dir=tmp_path)
+        assert second.decode_endpoint_output_parameters("getQuorum", [bytes([0x02])]) == [2]
+        assert second.endpoints_prototypes_by_name.keys() == endpoints_names
+
+    # A corrupted (or tampered) cache is replaced.
+    for content in ["corrupted", '{"version": 1, "contentHash": "other", "typeFormulas": {}}']:
+        cache_file.write_text(content)
+        third = Abi.load(path, cache_dir=tmp_path)
+        assert third.decode_endpoint_output_parameters("getQuorum", [bytes([0x02])]) == [2]
+        assert cache_file.read_text() != content
+
+    # The types read from the cache are validated on first use, as well.
+    cache = json.loads(cache_file.read_text())
+    cache["typeFormulas"]["variadic<ActionFullInfo>"] = ["variadic", [["Missing", []]]]
+    cache_file.write_text(json.dumps(cache))
+
+    fourth = Abi.load(path, cache_dir=tmp_path)
+    with pytest.raises(ValueError, match="unknown type Missing"):
+        fourth.decode_endpoint_output_parameters("getPendingActionFullInfo", [])
+
+
+def test_enum_fields_are_provided_from_parsed_formulas(monkeypatch: pytest.MonkeyPatch):
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+    prototype = abi.custom_types_prototypes_by_name["Action"]
+    first = prototype.fields_provider(5)
+
+    # The types of the fields are parsed once (per enum), not each time an enum value is decoded.
+    def parse_expression(expression: str):
+        raise AssertionError(f"unexpected parsing of {expression}")
+
+    monkeypatch.setattr(abi._type_formula_parser, "parse_expression", parse_expression)
+    second = abi._create_custom_type_prototype("Action").fields_provider(5)
+
+    # The field prototypes are fresh objects, though (since they are filled in by decoding).
+    assert [field.name for field in second] == [field.name for field in first] == ["0"]
+    assert second[0] is not first[0] and second[0].value is not first[0].value
+
+    with pytest.raises(ValueError, match="variant with discriminant 42 not found"):
+        prototype.fields_provider(42)
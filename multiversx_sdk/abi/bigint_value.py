@@ -1,7 +1,12 @@
 import io
 from typing import Any
 
-from multiversx_sdk.abi.shared import decode_length, encode_length, read_bytes_exactly
+from multiversx_sdk.abi.shared import (
+    decode_length,
+    encode_length,
+    read_bytes_exactly,
+    signed_integer_to_bytes,
+)
 
 
 class BigIntValue:
@@ -26,14 +31,7 @@ class BigIntValue:
         self.value = self._signed_from_bytes(data)
 
     def _signed_to_bytes(self) -> bytes:
-        value = self.value
-
-        if value == 0:
-            return b""
-
-        length = ((value + (value < 0)).bit_length() + 7 + 1) // 8
-        data = value.to_bytes(length, byteorder="big", signed=True)
-        return data
+        return signed_integer_to_bytes(self.value)
 
     def _signed_from_bytes(self, data: bytes) -> int:
         return int.from_bytes(data, byteorder="big", signed=True)
@@ -1,8 +1,12 @@
 import io
 from typing import Any
 
-from multiversx_sdk.abi.shared import decode_length, encode_length, read_bytes_exactly
-from multiversx_sdk.core.constants import INTEGER_MAX_NUM_BYTES
+from multiversx_sdk.abi.shared import (
+    decode_length,
+    encode_length,
+    read_bytes_exactly,
+    unsigned_integer_to_bytes,
+)
 
 
 class BigUIntValue:
@@ -27,14 +31,7 @@ class BigUIntValue:
         self.value = self._unsigned_from_bytes(data)
 
     def _unsigned_to_bytes(self) -> bytes:
-        value = self.value
-
-        if value == 0:
-            return b""
-
-        data = value.to_bytes(INTEGER_MAX_NUM_BYTES, byteorder="big", signed=False)
-        data = data.lstrip(bytes([0]))
-        return data
+        return unsigned_integer_to_bytes(self.value)
 
     def _unsigned_from_bytes(self, data: bytes) -> int:
         return int.from_bytes(data, byteorder="big", signed=False)
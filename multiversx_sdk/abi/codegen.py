@@ -0,0 +1,457 @@
+"""Generates typed Python modules out of ABI files (see `AbiCodeGenerator`).
+
+Usage: python -m multiversx_sdk.abi.codegen <path to ABI file> <path to output module>
+"""
+
+import argparse
+import hashlib
+import keyword
+import pprint
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from multiversx_sdk.abi.abi import Abi
+from multiversx_sdk.abi.abi_definition import (
+    AbiDefinition,
+    EndpointDefinition,
+    EventDefinition,
+    NullEndpointDefinition,
+)
+from multiversx_sdk.abi.compiled_codecs import EndpointCodec, EventCodec, PayloadClasses
+from multiversx_sdk.abi.type_formula import TypeFormula
+from multiversx_sdk.abi.type_formula_parser import TypeFormulaParser
+
+# Names used by the generated module itself (classes and functions are renamed to avoid them).
+RESERVED_NAMES = {
+    "annotations",
+    "dataclass",
+    "Any",
+    "Optional",
+    "Sequence",
+    "Union",
+    "Decimal",
+    "Address",
+    "GeneratedCodecs",
+    "PayloadClasses",
+    "_ABI",
+    "_codecs",
+}
+
+INTEGER_TYPES = {"u8", "u16", "u32", "u64", "i8", "i16", "i32", "i64", "BigUint", "BigInt", "usize", "isize"}
+STRING_TYPES = {"utf-8 string", "TokenIdentifier", "TokenId", "EgldOrEsdtTokenIdentifier", "EsdtTokenIdentifier"}
+BYTES_TYPES = {"bytes", "CodeMetadata"}
+DECIMAL_TYPES = {"ManagedDecimal", "ManagedDecimalSigned"}
+COLLECTION_TYPES = {"List", "variadic", "counted-variadic"}
+OPTIONAL_TYPES = {"Option", "optional"}
+
+# Generated modules, by the hash of their source code.
+_modules_by_source_hash: dict[str, ModuleType] = {}
+
+
+class AbiCodeGenerator:
+    """
+    Generates a Python module out of an ABI, holding:
+     - a slotted dataclass for each struct, each enum variant and each event (and a `Union` alias for each enum),
+     - typed functions that encode the inputs and decode the outputs of each endpoint (and decode each event).
+
+    The dataclasses are much smaller and faster to create than the `SimpleNamespace` objects returned by `Abi`,
+    and can be passed back when encoding. The module can be written ahead of time (see `write_module()`),
+    or created at runtime (see `load_module()`).
+    """
+
+    def __init__(self, definition: AbiDefinition) -> None:
+        self.definition = definition
+        self._type_formula_parser = TypeFormulaParser()
+
+        self._used_names = set(RESERVED_NAMES)
+        self._structs_classes: dict[str, str] = {}
+        self._enums_aliases: dict[str, str] = {}
+        self._enums_variants_classes: dict[str, dict[str, str]] = {}
+        self._events_classes: dict[str, str] = {}
+
+        for name in definition.types.structs:
+            self._structs_classes[name] = self._claim_name(_to_class_name(name))
+
+        for name, enum in definition.types.enums.items():
+            self._enums_aliases[name] = self._claim_name(_to_class_name(name))
+            self._enums_variants_classes[name] = {
+                variant.name: self._claim_name(_to_class_name(name + variant.name[:1].upper() + variant.name[1:]))
+                for variant in enum.variants
+            }
+
+        for event in self._get_unambiguous_events():
+            self._events_classes[event.identifier] = self._claim_name(_to_class_name(event.identifier + "Event"))
+
+        # (endpoint, name of the encoding function, name of the decoding function, if any)
+        self._endpoints_functions: list[tuple[EndpointDefinition, str, str]] = []
+        self._events_functions: dict[str, str] = {}
+
+        for endpoint in self._get_endpoints():
+            function_name = _to_function_name(endpoint.name)
+            encode_name = self._claim_name(f"encode_{function_name}_inputs")
+            decode_name = self._claim_name(f"decode_{function_name}_outputs") if endpoint.outputs else ""
+            self._endpoints_functions.append((endpoint, encode_name, decode_name))
+
+        for event in self._get_unambiguous_events():
+            function_name = _to_function_name(event.identifier)
+            self._events_functions[event.identifier] = self._claim_name(f"decode_{function_name}_event")
+
+    @classmethod
+    def load(cls, path: Path) -> "AbiCodeGenerator":
+        return cls(AbiDefinition.load(path))
+
+    def generate(self) -> str:
+        """Returns the source code of the module."""
+        lines = [
+            '"""',
+            "Generated by `multiversx_sdk.abi.codegen`. Do not edit.",
+            '"""',
+            "",
+            "from __future__ import annotations",
+            "",
+            "from dataclasses import dataclass",
+            "from decimal import Decimal",
+            "from typing import Any, Optional, Sequence, Union",
+            "",
+            "from multiversx_sdk.abi.codegen import GeneratedCodecs",
+            "from multiversx_sdk.abi.compiled_codecs import PayloadClasses",
+            "from multiversx_sdk.core.address import Address",
+            "",
+        ]
+
+        for name, struct in self.definition.types.structs.items():
+            fields = [(field.name, field.type) for field in struct.fields]
+            lines += self._generate_dataclass(self._structs_classes[name], fields)
+
+        for name, enum in self.definition.types.enums.items():
+            variants_classes = self._enums_variants_classes[name]
+
+            for variant in enum.variants:
+                fields = [(field.name, field.type) for field in variant.fields]
+                lines += self._generate_dataclass(variants_classes[variant.name], fields)
+
+            lines += ["", f"{self._enums_aliases[name]} = Union[{', '.join(variants_classes.values())}]", ""]
+
+        for event in self._get_unambiguous_events():
+            # The indexed inputs come first (as expected by `EventCodec`).
+            inputs = [item for item in event.inputs if item.indexed] + [
+                item for item in event.inputs if not item.indexed
+            ]
+            fields = [(item.name, item.type) for item in inputs]
+            lines += self._generate_dataclass(self._events_classes[event.identifier], fields)
+
+        lines += ["", f"_ABI: dict[str, Any] = {pprint.pformat(_definition_to_dict(self.definition), width=120)}", ""]
+        lines += self._generate_codecs()
+
+        for endpoint, encode_name, decode_name in self._endpoints_functions:
+            lines += self._generate_endpoint_functions(endpoint, encode_name, decode_name)
+
+        for event in self._get_unambiguous_events():
+            lines += self._generate_event_function(event)
+
+        return "\n".join(lines) + "\n"
+
+    def write_module(self, path: Path) -> None:
+        Path(path).write_text(self.generate())
+
+    def load_module(self, module_name: Optional[str] = None) -> ModuleType:
+        """
+        Generates the module and executes it (at runtime). The modules are cached by the hash of their source code,
+        so that loading the same ABI again (e.g. through another `AbiDefinition` object) is cheap.
+
+        The module is registered in `sys.modules` (by default, as "abi_generated_<hash>"),
+        so that the dataclasses can be pickled (e.g. sent to other processes).
+        """
+        source = self.generate()
+        source_hash = hashlib.sha256(source.encode()).hexdigest()
+
+        module = _modules_by_source_hash.get(source_hash)
+        if module is not None:
+            return module
+
+        module_name = module_name or f"abi_generated_{source_hash[:16]}"
+        module = ModuleType(module_name)
+        sys.modules[module_name] = module
+
+        try:
+            exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+        except Exception:
+            del sys.modules[module_name]
+            raise
+
+        _modules_by_source_hash[source_hash] = module
+        return module
+
+    def _claim_name(self, name: str) -> str:
+        while name in self._used_names:
+            name += "_"
+
+        self._used_names.add(name)
+        return name
+
+    def _get_endpoints(self) -> list[EndpointDefinition]:
+        endpoints = [
+            endpoint
+            for endpoint in [self.definition.constructor, self.definition.upgrade_constructor]
+            if not isinstance(endpoint, NullEndpointDefinition)
+        ]
+
+        return endpoints + self.definition.endpoints
+
+    def _get_unambiguous_events(self) -> list[EventDefinition]:
+        # Events that share an identifier cannot be decoded by identifier (see `Abi._get_event_codec`).
+        identifiers = [event.identifier for event in self.definition.events]
+        return [event for event in self.definition.events if identifiers.count(event.identifier) == 1]
+
+    def _generate_dataclass(self, class_name: str, fields: list[tuple[str, str]]) -> list[str]:
+        attributes = _to_attribute_names([name for name, _ in fields])
+        lines = ["", "@dataclass", f"class {class_name}:", f"    __slots__ = {tuple(attributes)!r}"]
+
+        if attributes:
+            lines.append("")
+
+        for attribute, (_, type_expression) in zip(attributes, fields):
+            lines.append(f"    {attribute}: {self._annotate(type_expression, for_inputs=False)}")
+
+        lines.append("")
+        return lines
+
+    def _generate_codecs(self) -> list[str]:
+        lines = ["_codecs = GeneratedCodecs(", "    _ABI,", "    PayloadClasses(", "        structs={"]
+        lines += [f"            {name!r}: {class_name}," for name, class_name in self._structs_classes.items()]
+        lines += ["        },", "        enum_variants={"]
+
+        for enum_name, classes in self._enums_variants_classes.items():
+            lines.append(f"            {enum_name!r}: {{")
+            lines += [f"                {name!r}: {class_name}," for name, class_name in classes.items()]
+            lines.append("            },")
+
+        lines += ["        },", "        events={"]
+        lines += [
+            f"            {identifier!r}: {class_name}," for identifier, class_name in self._events_classes.items()
+        ]
+        lines += ["        },", "    ),", ")", ""]
+        return lines
+
+    def _generate_endpoint_functions(
+        self, endpoint: EndpointDefinition, encode_name: str, decode_name: str
+    ) -> list[str]:
+        lines: list[str] = []
+
+        parameters = _to_attribute_names(
+            [parameter.name for parameter in endpoint.inputs], fallback_prefix="arg", reserved=RESERVED_NAMES
+        )
+        signature: list[str] = []
+
+        for i, (name, parameter) in enumerate(zip(parameters, endpoint.inputs)):
+            annotation = self._annotate(parameter.type, for_inputs=True)
+            # Only the last input can be an optional value (see `OptionalParameterCodec`).
+            is_optional = i == len(parameters) - 1 and parameter.type.startswith("optional<")
+            signature.append(f"{name}: {annotation} = None" if is_optional else f"{name}: {annotation}")
+
+        lines += [
+            "",
+            f"def {encode_name}({', '.join(signature)}) -> list[bytes]:",
+            f"    return _codecs.endpoints[{endpoint.name!r}].encode_inputs([{', '.join(parameters)}])",
+            "",
+        ]
+
+        if not decode_name:
+            return lines
+
+        outputs = [self._annotate(parameter.type, for_inputs=False) for parameter in endpoint.outputs]
+
+        if len(outputs) == 1:
+            return_annotation = outputs[0]
+            return_statement = f"_codecs.endpoints[{endpoint.name!r}].decode_outputs(parts)[0]"
+        else:
+            return_annotation = f"tuple[{', '.join(outputs)}]"
+            return_statement = f"tuple(_codecs.endpoints[{endpoint.name!r}].decode_outputs(parts))"
+
+        lines += [
+            "",
+            f"def {decode_name}(parts: Sequence[bytes]) -> {return_annotation}:",
+            f"    return {return_statement}",
+            "",
+        ]
+
+        return lines
+
+    def _generate_event_function(self, event: EventDefinition) -> list[str]:
+        function_name = self._events_functions[event.identifier]
+        class_name = self._events_classes[event.identifier]
+
+        return [
+            "",
+            f"def {function_name}(topics: Sequence[bytes], additional_data: Sequence[bytes]) -> {class_name}:",
+            '    """The topics are expected without the identifier of the event."""',
+            f"    return _codecs.events[{event.identifier!r}].decode(topics, additional_data)",
+            "",
+        ]
+
+    def _annotate(self, type_expression: str, for_inputs: bool) -> str:
+        return self._annotate_formula(self._type_formula_parser.parse_expression(type_expression), for_inputs)
+
+    def _annotate_formula(self, type_formula: TypeFormula, for_inputs: bool) -> str:
+        name = type_formula.name
+        type_parameters = [self._annotate_formula(item, for_inputs) for item in type_formula.type_parameters]
+
+        if name == "bool":
+            return "bool"
+        if name in INTEGER_TYPES:
+            return "int"
+        if name in BYTES_TYPES:
+            return "bytes"
+        if name in STRING_TYPES:
+            return "str"
+        if name in DECIMAL_TYPES:
+            return "Decimal"
+        if name == "Address":
+            return "Union[Address, bytes]" if for_inputs else "bytes"
+        if name in OPTIONAL_TYPES:
+            return f"Optional[{type_parameters[0]}]"
+        if name in COLLECTION_TYPES or name.startswith("array"):
+            return f"list[{type_parameters[0]}]"
+        if name == "tuple":
+            return f"tuple[{', '.join(type_parameters)}]"
+        if name in self._structs_classes:
+            return self._structs_classes[name]
+        if name in self._enums_aliases:
+            return self._enums_aliases[name]
+        if name in self.definition.types.explicit_enums:
+            return "str"
+
+        # E.g. multi-values (decoded as lists of heterogeneous items).
+        return "list[Any]" if name == "multi" else "Any"
+
+
+class GeneratedCodecs:
+    """
+    The codecs used by the modules generated by `AbiCodeGenerator`: they decode into (and encode from)
+    the generated dataclasses.
+    """
+
+    def __init__(self, abi_definition: dict[str, Any], payload_classes: PayloadClasses) -> None:
+        definition = AbiDefinition.from_dict(abi_definition)
+        compiler = Abi(definition)._create_codecs_compiler(payload_classes=payload_classes)
+
+        self.endpoints: dict[str, EndpointCodec] = {}
+        self.events: dict[str, EventCodec] = {}
+
+        for endpoint in [definition.constructor, definition.upgrade_constructor] + definition.endpoints:
+            self.endpoints[endpoint.name] = compiler.compile_endpoint(
+                name=endpoint.name,
+                inputs=[parameter.type for parameter in endpoint.inputs],
+                outputs=[parameter.type for parameter in endpoint.outputs],
+            )
+
+        for event in definition.events:
+            if event.identifier in payload_classes.events:
+                self.events[event.identifier] = compiler.compile_event(event)
+
+
+def _definition_to_dict(definition: AbiDefinition) -> dict[str, Any]:
+    """
+    The parts of the ABI needed for encoding and decoding (e.g. without docs), in the format of the ABI files.
+    """
+
+    def endpoint_to_dict(endpoint: EndpointDefinition) -> dict[str, Any]:
+        return {
+            "name": endpoint.name,
+            "inputs": [{"name": item.name, "type": item.type} for item in endpoint.inputs],
+            "outputs": [{"name": item.name, "type": item.type} for item in endpoint.outputs],
+        }
+
+    def fields_to_list(fields: list[Any]) -> list[dict[str, Any]]:
+        return [{"name": field.name, "type": field.type} for field in fields]
+
+    data: dict[str, Any] = {}
+
+    if not isinstance(definition.constructor, NullEndpointDefinition):
+        data["constructor"] = endpoint_to_dict(definition.constructor)
+    if not isinstance(definition.upgrade_constructor, NullEndpointDefinition):
+        data["upgradeConstructor"] = endpoint_to_dict(definition.upgrade_constructor)
+
+    data["endpoints"] = [endpoint_to_dict(endpoint) for endpoint in definition.endpoints]
+    data["events"] = [
+        {
+            "identifier": event.identifier,
+            "inputs": [{"name": item.name, "type": item.type, "indexed": item.indexed} for item in event.inputs],
+        }
+        for event in definition.events
+    ]
+
+    types: dict[str, Any] = {}
+
+    for name, struct in definition.types.structs.items():
+        types[name] = {"type": "struct", "fields": fields_to_list(struct.fields)}
+
+    for name, enum in definition.types.enums.items():
+        types[name] = {
+            "type": "enum",
+            "variants": [
+                {"name": variant.name, "discriminant": variant.discriminant, "fields": fields_to_list(variant.fields)}
+                for variant in enum.variants
+            ],
+        }
+
+    for name, explicit_enum in definition.types.explicit_enums.items():
+        types[name] = {"type": "explicit-enum", "variants": [{"name": item.name} for item in explicit_enum.variants]}
+
+    data["types"] = types
+    return data
+
+
+def _to_identifier(name: str, fallback: str) -> str:
+    identifier = re.sub(r"\W", "_", name) or fallback
+
+    if identifier[0].isdigit():
+        identifier = f"_{identifier}"
+    if keyword.iskeyword(identifier) or identifier.startswith("__"):
+        identifier = f"{identifier}_"
+
+    return identifier
+
+
+def _to_class_name(name: str) -> str:
+    identifier = _to_identifier(name, "Unnamed")
+    return identifier[0].upper() + identifier[1:]
+
+
+def _to_function_name(name: str) -> str:
+    # E.g. "getSum" => "get_sum", "ESDTTransfer" => "esdt_transfer"
+    snake_case = re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+    return _to_identifier(snake_case, "unnamed")
+
+
+def _to_attribute_names(
+    names: list[str], fallback_prefix: str = "field", reserved: Optional[set[str]] = None
+) -> list[str]:
+    reserved = reserved or set()
+    attributes: list[str] = []
+
+    for i, name in enumerate(names):
+        attribute = _to_identifier(name, f"{fallback_prefix}{i}")
+
+        while attribute in attributes or attribute in reserved:
+            attribute += "_"
+
+        attributes.append(attribute)
+
+    return attributes
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a typed Python module out of an ABI file.")
+    parser.add_argument("abi", type=Path, help="path to the ABI file")
+    parser.add_argument("output", type=Path, help="path to the generated module")
+    args = parser.parse_args(argv)
+
+    AbiCodeGenerator.load(args.abi).write_module(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import dataclasses
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.abi.abi import Abi
+from multiversx_sdk.abi.abi_definition import AbiDefinition
+from multiversx_sdk.abi.codegen import AbiCodeGenerator
+from multiversx_sdk.core.address import Address
+
+testdata = Path(__file__).parent.parent / "testutils" / "testdata"
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+# The output of "getPendingActionFullInfo" (multisig): a "SendTransferExecuteEgld" action, signed by Alice and Bob.
+action_full_info_hex = "".join(
+    [
+        "0000002A",
+        "0000002A",
+        "05|0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1|000000080de0b6b3a7640000|010000000000e4e1c0|000000076578616d706c65|00000002000000020342000000020743",
+        "00000002|0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1|8049d639e5a6980d1cd2392abcce41029cda74a1563523a202f09641cc2618f8",
+    ]
+).replace("|", "")
+
+
+def test_generate_and_load_adder():
+    module = AbiCodeGenerator.load(testdata / "adder.abi.json").load_module()
+
+    assert module.encode_constructor_inputs(42) == [bytes([42])]
+    assert module.encode_add_inputs(7) == [bytes([7])]
+    assert module.decode_get_sum_outputs([bytes([0x01, 0x00])]) == 256
+
+
+def test_decode_into_slotted_dataclasses():
+    module = AbiCodeGenerator.load(testdata / "multisig-full.abi.json").load_module()
+    data = bytes.fromhex(action_full_info_hex)
+
+    [action_full_info] = module.decode_get_pending_action_full_info_outputs([data])
+
+    assert isinstance(action_full_info, module.ActionFullInfo)
+    assert not hasattr(action_full_info, "__dict__")
+    assert action_full_info.action_id == 42
+    assert action_full_info.group_id == 42
+    assert action_full_info.signers == [alice.get_public_key(), bob.get_public_key()]
+
+    action = action_full_info.action_data
+    assert isinstance(action, module.ActionSendTransferExecuteEgld)
+    assert action._0 == module.CallActionData(
+        to=alice.get_public_key(),
+        egld_amount=1000000000000000000,
+        opt_gas_limit=15000000,
+        endpoint_name=b"example",
+        arguments=[bytes([0x03, 0x42]), bytes([0x07, 0x43])],
+    )
+
+    # Same values as the ones decoded by "Abi" (into namespaces).
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+    [[expected]] = abi.decode_endpoint_output_parameters("getPendingActionFullInfo", [data])
+    assert dataclasses.asdict(action._0) == vars(getattr(expected.action_data, "0"))
+
+
+def test_encode_from_slotted_dataclasses():
+    module = AbiCodeGenerator.load(testdata / "multisig-full.abi.json").load_module()
+
+    action = module.ActionSendTransferExecuteEgld(
+        module.CallActionData(
+            to=alice,
+            egld_amount=1000000000000000000,
+            opt_gas_limit=15000000,
+            endpoint_name=b"example",
+            arguments=[bytes([0x03, 0x42]), bytes([0x07, 0x43])],
+        )
+    )
+
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+    [[action_full_info]] = abi.decode_endpoint_output_parameters(
+        "getPendingActionFullInfo", [bytes.fromhex(action_full_info_hex)]
+    )
+    expected = abi.encode_endpoint_input_parameters("proposeBatch", [[action_full_info.action_data]])
+    assert module.encode_propose_batch_inputs([action]) == expected
+    assert module.encode_propose_batch_inputs([module.ActionNothing()]) == [b""]
+
+
+def test_decode_events():
+    module = AbiCodeGenerator.load(testdata / "multisig-full.abi.json").load_module()
+
+    event = module.decode_perform_change_user_event(
+        [bytes([0x2A]), bob.get_public_key(), bytes([]), bytes([0x02])],
+        [],
+    )
+
+    assert event == module.PerformChangeUserEvent(
+        action_id=42,
+        changed_user=bob.get_public_key(),
+        old_role=module.UserRoleNone(),
+        new_role=module.UserRoleBoardMember(),
+    )
+
+    event = module.decode_start_perform_action_event([], [bytes.fromhex(action_full_info_hex)])
+    assert isinstance(event.data, module.ActionFullInfo)
+
+
+def test_load_module_is_cached():
+    first = AbiCodeGenerator(AbiDefinition.load(testdata / "adder.abi.json")).load_module()
+    second = AbiCodeGenerator(AbiDefinition.load(testdata / "adder.abi.json")).load_module()
+
+    assert first is second
+
+
+def test_write_module(tmp_path: Path):
+    path = tmp_path / "adder_abi.py"
+    AbiCodeGenerator.load(testdata / "adder.abi.json").write_module(path)
+
+    spec = importlib.util.spec_from_file_location("adder_abi", path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.decode_get_sum_outputs([bytes([0x2A])]) == 42
+
+
+def test_generate_with_unusual_names():
+    definition = AbiDefinition.from_dict(
+        {
+            "endpoints": [
+                {
+                    "name": "getESDTInfo",
+                    "inputs": [{"name": "class", "type": "u8"}, {"name": "", "type": "optional<Info>"}],
+                    "outputs": [{"type": "Info"}, {"type": "Kind"}],
+                }
+            ],
+            "types": {
+                "Info": {
+                    "type": "struct",
+                    "fields": [{"name": "0", "type": "u8"}, {"name": "from", "type": "Option<u16>"}],
+                },
+                "Kind": {
+                    "type": "enum",
+                    "variants": [{"name": "None", "discriminant": 0}, {"name": "dataclass", "discriminant": 1}],
+                },
+            },
+        }
+    )
+
+    module = AbiCodeGenerator(definition).load_module()
+
+    assert module.Info.__slots__ == ("_0", "from_")
+    assert module.encode_get_esdt_info_inputs(1) == [bytes([1])]
+    assert module.encode_get_esdt_info_inputs(1, module.Info(2, None)) == [bytes([1]), bytes([2, 0])]
+    assert module.decode_get_esdt_info_outputs([bytes([2, 1, 0, 3]), bytes([1])]) == (
+        module.Info(2, 3),
+        module.KindDataclass(),
+    )
+
+    with pytest.raises(Exception, match="cannot decode field 'from'"):
+        module.decode_get_esdt_info_outputs([bytes([2, 1, 0]), bytes([1])])
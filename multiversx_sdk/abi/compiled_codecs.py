@@ -0,0 +1,1649 @@
+import dataclasses
+import io
+import struct
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from multiversx_sdk.abi.abi_definition import (
+    AbiDefinition,
+    EnumDefinition,
+    EventDefinition,
+)
+from multiversx_sdk.abi.address_value import AddressValue
+from multiversx_sdk.abi.array_value import ArrayValue
+from multiversx_sdk.abi.bytes_value import BytesValue
+from multiversx_sdk.abi.code_metadata_value import CodeMetadataValue
+from multiversx_sdk.abi.constants import (
+    ENUM_DISCRIMINANT_FIELD_NAME,
+    ENUM_NAME_FIELD_NAME,
+    FALS_AS_BYTE,
+    NUM_BYTES_IN_64_BITS,
+    OPTION_MARKER_FOR_ABSENT_VALUE,
+    OPTION_MARKER_FOR_PRESENT_VALUE,
+    TRUE_AS_BYTE,
+)
+from multiversx_sdk.abi.counted_variadic_values import CountedVariadicValues
+from multiversx_sdk.abi.enum_value import EnumValue, _EnumPayload
+from multiversx_sdk.abi.list_value import ListValue
+from multiversx_sdk.abi.multi_value import MultiValue
+from multiversx_sdk.abi.option_value import OptionValue
+from multiversx_sdk.abi.optional_value import OptionalValue
+from multiversx_sdk.abi.serializer import Serializer
+from multiversx_sdk.abi.shared import (
+    UINT32,
+    convert_native_value_to_dictionary,
+    convert_native_value_to_list,
+    signed_integer_to_bytes,
+    signed_integers_to_bytes,
+    unsigned_integer_to_bytes,
+    unsigned_integers_to_bytes,
+)
+from multiversx_sdk.abi.small_int_values import SmallIntValue
+from multiversx_sdk.abi.string_value import StringValue
+from multiversx_sdk.abi.struct_value import StructValue
+from multiversx_sdk.abi.tuple_value import TupleValue
+from multiversx_sdk.abi.type_formula import TypeFormula
+from multiversx_sdk.abi.type_formula_parser import TypeFormulaParser
+from multiversx_sdk.abi.variadic_values import VariadicValues
+from multiversx_sdk.core.address import PUBKEY_LENGTH, Address
+from multiversx_sdk.core.code_metadata import CODE_METADATA_LENGTH, CodeMetadata
+from multiversx_sdk.core.numpy_support import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (num bytes, signed) => struct format character, for the fixed-size integers.
+# These are unpacked in place (without slicing the data), and collections of them are unpacked in bulk.
+INTEGER_FORMAT_CHARACTERS = {
+    (1, False): "B",
+    (2, False): "H",
+    (4, False): "I",
+    (8, False): "Q",
+    (1, True): "b",
+    (2, True): "h",
+    (4, True): "i",
+    (8, True): "q",
+}
+
+
+class TypeCodec(ABC):
+    """
+    Encodes native Python values straight to bytes (and decodes them back), for a single-value type of the ABI.
+    The native values accepted and returned are the same as the ones of the corresponding value class
+    (see `set_payload()` and `get_payload()`), but no intermediate value objects are created.
+    """
+
+    name = ""
+
+    # The size of the nested encoding, for fixed-size types (e.g. u64, Address).
+    # Collections of such types are encoded and decoded in bulk (see the "many" and "array" methods).
+    size: Optional[int] = None
+
+    @abstractmethod
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        pass
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        self.encode_nested(value, buffer)
+
+    @abstractmethod
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        """Decodes a value starting at the given offset. Returns the value and the offset right after it."""
+        pass
+
+    def decode_top_level(self, data: bytes) -> Any:
+        value, _ = self.decode_nested(data, 0)
+        return value
+
+    def encode_many(self, values: list[Any], buffer: bytearray) -> None:
+        """Encodes (nested) the given values, one after the other."""
+        encode_nested = self.encode_nested
+
+        for value in values:
+            encode_nested(value, buffer)
+
+    def encode_many_top_level(self, values: list[Any]) -> list[bytes]:
+        """Encodes (top-level) each of the given values, as a separate part."""
+        parts: list[bytes] = []
+
+        for value in values:
+            buffer = bytearray()
+            self.encode_top_level(value, buffer)
+            parts.append(bytes(buffer))
+
+        return parts
+
+    def decode_many(self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        """Decodes `count` (nested) values, starting at the given offset."""
+        decode_nested = self.decode_nested
+        values: list[Any] = []
+
+        for _ in range(count):
+            value, offset = decode_nested(data, offset)
+            values.append(value)
+
+        return values, offset
+
+    def decode_many_until_end(self, data: bytes, offset: int) -> list[Any]:
+        """Decodes (nested) values, starting at the given offset, until the end of the data."""
+        decode_nested = self.decode_nested
+        values: list[Any] = []
+
+        while offset < len(data):
+            value, offset = decode_nested(data, offset)
+            values.append(value)
+
+        return values
+
+    def decode_many_top_level(self, parts: Sequence[bytes]) -> list[Any]:
+        """Decodes each of the given (top-level encoded) parts."""
+        decode_top_level = self.decode_top_level
+        return [decode_top_level(part) for part in parts]
+
+
+class FixedSizeTypeCodec(TypeCodec):
+    """
+    A codec of a fixed-size type (e.g. u64, Address), whose collections can also be decoded into NumPy arrays.
+    Subclasses must set `size`.
+    """
+
+    @abstractmethod
+    def decode_array(self, data: bytes, offset: int, count: int) -> tuple["np.ndarray", int]:
+        """Same as `decode_many()`, but returns a NumPy array."""
+        pass
+
+    @abstractmethod
+    def decode_array_top_level(self, parts: Sequence[bytes]) -> "np.ndarray":
+        """Same as `decode_many_top_level()`, but returns a NumPy array."""
+        pass
+
+
+class BoolCodec(TypeCodec):
+    name = "BoolValue"
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        buffer.append(TRUE_AS_BYTE if value else FALS_AS_BYTE)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        # For "false", write nothing.
+        if value:
+            buffer.append(TRUE_AS_BYTE)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        _ensure_can_read(data, offset, 1)
+        return _byte_to_bool(data[offset]), offset + 1
+
+    def decode_top_level(self, data: bytes) -> Any:
+        if len(data) == 0:
+            return False
+
+        if len(data) == 1:
+            return _byte_to_bool(data[0])
+
+        raise ValueError(f"unexpected boolean value: {data}")
+
+
+class FixedSizeIntegerCodec(FixedSizeTypeCodec):
+    """
+    The common part of `SmallUIntCodec` and `SmallIntCodec`: (bulk) decoding, given the size and the signedness.
+    """
+
+    def __init__(self, num_bytes: int, signed: bool, name: str) -> None:
+        self.num_bytes = num_bytes
+        self.size = num_bytes
+        self.signed = signed
+        self.name = name
+        self.format_character = INTEGER_FORMAT_CHARACTERS[(num_bytes, signed)]
+        self.format = struct.Struct(f">{self.format_character}")
+        self.dtype = f"{'i' if signed else 'u'}{num_bytes}"
+
+        num_bits = 8 * num_bytes
+        self.min_value = -(1 << (num_bits - 1)) if signed else 0
+        self.max_value = (1 << (num_bits - 1)) - 1 if signed else (1 << num_bits) - 1
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        end = _ensure_can_read(data, offset, self.num_bytes)
+        return self.format.unpack_from(data, offset)[0], end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        value = int.from_bytes(data, byteorder="big", signed=self.signed)
+
+        if not self.min_value <= value <= self.max_value:
+            raise ValueError(
+                f"decoded value is too large or invalid (does not fit into {self.num_bytes} byte(s)): {value}"
+            )
+
+        return value
+
+    def encode_many(self, values: list[Any], buffer: bytearray) -> None:
+        try:
+            buffer += struct.pack(f">{len(values)}{self.format_character}", *values)
+        except struct.error:
+            # E.g. values that are not integers (but are convertible to integers), or values out of range:
+            # encode them one by one (which converts them, or raises the appropriate error).
+            super().encode_many(values, buffer)
+
+    def decode_many(self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        end = offset + count * self.num_bytes
+
+        if end > len(data):
+            # Raises the appropriate error.
+            return super().decode_many(data, offset, count)
+
+        values = struct.unpack_from(f">{count}{self.format_character}", data, offset)
+        return list(values), end
+
+    def decode_many_top_level(self, parts: Sequence[bytes]) -> list[Any]:
+        signed = self.signed
+        values = [int.from_bytes(part, byteorder="big", signed=signed) for part in parts]
+
+        if values and (min(values) < self.min_value or max(values) > self.max_value):
+            # Raises the appropriate error.
+            return super().decode_many_top_level(parts)
+
+        return values
+
+    def decode_array(self, data: bytes, offset: int, count: int) -> tuple["np.ndarray", int]:
+        np = import_numpy()
+        end = offset + count * self.num_bytes
+
+        if end > len(data):
+            # Raises the appropriate error.
+            super().decode_many(data, offset, count)
+
+        array = np.frombuffer(data, dtype=f">{self.dtype}", count=count, offset=offset)
+        return array.astype(self.dtype), end
+
+    def decode_array_top_level(self, parts: Sequence[bytes]) -> "np.ndarray":
+        np = import_numpy()
+        return np.array(self.decode_many_top_level(parts), dtype=self.dtype)
+
+
+class SmallUIntCodec(FixedSizeIntegerCodec):
+    def __init__(self, num_bytes: int, name: str) -> None:
+        super().__init__(num_bytes, False, name)
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        buffer += int(value).to_bytes(self.num_bytes, byteorder="big", signed=False)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        value = int(value)
+
+        if value == 0:
+            return
+
+        data = value.to_bytes(NUM_BYTES_IN_64_BITS, byteorder="big", signed=False)
+        buffer += data.lstrip(b"\x00")
+
+
+class SmallIntCodec(FixedSizeIntegerCodec):
+    def __init__(self, num_bytes: int, name: str) -> None:
+        super().__init__(num_bytes, True, name)
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        buffer += self._to_int(value).to_bytes(self.num_bytes, byteorder="big", signed=True)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        value = self._to_int(value)
+
+        if value == 0:
+            return
+
+        length = ((value + (value < 0)).bit_length() + 7 + 1) // 8
+        buffer += value.to_bytes(length, byteorder="big", signed=True)
+
+    def _to_int(self, value: Any) -> int:
+        if isinstance(value, SmallIntValue) and self.num_bytes < value._num_bytes:
+            raise ValueError(
+                f"cannot set payload: source value has {value._num_bytes} bytes, which is more than {self.num_bytes} bytes of the target"
+            )
+
+        return int(value)
+
+
+class BigUIntCodec(TypeCodec):
+    """
+    Big integers are encoded on the minimal number of bytes (sized from their bit length).
+    Collections of them (e.g. token amounts) are encoded and decoded in bulk, as well.
+    """
+
+    name = "BigUIntValue"
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        data = unsigned_integer_to_bytes(int(value))
+        buffer += UINT32.pack(len(data))
+        buffer += data
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        buffer += unsigned_integer_to_bytes(int(value))
+
+    def encode_many(self, values: list[Any], buffer: bytearray) -> None:
+        pack_length = UINT32.pack
+
+        for data in unsigned_integers_to_bytes([int(value) for value in values]):
+            buffer += pack_length(len(data))
+            buffer += data
+
+    def encode_many_top_level(self, values: list[Any]) -> list[bytes]:
+        return unsigned_integers_to_bytes([int(value) for value in values])
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        length, offset = _read_length(data, offset)
+        end = _ensure_can_read(data, offset, length)
+        return int.from_bytes(data[offset:end], byteorder="big", signed=False), end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        return int.from_bytes(data, byteorder="big", signed=False)
+
+    def decode_many(self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        return _decode_many_big_integers(data, offset, count, False)
+
+    def decode_many_until_end(self, data: bytes, offset: int) -> list[Any]:
+        values, _ = _decode_many_big_integers(data, offset, None, False)
+        return values
+
+    def decode_many_top_level(self, parts: Sequence[bytes]) -> list[Any]:
+        from_bytes = int.from_bytes
+        return [from_bytes(part, "big") for part in parts]
+
+
+class BigIntCodec(TypeCodec):
+    """Same as `BigUIntCodec`, but for signed integers (two's complement)."""
+
+    name = "BigIntValue"
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        data = signed_integer_to_bytes(int(value))
+        buffer += UINT32.pack(len(data))
+        buffer += data
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        buffer += signed_integer_to_bytes(int(value))
+
+    def encode_many(self, values: list[Any], buffer: bytearray) -> None:
+        pack_length = UINT32.pack
+
+        for data in signed_integers_to_bytes([int(value) for value in values]):
+            buffer += pack_length(len(data))
+            buffer += data
+
+    def encode_many_top_level(self, values: list[Any]) -> list[bytes]:
+        return signed_integers_to_bytes([int(value) for value in values])
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        length, offset = _read_length(data, offset)
+        end = _ensure_can_read(data, offset, length)
+        return int.from_bytes(data[offset:end], byteorder="big", signed=True), end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        return int.from_bytes(data, byteorder="big", signed=True)
+
+    def decode_many(self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        return _decode_many_big_integers(data, offset, count, True)
+
+    def decode_many_until_end(self, data: bytes, offset: int) -> list[Any]:
+        values, _ = _decode_many_big_integers(data, offset, None, True)
+        return values
+
+    def decode_many_top_level(self, parts: Sequence[bytes]) -> list[Any]:
+        from_bytes = int.from_bytes
+        return [from_bytes(part, "big", signed=True) for part in parts]
+
+
+class BytesCodec(TypeCodec):
+    name = "BytesValue"
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        data = self._to_bytes(value)
+        buffer += UINT32.pack(len(data))
+        buffer += data
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        buffer += self._to_bytes(value)
+
+    def _to_bytes(self, value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+
+        # Same conversions as `BytesValue.set_payload()`.
+        holder = BytesValue()
+        holder.set_payload(value)
+        return holder.value
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        length, offset = _read_length(data, offset)
+        end = _ensure_can_read(data, offset, length)
+        return data[offset:end], end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        return data
+
+
+class StringCodec(TypeCodec):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        value = self._to_str(value)
+        # The length is the one of the string (not of its UTF-8 representation), as in `StringValue`.
+        buffer += UINT32.pack(len(value))
+        buffer += value.encode("utf-8")
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        buffer += self._to_str(value).encode("utf-8")
+
+    def _to_str(self, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        if isinstance(value, StringValue):
+            return value.value
+
+        raise ValueError(f"cannot set payload for string (should be either a string or bytes, but got: {type(value)})")
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        length, offset = _read_length(data, offset)
+        end = _ensure_can_read(data, offset, length)
+        return bytes(data[offset:end]).decode("utf-8"), end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        return bytes(data).decode("utf-8")
+
+
+class AddressCodec(FixedSizeTypeCodec):
+    name = "AddressValue"
+    size = PUBKEY_LENGTH
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        buffer += self._to_pubkey(value)
+
+    def _to_pubkey(self, value: Any) -> bytes:
+        if isinstance(value, Address):
+            return value.get_public_key()
+
+        if isinstance(value, bytes):
+            pubkey = value
+        else:
+            # Same conversions as `AddressValue.set_payload()` (dictionaries, bech32 strings etc.).
+            holder = AddressValue()
+            holder.set_payload(value)
+            return holder.value
+
+        _check_pubkey_length(pubkey)
+        return pubkey
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        end = _ensure_can_read(data, offset, PUBKEY_LENGTH)
+        return data[offset:end], end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        _check_pubkey_length(data)
+        return data
+
+    def encode_many(self, values: list[Any], buffer: bytearray) -> None:
+        to_pubkey = self._to_pubkey
+        buffer += b"".join([to_pubkey(value) for value in values])
+
+    def decode_many(self, data: bytes, offset: int, count: int) -> tuple[list[Any], int]:
+        end = offset + count * PUBKEY_LENGTH
+
+        if end > len(data):
+            # Raises the appropriate error.
+            return super().decode_many(data, offset, count)
+
+        return [data[i : i + PUBKEY_LENGTH] for i in range(offset, end, PUBKEY_LENGTH)], end
+
+    def decode_many_top_level(self, parts: Sequence[bytes]) -> list[Any]:
+        for part in parts:
+            _check_pubkey_length(part)
+
+        return list(parts)
+
+    def decode_array(self, data: bytes, offset: int, count: int) -> tuple["np.ndarray", int]:
+        """The public keys are returned as a 2D array (of unsigned bytes), one row per address."""
+        np = import_numpy()
+        end = offset + count * PUBKEY_LENGTH
+
+        if end > len(data):
+            # Raises the appropriate error.
+            super().decode_many(data, offset, count)
+
+        array = np.frombuffer(data, dtype=np.uint8, count=count * PUBKEY_LENGTH, offset=offset)
+        return array.reshape(count, PUBKEY_LENGTH).copy(), end
+
+    def decode_array_top_level(self, parts: Sequence[bytes]) -> "np.ndarray":
+        np = import_numpy()
+        data = b"".join(self.decode_many_top_level(parts))
+        return np.frombuffer(data, dtype=np.uint8).reshape(len(parts), PUBKEY_LENGTH)
+
+
+class CodeMetadataCodec(TypeCodec):
+    name = "CodeMetadataValue"
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, CodeMetadata):
+            buffer += value.serialize()
+            return
+
+        holder = CodeMetadataValue()
+        holder.set_payload(value)
+        buffer += holder.value
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        end = _ensure_can_read(data, offset, CODE_METADATA_LENGTH)
+        return data[offset:end], end
+
+    def decode_top_level(self, data: bytes) -> Any:
+        return data
+
+
+class TupleCodec(TypeCodec):
+    name = "TupleValue"
+
+    def __init__(self, items: list[TypeCodec]) -> None:
+        self.items = items
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, TupleValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        native_list, ok = convert_native_value_to_list(value, raise_on_failure=False)
+        if not ok:
+            raise ValueError("cannot set payload for tuple (should be either a tuple or a list)")
+
+        if len(self.items) != len(native_list):
+            raise ValueError(
+                f"the number of fields ({len(self.items)}) does not match the number of provided native values ({len(native_list)})"
+            )
+
+        for item, native_item in zip(self.items, native_list):
+            item.encode_nested(native_item, buffer)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        values: list[Any] = []
+
+        for i, item in enumerate(self.items):
+            try:
+                value, offset = item.decode_nested(data, offset)
+            except Exception as e:
+                raise Exception(f"cannot decode field '{i}' of tuple, because of: {e}")
+
+            values.append(value)
+
+        return tuple(values), offset
+
+
+class OptionCodec(TypeCodec):
+    name = "OptionValue"
+
+    def __init__(self, inner: TypeCodec) -> None:
+        self.inner = inner
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, OptionValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        if value is None:
+            buffer.append(OPTION_MARKER_FOR_ABSENT_VALUE)
+            return
+
+        buffer.append(OPTION_MARKER_FOR_PRESENT_VALUE)
+        self.inner.encode_nested(value, buffer)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, OptionValue):
+            _encode_value_object(value, buffer, top_level=True)
+            return
+
+        if value is None:
+            return
+
+        buffer.append(OPTION_MARKER_FOR_PRESENT_VALUE)
+        self.inner.encode_nested(value, buffer)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        _ensure_can_read(data, offset, 1)
+        first_byte = data[offset]
+
+        if first_byte == OPTION_MARKER_FOR_ABSENT_VALUE:
+            return None, offset + 1
+
+        if first_byte == OPTION_MARKER_FOR_PRESENT_VALUE:
+            return self.inner.decode_nested(data, offset + 1)
+
+        raise ValueError(f"invalid first byte for nested encoded option: {first_byte}")
+
+    def decode_top_level(self, data: bytes) -> Any:
+        if len(data) == 0:
+            return None
+
+        first_byte = data[0]
+
+        if first_byte != OPTION_MARKER_FOR_PRESENT_VALUE:
+            raise ValueError(f"invalid first byte for top-level encoded option: {first_byte}")
+
+        value, _ = self.inner.decode_nested(data, 1)
+        return value
+
+
+class ListCodec(TypeCodec):
+    name = "ListValue"
+
+    def __init__(self, item: TypeCodec, numpy_arrays: bool = False) -> None:
+        self.item = item
+        # Only collections of fixed-size items can be decoded as NumPy arrays (the others are decoded as lists).
+        self.numpy_arrays = numpy_arrays and isinstance(item, FixedSizeTypeCodec)
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, ListValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+        buffer += UINT32.pack(len(native_items))
+        self._encode_items(native_items, buffer)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, ListValue):
+            _encode_value_object(value, buffer, top_level=True)
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+        self._encode_items(native_items, buffer)
+
+    def _encode_items(self, native_items: list[Any], buffer: bytearray) -> None:
+        self.item.encode_many(native_items, buffer)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        length, offset = _read_length(data, offset)
+        return self._decode_items(data, offset, length)
+
+    def _decode_items(self, data: bytes, offset: int, count: int) -> tuple[Any, int]:
+        if self.numpy_arrays and isinstance(self.item, FixedSizeTypeCodec):
+            return self.item.decode_array(data, offset, count)
+
+        return self.item.decode_many(data, offset, count)
+
+    def decode_top_level(self, data: bytes) -> Any:
+        item_size = self.item.size
+
+        if item_size:
+            values, offset = self._decode_items(data, 0, len(data) // item_size)
+
+            if offset < len(data):
+                # The remaining data is too short for an item: raises the appropriate error.
+                self.item.decode_nested(data, offset)
+
+            return values
+
+        return self.item.decode_many_until_end(data, 0)
+
+
+class ArrayCodec(ListCodec):
+    name = "ArrayValue"
+
+    def __init__(self, item: TypeCodec, length: int, numpy_arrays: bool = False) -> None:
+        super().__init__(item, numpy_arrays)
+        self.length = length
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, ArrayValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+
+        if len(native_items) != self.length:
+            raise ValueError(f"wrong length, expected: {self.length}, actual: {len(native_items)}")
+
+        self._encode_items(native_items, buffer)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        self.encode_nested(value, buffer)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        return self._decode_items(data, offset, self.length)
+
+
+class StructCodec(TypeCodec):
+    name = "StructValue"
+
+    def __init__(
+        self, fields: Optional[list[tuple[str, TypeCodec]]] = None, payload_class: Optional[type] = None
+    ) -> None:
+        self.fields = fields or []
+        self.payload_class = payload_class
+        self.payload_attributes = _get_payload_attributes(payload_class)
+        self._decode_payload: Optional[Callable[[bytes, int], tuple[Any, int]]] = None
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if self.payload_class is not None and type(value) is self.payload_class:
+            _encode_fields_from_list(self.fields, [getattr(value, name) for name in self.payload_attributes], buffer)
+            return
+
+        if isinstance(value, StructValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        native_dictionary, ok = convert_native_value_to_dictionary(value, raise_on_failure=False)
+        if ok:
+            _encode_fields_from_dictionary(self.fields, native_dictionary, buffer)
+            return
+
+        native_list, ok = convert_native_value_to_list(value, raise_on_failure=False)
+        if ok:
+            _encode_fields_from_list(self.fields, native_list, buffer)
+            return
+
+        raise ValueError("cannot set payload for struct (should be either a dictionary or a list)")
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        if self.payload_class is not None:
+            if self._decode_payload is None:
+                # Created on first use, since the fields are set after the codec (to support recursive types).
+                self._decode_payload = _create_payload_decoder(self.fields, self.payload_class)
+
+            return self._decode_payload(data, offset)
+
+        values, offset = _decode_fields(self.fields, data, offset)
+        return SimpleNamespace(**values), offset
+
+
+class EnumCodec(TypeCodec):
+    name = "EnumValue"
+
+    def __init__(self, enum_name: str) -> None:
+        self.enum_name = enum_name
+        self.variants: dict[int, list[tuple[str, TypeCodec]]] = {}
+        self.names_to_discriminants: dict[str, int] = {}
+        self.discriminants_to_names: dict[int, str] = {}
+        self.payload_classes: dict[int, type] = {}
+        self.payload_classes_discriminants: dict[type, int] = {}
+        self.payload_classes_attributes: dict[type, list[str]] = {}
+        self._payload_decoders: dict[int, Callable[[bytes, int], tuple[Any, int]]] = {}
+
+    def set_payload_classes(
+        self, payload_classes: dict[int, type], payload_classes_discriminants: dict[type, int]
+    ) -> None:
+        """
+        Sets the classes to decode the variants into (by discriminant), instead of `_EnumPayload` objects.
+        Instances of these classes (of any variant) are accepted when encoding.
+        """
+        self.payload_classes = payload_classes
+        self.payload_classes_discriminants = payload_classes_discriminants
+        self._payload_decoders = {
+            discriminant: _create_payload_decoder(self._get_fields(discriminant), payload_class)
+            for discriminant, payload_class in payload_classes.items()
+        }
+        self.payload_classes_attributes = {
+            payload_class: _get_payload_attributes(payload_class) for payload_class in payload_classes_discriminants
+        }
+
+    def set_variants(
+        self, variants: dict[int, list[tuple[str, TypeCodec]]], names_to_discriminants: dict[str, int]
+    ) -> None:
+        self.variants = variants
+        self.names_to_discriminants = names_to_discriminants
+
+        # When more names share a discriminant, `EnumValue.get_payload()` ends up using the last one.
+        self.discriminants_to_names = {}
+        for name, discriminant in names_to_discriminants.items():
+            self.discriminants_to_names[discriminant] = name
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, EnumValue):
+            _encode_value_object(value, buffer, top_level=False)
+            return
+
+        discriminant, fields, native_fields = self._split_native_value(value)
+        buffer += discriminant.to_bytes(1, byteorder="big", signed=False)
+
+        self._encode_fields(fields, native_fields, buffer)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        if isinstance(value, EnumValue):
+            _encode_value_object(value, buffer, top_level=True)
+            return
+
+        discriminant, fields, native_fields = self._split_native_value(value)
+
+        if discriminant == 0 and len(fields) == 0:
+            # Write nothing
+            return
+
+        buffer += discriminant.to_bytes(1, byteorder="big", signed=False)
+
+        self._encode_fields(fields, native_fields, buffer)
+
+    def _encode_fields(self, fields: list[tuple[str, TypeCodec]], native_fields: Any, buffer: bytearray) -> None:
+        if isinstance(native_fields, dict):
+            _encode_fields_from_dictionary(fields, native_fields, buffer)
+        elif native_fields is not None:
+            _encode_fields_from_list(fields, native_fields, buffer)
+
+    def _split_native_value(self, value: Any) -> tuple[int, list[tuple[str, TypeCodec]], Any]:
+        """
+        Returns the discriminant, the fields of the variant and the values of the fields (a dictionary, a list, or None).
+        """
+        discriminant = self.payload_classes_discriminants.get(type(value))
+        if discriminant is not None:
+            attributes = self.payload_classes_attributes[type(value)]
+            return discriminant, self._get_fields(discriminant), [getattr(value, name) for name in attributes]
+
+        if isinstance(value, int):
+            if self._get_fields(value):
+                raise ValueError(
+                    "for enums, if the native object is a mere integer, it must be the discriminant, and the corresponding enum variant must have no fields"
+                )
+
+            return value, [], None
+
+        if isinstance(value, str):
+            discriminant = self.names_to_discriminants[value]
+            if self._get_fields(discriminant):
+                raise ValueError(
+                    "for enums, if the native object is a mere string, it must be the name of the variant, and the corresponding enum variant must have no fields"
+                )
+
+            return discriminant, [], None
+
+        native_dictionary, ok = convert_native_value_to_dictionary(value, raise_on_failure=False)
+        if ok:
+            if ENUM_DISCRIMINANT_FIELD_NAME in native_dictionary:
+                discriminant = int(native_dictionary[ENUM_DISCRIMINANT_FIELD_NAME])
+            elif ENUM_NAME_FIELD_NAME in native_dictionary:
+                discriminant = self.names_to_discriminants[native_dictionary[ENUM_NAME_FIELD_NAME]]
+            else:
+                raise ValueError(
+                    "for enums, the native object (when it's a dictionary) must contain the special field "
+                    f"'{ENUM_DISCRIMINANT_FIELD_NAME}' or '{ENUM_NAME_FIELD_NAME}'"
+                )
+
+            return discriminant, self._get_fields(discriminant), native_dictionary
+
+        native_list, ok = convert_native_value_to_list(value, raise_on_failure=False)
+        if ok:
+            if len(native_list) == 0:
+                raise ValueError(
+                    "for enums, the native object (when it's a list) must have the discriminant or "
+                    "the name as the first element"
+                )
+            if isinstance(native_list[0], int):
+                discriminant = int(native_list[0])
+            elif isinstance(native_list[0], str):
+                discriminant = self.names_to_discriminants[native_list[0]]
+            else:
+                raise ValueError(
+                    "for enums, the native object (when it's a list) must have the discriminant (int) or the "
+                    f"name (str) as the first element, found {type(native_list[0])}"
+                )
+
+            return discriminant, self._get_fields(discriminant), native_list[1:]
+
+        raise ValueError("cannot set payload for enum (should be either a dictionary or a list)")
+
+    def _get_fields(self, discriminant: int) -> list[tuple[str, TypeCodec]]:
+        fields = self.variants.get(discriminant)
+
+        if fields is None:
+            raise ValueError(
+                f"cannot provide fields from enum {self.enum_name}: variant with discriminant {discriminant} not found"
+            )
+
+        return fields
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        _ensure_can_read(data, offset, 1)
+        discriminant = data[offset]
+        fields = self._get_fields(discriminant)
+
+        decode_payload = self._payload_decoders.get(discriminant)
+        if decode_payload is not None:
+            return decode_payload(data, offset + 1)
+
+        values, offset = _decode_fields(fields, data, offset + 1)
+        return self._create_payload(discriminant, values), offset
+
+    def decode_top_level(self, data: bytes) -> Any:
+        if len(data) == 0:
+            return self._create_payload(0, {})
+
+        value, _ = self.decode_nested(data, 0)
+        return value
+
+    def _create_payload(self, discriminant: int, values: dict[str, Any]) -> Any:
+        payload_class = self.payload_classes.get(discriminant)
+        if payload_class is not None:
+            return payload_class(*values.values())
+
+        obj = _EnumPayload(**values)
+        setattr(obj, ENUM_DISCRIMINANT_FIELD_NAME, discriminant)
+
+        name = self.discriminants_to_names.get(discriminant)
+        if name is not None:
+            setattr(obj, ENUM_NAME_FIELD_NAME, name)
+
+        return obj
+
+
+class PrototypeCodec(TypeCodec):
+    """
+    Delegates to a value object (a prototype), for the types without a specialized codec (e.g. managed decimals).
+    """
+
+    def __init__(self, create_prototype: Callable[[], Any]) -> None:
+        self.create_prototype = create_prototype
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return type(self.create_prototype()).__name__
+
+    def encode_nested(self, value: Any, buffer: bytearray) -> None:
+        prototype = self.create_prototype()
+        prototype.set_payload(value)
+        _encode_value_object(prototype, buffer, top_level=False)
+
+    def encode_top_level(self, value: Any, buffer: bytearray) -> None:
+        prototype = self.create_prototype()
+        prototype.set_payload(value)
+        _encode_value_object(prototype, buffer, top_level=True)
+
+    def decode_nested(self, data: bytes, offset: int) -> tuple[Any, int]:
+        prototype = self.create_prototype()
+        reader = io.BytesIO(data)
+        reader.seek(offset)
+        prototype.decode_nested(reader)
+        return prototype.get_payload(), reader.tell()
+
+    def decode_top_level(self, data: bytes) -> Any:
+        prototype = self.create_prototype()
+        prototype.decode_top_level(data)
+        return prototype.get_payload()
+
+
+class ParameterCodec(ABC):
+    """
+    Encodes (and decodes) an input or output parameter of an endpoint, which may span several parts
+    (e.g. optional, variadic or multi-values), as done by `Serializer`.
+    """
+
+    @abstractmethod
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        pass
+
+    @abstractmethod
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        """Decodes a value starting at the given part. Returns the value and the index of the next part."""
+        pass
+
+
+class SingleValueParameterCodec(ParameterCodec):
+    def __init__(self, codec: TypeCodec) -> None:
+        self.codec = codec
+
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        buffer = bytearray()
+        self.codec.encode_top_level(value, buffer)
+        parts.append(bytes(buffer))
+
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        if index >= len(parts):
+            raise ValueError(f"cannot wholly read part {index}: unexpected end of data")
+
+        try:
+            value = self.codec.decode_top_level(parts[index])
+        except ValueError as e:
+            raise ValueError(f"cannot decode (top-level) {self.codec.name}, because of: {e}")
+
+        return value, index + 1
+
+    def encode_many(self, values: list[Any], parts: list[bytes]) -> None:
+        """Encodes each of the given values, as a separate part."""
+        parts.extend(self.codec.encode_many_top_level(values))
+
+    def decode_many(self, parts: Sequence[bytes], numpy_array: bool) -> Any:
+        """Decodes each of the given parts (as a list, or, for fixed-size types, optionally as a NumPy array)."""
+        try:
+            if numpy_array and isinstance(self.codec, FixedSizeTypeCodec):
+                return self.codec.decode_array_top_level(parts)
+            return self.codec.decode_many_top_level(parts)
+        except ValueError as e:
+            raise ValueError(f"cannot decode (top-level) {self.codec.name}, because of: {e}")
+
+
+class OptionalParameterCodec(ParameterCodec):
+    def __init__(self, inner: ParameterCodec) -> None:
+        self.inner = inner
+
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        if not is_last:
+            # Usage of multiple optional values is not recommended:
+            # https://docs.multiversx.com/developers/data/multi-values
+            # Thus, here, we disallow them.
+            raise ValueError("an optional value must be last among input values")
+
+        if isinstance(value, OptionalValue):
+            parts.extend(_serializer.serialize_to_parts([value]))
+        elif value is not None:
+            self.inner.encode_parts(value, parts, True)
+
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        if not is_last:
+            raise ValueError("an optional value must be last among output values")
+
+        if index >= len(parts):
+            return None, index
+
+        return self.inner.decode_parts(parts, index, True)
+
+
+class MultiParameterCodec(ParameterCodec):
+    def __init__(self, items: list[ParameterCodec]) -> None:
+        self.items = items
+
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        if isinstance(value, MultiValue):
+            parts.extend(_serializer.serialize_to_parts(value.items))
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+
+        if len(native_items) != len(self.items):
+            raise ValueError(f"for multi-value, expected {len(self.items)} items, got {len(native_items)}")
+
+        last_index = len(self.items) - 1
+
+        for i, (item, native_item) in enumerate(zip(self.items, native_items)):
+            item.encode_parts(native_item, parts, i == last_index)
+
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        values: list[Any] = []
+        last_index = len(self.items) - 1
+
+        for i, item in enumerate(self.items):
+            value, index = item.decode_parts(parts, index, i == last_index)
+            values.append(value)
+
+        return values, index
+
+
+class VariadicParameterCodec(ParameterCodec):
+    def __init__(self, item: ParameterCodec, numpy_arrays: bool = False) -> None:
+        self.item = item
+        # Variadic single values (one per part) are encoded and decoded in bulk.
+        self.single_value_item = item if isinstance(item, SingleValueParameterCodec) else None
+        self.numpy_arrays = (
+            numpy_arrays and isinstance(item, SingleValueParameterCodec) and isinstance(item.codec, FixedSizeTypeCodec)
+        )
+
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        if not is_last:
+            raise ValueError("variadic values must be last among input values")
+
+        if isinstance(value, VariadicValues):
+            parts.extend(_serializer.serialize_to_parts(value.items))
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+
+        if self.single_value_item:
+            self.single_value_item.encode_many(native_items, parts)
+            return
+
+        encode_item = self.item.encode_parts
+
+        for native_item in native_items:
+            encode_item(native_item, parts, True)
+
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        if not is_last:
+            raise ValueError("variadic values must be last among output values")
+
+        if self.single_value_item:
+            return self.single_value_item.decode_many(parts[index:], self.numpy_arrays), len(parts)
+
+        decode_item = self.item.decode_parts
+        values: list[Any] = []
+
+        while index < len(parts):
+            value, index = decode_item(parts, index, True)
+            values.append(value)
+
+        return values, index
+
+
+class CountedVariadicParameterCodec(ParameterCodec):
+    def __init__(self, item: ParameterCodec, numpy_arrays: bool = False) -> None:
+        self.item = item
+        self.length_codec = SingleValueParameterCodec(SmallUIntCodec(4, "U32Value"))
+        # Counted-variadic single values (one per part) are encoded and decoded in bulk.
+        self.single_value_item = item if isinstance(item, SingleValueParameterCodec) else None
+        self.numpy_arrays = (
+            numpy_arrays and isinstance(item, SingleValueParameterCodec) and isinstance(item.codec, FixedSizeTypeCodec)
+        )
+
+    def encode_parts(self, value: Any, parts: list[bytes], is_last: bool) -> None:
+        if isinstance(value, CountedVariadicValues):
+            parts.extend(_serializer.serialize_to_parts([value]))
+            return
+
+        native_items, _ = convert_native_value_to_list(value)
+        self.length_codec.encode_parts(len(native_items), parts, True)
+
+        if self.single_value_item:
+            self.single_value_item.encode_many(native_items, parts)
+            return
+
+        for native_item in native_items:
+            self.item.encode_parts(native_item, parts, True)
+
+    def decode_parts(self, parts: Sequence[bytes], index: int, is_last: bool) -> tuple[Any, int]:
+        length, index = self.length_codec.decode_parts(parts, index, True)
+        end = index + length
+
+        if self.single_value_item and end <= len(parts):
+            return self.single_value_item.decode_many(parts[index:end], self.numpy_arrays), end
+
+        values: list[Any] = []
+
+        for _ in range(length):
+            value, index = self.item.decode_parts(parts, index, True)
+            values.append(value)
+
+        return values, index
+
+
+class EndpointCodec:
+    """
+    The compiled counterpart of an endpoint prototype: encodes the input parameters and decodes the output parameters,
+    without creating any value objects.
+    """
+
+    def __init__(self, name: str, inputs: list[ParameterCodec], outputs: list[ParameterCodec]) -> None:
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def encode_inputs(self, values: Sequence[Any]) -> list[bytes]:
+        if len(values) != len(self.inputs):
+            raise ValueError(f"for {self.name}, invalid value length: expected {len(self.inputs)}, got {len(values)}")
+
+        return encode_parameters(self.inputs, values)
+
+    def decode_outputs(self, parts: Sequence[bytes]) -> list[Any]:
+        return decode_parameters(self.outputs, parts)
+
+    def decode_outputs_columnar(self, many_parts: Sequence[Sequence[bytes]], numpy_arrays: bool = False) -> list[Any]:
+        """Decodes the outputs of many calls (see `decode_parameters_columnar()`). Returns one column per output."""
+        return decode_parameters_columnar(self.outputs, many_parts, numpy_arrays)
+
+
+class EventCodec:
+    """
+    The compiled counterpart of an event prototype: decodes the indexed inputs (from the topics)
+    and the non-indexed inputs (from the additional data), without creating any value objects.
+    """
+
+    def __init__(
+        self,
+        identifier: str,
+        indexed_inputs: list[tuple[str, ParameterCodec]],
+        non_indexed_inputs: list[tuple[str, ParameterCodec]],
+        payload_class: Optional[type] = None,
+    ) -> None:
+        self.identifier = identifier
+        self.payload_class = payload_class
+        self.indexed_names = [name for name, _ in indexed_inputs]
+        self.indexed_codecs = [codec for _, codec in indexed_inputs]
+        self.non_indexed_names = [name for name, _ in non_indexed_inputs]
+        self.non_indexed_codecs = [codec for _, codec in non_indexed_inputs]
+        self.names = self.indexed_names + self.non_indexed_names
+
+    def decode(self, topics: Sequence[bytes], additional_data: Sequence[bytes]) -> Any:
+        if self.payload_class is not None:
+            # The indexed inputs come first, then the non-indexed ones (see `payload_class`).
+            return self.payload_class(
+                *decode_parameters(self.indexed_codecs, topics),
+                *decode_parameters(self.non_indexed_codecs, additional_data),
+            )
+
+        return SimpleNamespace(**self.decode_to_dictionary(topics, additional_data))
+
+    def decode_to_dictionary(self, topics: Sequence[bytes], additional_data: Sequence[bytes]) -> dict[str, Any]:
+        values = dict(zip(self.indexed_names, decode_parameters(self.indexed_codecs, topics)))
+        values.update(zip(self.non_indexed_names, decode_parameters(self.non_indexed_codecs, additional_data)))
+        return values
+
+    def decode_columnar(
+        self, events: Sequence[tuple[Sequence[bytes], Sequence[bytes]]], numpy_arrays: bool = False
+    ) -> dict[str, Any]:
+        """Decodes many events (see `decode_parameters_columnar()`). Returns one column per field, by field name."""
+        many_topics = [topics for topics, _ in events]
+        many_additional_data = [additional_data for _, additional_data in events]
+
+        columns = dict(
+            zip(self.indexed_names, decode_parameters_columnar(self.indexed_codecs, many_topics, numpy_arrays))
+        )
+        columns.update(
+            zip(
+                self.non_indexed_names,
+                decode_parameters_columnar(self.non_indexed_codecs, many_additional_data, numpy_arrays),
+            )
+        )
+        return columns
+
+
+def encode_parameters(codecs: list[ParameterCodec], values: Sequence[Any]) -> list[bytes]:
+    parts: list[bytes] = []
+    last_index = len(codecs) - 1
+
+    for i, (codec, value) in enumerate(zip(codecs, values)):
+        codec.encode_parts(value, parts, i == last_index)
+
+    return parts
+
+
+def decode_parameters(codecs: list[ParameterCodec], parts: Sequence[bytes]) -> list[Any]:
+    values: list[Any] = []
+    last_index = len(codecs) - 1
+    index = 0
+
+    for i, codec in enumerate(codecs):
+        value, index = codec.decode_parts(parts, index, i == last_index)
+        values.append(value)
+
+    if index < len(parts):
+        raise Exception("not all parts have been deserialized")
+
+    return values
+
+
+def decode_parameters_columnar(
+    codecs: list[ParameterCodec], many_parts: Sequence[Sequence[bytes]], numpy_arrays: bool = False
+) -> list[Any]:
+    """
+    Decodes many sequences of parts (e.g. the return data of many calls of the same endpoint), against the same parameters.
+    Returns the values of each parameter as a column (a list, in the order of the sequences of parts).
+
+    When all the parameters are single values (one part each), the parts are decoded in bulk, column by column.
+    If `numpy_arrays` is set, the columns of fixed-size integers (e.g. u32, i64) are returned as NumPy arrays.
+    """
+    single_value_codecs = [codec for codec in codecs if isinstance(codec, SingleValueParameterCodec)]
+    # The NumPy data types of the columns (only for fixed-size integers).
+    dtypes = [_get_numpy_column_dtype(codec) if numpy_arrays else None for codec in codecs]
+
+    if len(single_value_codecs) == len(codecs) and all(len(parts) == len(codecs) for parts in many_parts):
+        columns_of_parts: list[Sequence[bytes]] = list(zip(*many_parts)) if many_parts else [[] for _ in codecs]
+        return [
+            codec.decode_many(column_of_parts, dtype is not None)
+            for codec, column_of_parts, dtype in zip(single_value_codecs, columns_of_parts, dtypes)
+        ]
+
+    # Otherwise (e.g. optional or variadic parameters), the sequences of parts are decoded one by one.
+    rows = [decode_parameters(codecs, parts) for parts in many_parts]
+    columns: list[Any] = [list(column) for column in zip(*rows)] if rows else [[] for _ in codecs]
+
+    for i, dtype in enumerate(dtypes):
+        if dtype is not None:
+            columns[i] = import_numpy().array(columns[i], dtype=dtype)
+
+    return columns
+
+
+def _get_numpy_column_dtype(codec: ParameterCodec) -> Optional[str]:
+    if isinstance(codec, SingleValueParameterCodec) and isinstance(codec.codec, FixedSizeIntegerCodec):
+        return codec.codec.dtype
+    return None
+
+
+class PayloadClasses:
+    """
+    Classes to decode the custom types and the events into (e.g. generated dataclasses, see `codegen`),
+    instead of `SimpleNamespace` objects. The classes are constructed positionally: their attributes must follow
+    the order of the fields in the ABI (for events: the indexed inputs first, then the non-indexed ones).
+
+    Args:
+        structs: the classes of the structs, by struct name
+        enum_variants: the classes of the enum variants, by enum name, then by variant name
+        events: the classes of the events, by event identifier
+    """
+
+    def __init__(
+        self,
+        structs: Optional[dict[str, type]] = None,
+        enum_variants: Optional[dict[str, dict[str, type]]] = None,
+        events: Optional[dict[str, type]] = None,
+    ) -> None:
+        self.structs = structs or {}
+        self.enum_variants = enum_variants or {}
+        self.events = events or {}
+
+
+class CodecsCompiler:
+    """
+    Compiles the types of an ABI into codecs. Custom types are compiled once (recursive types are supported).
+    Types that do not have a specialized codec are handled by their value objects, created by `create_prototype`.
+
+    If `numpy_arrays` is set, collections (lists, arrays, variadic values) of fixed-size items (e.g. u64, Address)
+    are decoded as NumPy arrays, instead of lists.
+
+    If `payload_classes` are given, structs, enum variants and events are decoded into (and encoded from)
+    instances of these classes.
+    """
+
+    def __init__(
+        self,
+        definition: AbiDefinition,
+        type_formula_parser: TypeFormulaParser,
+        create_prototype: Callable[[TypeFormula], Any],
+        numpy_arrays: bool = False,
+        payload_classes: Optional[PayloadClasses] = None,
+    ) -> None:
+        self.definition = definition
+        self.type_formula_parser = type_formula_parser
+        self.create_prototype = create_prototype
+        self.numpy_arrays = numpy_arrays
+        self.payload_classes = payload_classes or PayloadClasses()
+        self.custom_types_codecs_by_name: dict[str, TypeCodec] = {}
+
+    def compile_endpoint(self, name: str, inputs: list[str], outputs: list[str]) -> EndpointCodec:
+        return EndpointCodec(
+            name=name,
+            inputs=[self.compile_parameter(expression) for expression in inputs],
+            outputs=[self.compile_parameter(expression) for expression in outputs],
+        )
+
+    def compile_event(self, event: EventDefinition) -> EventCodec:
+        return EventCodec(
+            identifier=event.identifier,
+            indexed_inputs=[(item.name, self.compile_parameter(item.type)) for item in event.inputs if item.indexed],
+            non_indexed_inputs=[
+                (item.name, self.compile_parameter(item.type)) for item in event.inputs if not item.indexed
+            ],
+            payload_class=self.payload_classes.events.get(event.identifier),
+        )
+
+    def compile_parameter(self, type_expression: str) -> ParameterCodec:
+        type_formula = self.type_formula_parser.parse_expression(type_expression)
+        return self._compile_parameter(type_formula)
+
+    def _compile_parameter(self, type_formula: TypeFormula) -> ParameterCodec:
+        name = type_formula.name
+        type_parameters = type_formula.type_parameters
+
+        if name == "optional":
+            return OptionalParameterCodec(self._compile_parameter(type_parameters[0]))
+        if name == "variadic":
+            return VariadicParameterCodec(self._compile_parameter(type_parameters[0]), self.numpy_arrays)
+        if name == "counted-variadic":
+            return CountedVariadicParameterCodec(self._compile_parameter(type_parameters[0]), self.numpy_arrays)
+        if name == "multi":
+            return MultiParameterCodec([self._compile_parameter(item) for item in type_parameters])
+
+        return SingleValueParameterCodec(self.compile_type(type_formula))
+
+    def compile_type(self, type_formula: TypeFormula) -> TypeCodec:
+        name = type_formula.name
+        type_parameters = type_formula.type_parameters
+
+        if name == "bool":
+            return BoolCodec()
+        if name == "u8":
+            return SmallUIntCodec(1, "U8Value")
+        if name == "u16":
+            return SmallUIntCodec(2, "U16Value")
+        if name == "u32":
+            return SmallUIntCodec(4, "U32Value")
+        if name == "u64":
+            return SmallUIntCodec(8, "U64Value")
+        if name == "i8":
+            return SmallIntCodec(1, "I8Value")
+        if name == "i16":
+            return SmallIntCodec(2, "I16Value")
+        if name == "i32":
+            return SmallIntCodec(4, "I32Value")
+        if name == "i64":
+            return SmallIntCodec(8, "I64Value")
+        if name == "BigUint":
+            return BigUIntCodec()
+        if name == "BigInt":
+            return BigIntCodec()
+        if name == "bytes":
+            return BytesCodec()
+        if name == "utf-8 string":
+            return StringCodec("StringValue")
+        if name == "Address":
+            return AddressCodec()
+        if name in ["TokenIdentifier", "TokenId", "EgldOrEsdtTokenIdentifier", "EsdtTokenIdentifier"]:
+            return StringCodec("TokenIdentifierValue")
+        if name == "CodeMetadata":
+            return CodeMetadataCodec()
+        if name == "tuple":
+            return TupleCodec([self.compile_type(type_parameter) for type_parameter in type_parameters])
+        if name == "Option":
+            return OptionCodec(self.compile_type(type_parameters[0]))
+        if name == "List":
+            return ListCodec(self.compile_type(type_parameters[0]), self.numpy_arrays)
+        if name.startswith("array"):
+            return ArrayCodec(self.compile_type(type_parameters[0]), int(name[5:]), self.numpy_arrays)
+
+        if name in self.definition.types.enums or name in self.definition.types.explicit_enums:
+            return self.compile_custom_type(name)
+        if name in self.definition.types.structs:
+            return self.compile_custom_type(name)
+
+        # E.g. managed decimals, or multi-values nested in single values (which are not supported by the value objects, either).
+        return PrototypeCodec(lambda: self.create_prototype(type_formula))
+
+    def compile_custom_type(self, name: str) -> TypeCodec:
+        codec = self.custom_types_codecs_by_name.get(name)
+        if codec is not None:
+            return codec
+
+        if name in self.definition.types.enums:
+            enum_codec = EnumCodec(name)
+            # Registered before compiling the variants, to support recursive types.
+            self.custom_types_codecs_by_name[name] = enum_codec
+            self._compile_enum_variants(enum_codec, self.definition.types.enums[name])
+            return enum_codec
+
+        if name in self.definition.types.explicit_enums:
+            codec = StringCodec("ExplicitEnumValue")
+            self.custom_types_codecs_by_name[name] = codec
+            return codec
+
+        if name in self.definition.types.structs:
+            struct_codec = StructCodec(payload_class=self.payload_classes.structs.get(name))
+            self.custom_types_codecs_by_name[name] = struct_codec
+            struct_codec.fields = [
+                (field.name, self.compile_type(self.type_formula_parser.parse_expression(field.type)))
+                for field in self.definition.types.structs[name].fields
+            ]
+            return struct_codec
+
+        raise ValueError(f"cannot create codec for custom type {name}: definition not found")
+
+    def _compile_enum_variants(self, codec: EnumCodec, enum_definition: EnumDefinition) -> None:
+        variants: dict[int, list[tuple[str, TypeCodec]]] = {}
+        variants_classes = self.payload_classes.enum_variants.get(codec.enum_name, {})
+        payload_classes: dict[int, type] = {}
+
+        for variant in reversed(enum_definition.variants):
+            # When more variants share a discriminant, the first one is used (as in `Abi._provide_fields_for_enum_prototype`).
+            variants[variant.discriminant] = [
+                (field.name, self.compile_type(self.type_formula_parser.parse_expression(field.type)))
+                for field in variant.fields
+            ]
+
+            payload_class = variants_classes.get(variant.name)
+            if payload_class is not None:
+                payload_classes[variant.discriminant] = payload_class
+
+        codec.set_variants(
+            variants=variants,
+            names_to_discriminants={variant.name: variant.discriminant for variant in enum_definition.variants},
+        )
+
+        if variants_classes:
+            codec.set_payload_classes(
+                payload_classes=payload_classes,
+                payload_classes_discriminants={
+                    variants_classes[variant.name]: variant.discriminant
+                    for variant in enum_definition.variants
+                    if variant.name in variants_classes
+                },
+            )
+
+
+def _encode_fields_from_dictionary(
+    fields: list[tuple[str, TypeCodec]], dictionary: dict[str, Any], buffer: bytearray
+) -> None:
+    for name, codec in fields:
+        if name not in dictionary:
+            raise ValueError(f"the dictionary is missing the key '{name}'")
+
+        _encode_field(name, codec, dictionary[name], buffer)
+
+
+def _encode_fields_from_list(fields: list[tuple[str, TypeCodec]], items: list[Any], buffer: bytearray) -> None:
+    if len(fields) != len(items):
+        raise ValueError(
+            f"the number of fields ({len(fields)}) does not match the number of provided items ({len(items)})"
+        )
+
+    for (name, codec), item in zip(fields, items):
+        _encode_field(name, codec, item, buffer)
+
+
+def _encode_field(name: str, codec: TypeCodec, value: Any, buffer: bytearray) -> None:
+    try:
+        codec.encode_nested(value, buffer)
+    except Exception as error:
+        raise ValueError(f"cannot set payload for field '{name}', because of: {error}")
+
+
+def _decode_fields(fields: list[tuple[str, TypeCodec]], data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+    values: dict[str, Any] = {}
+
+    for name, codec in fields:
+        try:
+            values[name], offset = codec.decode_nested(data, offset)
+        except Exception as e:
+            raise Exception(f"cannot decode field '{name}', because of: {e}")
+
+    return values, offset
+
+
+def _create_payload_decoder(
+    fields: list[tuple[str, TypeCodec]], payload_class: type
+) -> Callable[[bytes, int], tuple[Any, int]]:
+    """
+    Creates a function that decodes the fields (unrolled, one statement per field) into an instance of the payload class.
+    On errors, the fields are decoded again (one by one), to report the failing field.
+    """
+    statements = [f"    value_{i}, offset = decode_{i}(data, offset)" for i in range(len(fields))] or ["    pass"]
+    arguments = ", ".join(f"value_{i}" for i in range(len(fields)))
+    source = "\n".join(
+        [
+            "def decode_payload(data, offset):",
+            "    start = offset",
+            "    try:",
+            *[f"    {statement}" for statement in statements],
+            "    except Exception:",
+            "        _decode_fields(fields, data, start)",
+            "        raise",
+            f"    return payload_class({arguments}), offset",
+        ]
+    )
+
+    namespace: dict[str, Any] = {"fields": fields, "payload_class": payload_class, "_decode_fields": _decode_fields}
+    namespace.update({f"decode_{i}": codec.decode_nested for i, (_, codec) in enumerate(fields)})
+    exec(source, namespace)
+    return namespace["decode_payload"]
+
+
+def _get_payload_attributes(payload_class: Optional[type]) -> list[str]:
+    if payload_class is None:
+        return []
+
+    if dataclasses.is_dataclass(payload_class):
+        return [field.name for field in dataclasses.fields(payload_class)]
+
+    return list(getattr(payload_class, "__slots__", []))
+
+
+def _encode_value_object(value: Any, buffer: bytearray, top_level: bool) -> None:
+    writer = io.BytesIO()
+
+    if top_level:
+        value.encode_top_level(writer)
+    else:
+        value.encode_nested(writer)
+
+    # (the written data is appended without an intermediate copy, as opposed to "getvalue()")
+    with writer.getbuffer() as data:
+        buffer += data
+
+
+def _ensure_can_read(data: bytes, offset: int, num_bytes: int) -> int:
+    end = offset + num_bytes
+
+    if end > len(data):
+        raise ValueError(f"cannot read exactly {num_bytes} bytes")
+
+    return end
+
+
+def _read_length(data: bytes, offset: int) -> tuple[int, int]:
+    _ensure_can_read(data, offset, 4)
+    (length,) = UINT32.unpack_from(data, offset)
+    return length, offset + 4
+
+
+def _decode_many_big_integers(data: bytes, offset: int, count: Optional[int], signed: bool) -> tuple[list[int], int]:
+    """
+    Decodes `count` (nested) big integers, each prefixed by its length, starting at the given offset.
+    If `count` is not given, the integers are decoded until the end of the data.
+    """
+    unpack_length = UINT32.unpack_from
+    from_bytes = int.from_bytes
+    data_length = len(data)
+    values: list[int] = []
+
+    while offset < data_length if count is None else len(values) < count:
+        if offset + 4 > data_length:
+            raise ValueError("cannot read exactly 4 bytes")
+
+        (length,) = unpack_length(data, offset)
+        offset += 4
+        end = offset + length
+
+        if end > data_length:
+            raise ValueError(f"cannot read exactly {length} bytes")
+
+        values.append(from_bytes(data[offset:end], "big", signed=signed))
+        offset = end
+
+    return values, offset
+
+
+def _byte_to_bool(data: int) -> bool:
+    if data == TRUE_AS_BYTE:
+        return True
+
+    if data == FALS_AS_BYTE:
+        return False
+
+    raise ValueError(f"unexpected boolean value: {data}")
+
+
+def _check_pubkey_length(pubkey: bytes) -> None:
+    if len(pubkey) != PUBKEY_LENGTH:
+        raise ValueError(f"public key (address) has invalid length: {len(pubkey)}")
+
+
+_serializer = Serializer()
@@ -0,0 +1,446 @@
+import random
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from multiversx_sdk.abi.abi import Abi
+from multiversx_sdk.abi.abi_definition import AbiDefinition
+from multiversx_sdk.abi.address_value import AddressValue
+from multiversx_sdk.abi.enum_value import EnumValue
+from multiversx_sdk.abi.fields import Field
+from multiversx_sdk.abi.small_int_values import U32Value
+from multiversx_sdk.abi.type_formula import TypeFormula
+from multiversx_sdk.abi.type_formula_parser import TypeFormulaParser
+from multiversx_sdk.abi.variadic_values import VariadicValues
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.code_metadata import CodeMetadata
+
+testdata = Path(__file__).parent.parent / "testutils" / "testdata"
+
+abi_files = [
+    "adder.abi.json",
+    "answer.abi.json",
+    "artificial.abi.json",
+    "counted-variadic.abi.json",
+    "esdt-safe.abi.json",
+    "lottery-esdt.abi.json",
+    "multisig-full.abi.json",
+]
+
+
+class NativeValuesGenerator:
+    """Generates random native values (as accepted by `set_payload()`) for the types of an ABI."""
+
+    def __init__(self, definition: AbiDefinition, seed: int) -> None:
+        self.definition = definition
+        self.parser = TypeFormulaParser()
+        self.random = random.Random(seed)
+
+    def generate(self, type_expression: str) -> Any:
+        return self._generate(self.parser.parse_expression(type_expression), depth=0)
+
+    def _generate(self, type_formula: TypeFormula, depth: int) -> Any:
+        name = type_formula.name
+        type_parameters = type_formula.type_parameters
+        rand = self.random
+
+        if name == "bool":
+            return rand.choice([True, False])
+        if name in ["u8", "u16", "u32", "u64"]:
+            return rand.choice([0, rand.randrange(2 ** int(name[1:]))])
+        if name in ["i8", "i16", "i32", "i64"]:
+            bound = 2 ** (int(name[1:]) - 1)
+            return rand.choice([0, -1, rand.randrange(-bound, bound)])
+        if name == "BigUint":
+            return rand.choice([0, 1, rand.randrange(2**256)])
+        if name == "BigInt":
+            return rand.choice([0, -1, 127, -128, rand.randrange(-(2**255), 2**255)])
+        if name == "bytes":
+            return rand.randbytes(rand.randrange(12))
+        if name in ["utf-8 string", "TokenIdentifier", "TokenId", "EgldOrEsdtTokenIdentifier", "EsdtTokenIdentifier"]:
+            return rand.choice(["", "EGLD", "TEST-8b028f", "hello world"])
+        if name == "Address":
+            pubkey = rand.randbytes(32)
+            return rand.choice([pubkey, Address(pubkey, "erd"), Address(pubkey, "erd").to_bech32()])
+        if name == "CodeMetadata":
+            return CodeMetadata(
+                upgradeable=rand.choice([True, False]),
+                readable=rand.choice([True, False]),
+                payable=rand.choice([True, False]),
+            ).serialize()
+        if name in ["ManagedDecimal", "ManagedDecimalSigned"]:
+            return rand.randrange(10**12)
+        if name in ["tuple", "multi"]:
+            return [self._generate(item, depth + 1) for item in type_parameters]
+        if name in ["Option", "optional"]:
+            if depth > 3 or rand.random() < 0.3:
+                return None
+            return self._generate(type_parameters[0], depth + 1)
+        if name in ["List", "variadic", "counted-variadic"]:
+            length = 0 if depth > 3 else rand.randrange(4)
+            return [self._generate(type_parameters[0], depth + 1) for _ in range(length)]
+        if name.startswith("array"):
+            return [self._generate(type_parameters[0], depth + 1) for _ in range(int(name[5:]))]
+
+        return self._generate_custom_type(name, depth)
+
+    def _generate_custom_type(self, name: str, depth: int) -> Any:
+        types = self.definition.types
+        rand = self.random
+
+        if name in types.enums:
+            variant = rand.choice(types.enums[name].variants)
+            fields = {
+                field.name: self._generate(self.parser.parse_expression(field.type), depth + 1)
+                for field in variant.fields
+            }
+
+            if not fields:
+                return rand.choice([variant.discriminant, variant.name, {"__name__": variant.name}])
+            if rand.random() < 0.5:
+                return [variant.name, *fields.values()]
+            return {"__discriminant__": variant.discriminant, **fields}
+
+        if name in types.explicit_enums:
+            return rand.choice(types.explicit_enums[name].variants).name
+
+        if name in types.structs:
+            fields = {
+                field.name: self._generate(self.parser.parse_expression(field.type), depth + 1)
+                for field in types.structs[name].fields
+            }
+            return fields if rand.random() < 0.5 else list(fields.values())
+
+        raise ValueError(f"unknown type: {name}")
+
+
+def encode_with_prototypes(abi: Abi, prototypes: list[Any], values: list[Any]) -> list[bytes]:
+    """The reference path: populates (copies of) the prototypes, then serializes them."""
+    input_values = deepcopy(prototypes)
+
+    for input_value, value in zip(input_values, values):
+        input_value.set_payload(value)
+
+    return abi._serializer.serialize_to_parts(input_values)
+
+
+def decode_with_prototypes(abi: Abi, prototypes: list[Any], parts: list[bytes]) -> list[Any]:
+    output_values = deepcopy(prototypes)
+    abi._serializer.deserialize_parts(parts, output_values)
+    return [value.get_payload() for value in output_values]
+
+
+@pytest.mark.parametrize("abi_file", abi_files)
+def test_endpoints_codecs_match_prototypes(abi_file: str):
+    abi = Abi.load(testdata / abi_file)
+    endpoints = [abi.definition.constructor, abi.definition.upgrade_constructor, *abi.definition.endpoints]
+    prototypes = [abi.constructor_prototype, abi.upgrade_constructor_prototype]
+    prototypes += [abi.endpoints_prototypes_by_name[endpoint.name] for endpoint in abi.definition.endpoints]
+
+    for seed in range(20):
+        generator = NativeValuesGenerator(abi.definition, seed)
+
+        for endpoint, prototype in zip(endpoints, prototypes):
+            inputs = [generator.generate(parameter.type) for parameter in endpoint.inputs]
+            expected_inputs = encode_with_prototypes(abi, prototype.input_parameters, inputs)
+
+            if endpoint is abi.definition.constructor:
+                assert abi.encode_constructor_input_parameters(inputs) == expected_inputs
+            elif endpoint is abi.definition.upgrade_constructor:
+                assert abi.encode_upgrade_constructor_input_parameters(inputs) == expected_inputs
+            else:
+                assert abi.encode_endpoint_input_parameters(endpoint.name, inputs) == expected_inputs
+
+            outputs = [generator.generate(parameter.type) for parameter in endpoint.outputs]
+            parts = encode_with_prototypes(abi, prototype.output_parameters, outputs)
+            expected_outputs = decode_with_prototypes(abi, prototype.output_parameters, parts)
+
+            if endpoint in abi.definition.endpoints:
+                assert abi.decode_endpoint_output_parameters(endpoint.name, parts) == expected_outputs
+
+
+@pytest.mark.parametrize("abi_file", abi_files)
+def test_custom_types_codecs_match_prototypes(abi_file: str):
+    abi = Abi.load(testdata / abi_file)
+
+    for seed in range(20):
+        generator = NativeValuesGenerator(abi.definition, seed)
+
+        for name, prototype in abi.custom_types_prototypes_by_name.items():
+            value = generator.generate(name)
+
+            expected = deepcopy(prototype)
+            expected.set_payload(value)
+            encoded = abi.encode_custom_type(name, value)
+            assert encoded == abi._serializer.serialize([expected])
+
+            data = bytes.fromhex(encoded)
+            expected = deepcopy(prototype)
+            expected.decode_top_level(data)
+            assert abi.decode_custom_type(name, data) == expected.get_payload()
+
+
+@pytest.mark.parametrize("abi_file", abi_files)
+def test_events_codecs_match_prototypes(abi_file: str):
+    abi = Abi.load(testdata / abi_file)
+
+    for seed in range(20):
+        generator = NativeValuesGenerator(abi.definition, seed)
+
+        for event in abi.definition.events:
+            fields = abi.events_prototypes_by_name[event.identifier].fields
+            indexed = [field.value for field, item in zip(fields, event.inputs) if item.indexed]
+            non_indexed = [field.value for field, item in zip(fields, event.inputs) if not item.indexed]
+
+            topics = encode_with_prototypes(
+                abi, indexed, [generator.generate(item.type) for item in event.inputs if item.indexed]
+            )
+            additional_data = encode_with_prototypes(
+                abi, non_indexed, [generator.generate(item.type) for item in event.inputs if not item.indexed]
+            )
+
+            names = [item.name for item in event.inputs if item.indexed]
+            names += [item.name for item in event.inputs if not item.indexed]
+            values = decode_with_prototypes(abi, indexed, topics) + decode_with_prototypes(
+                abi, non_indexed, additional_data
+            )
+            expected = SimpleNamespace(**dict(zip(names, values)))
+
+            assert abi.decode_event(event.identifier, topics, additional_data) == expected
+            assert abi.decode_events(event.identifier, [(topics, additional_data)] * 2) == [expected, expected]
+            assert abi.decode_events_columnar(event.identifier, [(topics, additional_data)] * 2) == {
+                name: [value, value] for name, value in zip(names, values)
+            }
+
+
+def test_fixed_size_collections():
+    outputs = [
+        "List<u64>",
+        "array4<u8>",
+        "List<Address>",
+        "List<i16>",
+        "counted-variadic<u32>",
+        "variadic<Address>",
+    ]
+
+    abi = Abi(
+        AbiDefinition.from_dict(
+            {
+                "endpoints": [
+                    {"name": "get", "inputs": [], "outputs": [{"type": output} for output in outputs]},
+                    {"name": "set", "inputs": [{"type": output} for output in outputs], "outputs": []},
+                ],
+                "types": {},
+            }
+        )
+    )
+
+    prototypes = abi.endpoints_prototypes_by_name["get"].output_parameters
+    generator = random.Random(42)
+    addresses = [generator.randbytes(32) for _ in range(300)]
+    values = [
+        [generator.randrange(2**64) for _ in range(1000)],
+        [0, 1, 254, 255],
+        addresses[:100],
+        [generator.randrange(-(2**15), 2**15) for _ in range(1000)],
+        [generator.randrange(2**32) for _ in range(100)],
+        addresses[100:],
+    ]
+
+    parts = encode_with_prototypes(abi, prototypes, values)
+    assert abi.encode_endpoint_input_parameters("set", values) == parts
+    assert abi.decode_endpoint_output_parameters("get", parts) == decode_with_prototypes(abi, prototypes, parts)
+    assert abi.decode_endpoint_output_parameters("get", parts) == values
+
+    # Values that are convertible to integers (e.g. typed values) are handled, as well.
+    assert abi.encode_endpoint_input_parameters("set", [[U32Value(1)], *values[1:]])[0] == bytes(7) + bytes([1])
+
+    # Errors are the same as for the items decoded one by one.
+    with pytest.raises(ValueError, match="cannot read exactly 8 bytes"):
+        abi.decode_endpoint_output_parameters("get", [bytes(12), *parts[1:]])
+
+    with pytest.raises(ValueError, match="cannot read exactly 32 bytes"):
+        abi.decode_endpoint_output_parameters("get", [parts[0], parts[1], bytes(33), *parts[3:]])
+
+    with pytest.raises(ValueError, match="public key \\(address\\) has invalid length: 31"):
+        abi.decode_endpoint_output_parameters("get", [*parts[:-1], bytes(31)])
+
+    with pytest.raises(OverflowError):
+        abi.encode_endpoint_input_parameters("set", [[2**64], *values[1:]])
+
+
+def test_big_integers_collections():
+    outputs = ["List<BigUint>", "List<BigInt>", "counted-variadic<BigUint>", "variadic<BigInt>"]
+
+    abi = Abi(
+        AbiDefinition.from_dict(
+            {
+                "endpoints": [
+                    {"name": "get", "inputs": [], "outputs": [{"type": output} for output in outputs]},
+                    {"name": "set", "inputs": [{"type": output} for output in outputs], "outputs": []},
+                ],
+                "types": {},
+            }
+        )
+    )
+
+    prototypes = abi.endpoints_prototypes_by_name["get"].output_parameters
+    generator = random.Random(42)
+    unsigned = [0, 1, 127, 128, 255, 256, 2**64, 2**520] + [generator.randrange(2**256) for _ in range(500)]
+    signed = [0, -1, 127, -128, 128, -129, -(2**64)] + [generator.randrange(-(2**255), 2**255) for _ in range(500)]
+    values = [unsigned, signed, unsigned[:100], signed[:100]]
+
+    parts = encode_with_prototypes(abi, prototypes, values)
+    assert abi.encode_endpoint_input_parameters("set", values) == parts
+    assert abi.decode_endpoint_output_parameters("get", parts) == values
+
+    # Errors are the same as for the items decoded one by one.
+    with pytest.raises(ValueError, match="cannot read exactly 4 bytes"):
+        abi.decode_endpoint_output_parameters("get", [bytes([0, 0, 0, 1, 0, 0, 0]), *parts[1:]])
+
+    with pytest.raises(ValueError, match="cannot read exactly 2 bytes"):
+        abi.decode_endpoint_output_parameters("get", [bytes([0, 0, 0, 2, 0xFF]), *parts[1:]])
+
+    with pytest.raises(OverflowError):
+        abi.encode_endpoint_input_parameters("set", [[-1], *values[1:]])
+
+
+def test_fixed_size_collections_as_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    abi = Abi(
+        AbiDefinition.from_dict(
+            {
+                "endpoints": [
+                    {
+                        "name": "get",
+                        "inputs": [],
+                        "outputs": [
+                            {"type": "List<u64>"},
+                            {"type": "List<utf-8 string>"},
+                            {"type": "variadic<Address>"},
+                        ],
+                    }
+                ],
+                "types": {},
+            }
+        )
+    )
+
+    prototypes = abi.endpoints_prototypes_by_name["get"].output_parameters
+    parts = encode_with_prototypes(abi, prototypes, [[1, 2**64 - 1], ["a", "b"], [bytes(32), bytes([1] * 32)]])
+
+    numbers, strings, addresses = abi.decode_endpoint_output_parameters("get", parts, numpy_arrays=True)
+    assert numbers.dtype == np.uint64
+    assert numbers.tolist() == [1, 2**64 - 1]
+    assert strings == ["a", "b"]
+    assert addresses.shape == (2, 32)
+    assert addresses[1].tobytes() == bytes([1] * 32)
+
+    # The lists are still available.
+    assert abi.decode_endpoint_output_parameters("get", parts)[0] == [1, 2**64 - 1]
+
+
+def test_decode_columnar():
+    np = pytest.importorskip("numpy")
+
+    abi = Abi(
+        AbiDefinition.from_dict(
+            {
+                "endpoints": [
+                    {
+                        "name": "get",
+                        "inputs": [],
+                        "outputs": [{"type": "u64"}, {"name": "label", "type": "utf-8 string"}, {"type": "i8"}],
+                    },
+                    {"name": "getMany", "inputs": [], "outputs": [{"type": "u32"}, {"type": "variadic<u32>"}]},
+                ],
+                "events": [
+                    {
+                        "identifier": "deposit",
+                        "inputs": [
+                            {"name": "amount", "type": "BigUint", "indexed": True},
+                            {"name": "nonce", "type": "u16", "indexed": True},
+                            {"name": "note", "type": "optional<bytes>"},
+                        ],
+                    }
+                ],
+                "types": {},
+            }
+        )
+    )
+
+    responses = [[i.to_bytes(2, "big"), f"#{i}".encode(), bytes([0xFF]) if i % 2 else b""] for i in range(300)]
+    expected = [abi.decode_endpoint_output_parameters("get", response) for response in responses]
+
+    columns = abi.decode_endpoint_outputs_columnar("get", responses)
+    assert columns == {"0": [row[0] for row in expected], "label": [row[1] for row in expected], "2": [0, -1] * 150}
+
+    columns = abi.decode_endpoint_outputs_columnar("get", responses, numpy_arrays=True)
+    assert columns["0"].dtype == np.uint64 and columns["0"].tolist() == list(range(300))
+    assert columns["label"][42] == "#42"
+    assert columns["2"].dtype == np.int8 and columns["2"].tolist() == [0, -1] * 150
+
+    # Not only single values (decoded one by one, then arranged as columns).
+    columns = abi.decode_endpoint_outputs_columnar("getMany", [[bytes([1]), bytes([2]), bytes([3])], [b""]], True)
+    assert columns["0"].tolist() == [1, 0]
+    assert columns["1"] == [[2, 3], []]
+
+    events = [([bytes([7]), bytes([0, 1])], [b"abc"]), ([bytes([8]), bytes([0, 2])], [])]
+    columns = abi.decode_events_columnar("deposit", events, numpy_arrays=True)
+    assert columns["amount"] == [7, 8]
+    assert columns["nonce"].dtype == np.uint16 and columns["nonce"].tolist() == [1, 2]
+    assert columns["note"] == [b"abc", None]
+
+    assert abi.decode_endpoint_outputs_columnar("get", []) == {"0": [], "label": [], "2": []}
+
+    # Errors are the same as for the calls decoded one by one.
+    with pytest.raises(Exception, match="not all parts have been deserialized"):
+        abi.decode_endpoint_outputs_columnar("get", [*responses, [b"", b"", b"", b""]])
+
+    with pytest.raises(ValueError, match="does not fit into 1 byte"):
+        abi.decode_endpoint_outputs_columnar("get", [*responses, [b"", b"", bytes([1, 0])]])
+
+
+def test_encode_typed_values():
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+
+    # Typed values are encoded as they are (the same as for the prototypes).
+    typed_value = EnumValue(discriminant=1, fields=[Field("0", AddressValue(bytes(32)))])
+    prototypes = abi.endpoints_prototypes_by_name["proposeBatch"].input_parameters
+    expected = encode_with_prototypes(abi, prototypes, [[typed_value]])
+    assert expected == [bytes([1]) + bytes(32)]
+    assert abi.encode_endpoint_input_parameters("proposeBatch", [[typed_value]]) == expected
+    assert abi.encode_endpoint_input_parameters("proposeBatch", [VariadicValues([typed_value])]) == expected
+
+    assert abi.encode_endpoint_input_parameters("quorumReached", [U32Value(42)]) == [bytes([42])]
+
+
+def test_errors():
+    abi = Abi.load(testdata / "multisig-full.abi.json")
+
+    with pytest.raises(ValueError, match="invalid value length: expected 1, got 2"):
+        abi.encode_endpoint_input_parameters("quorumReached", [1, 2])
+
+    with pytest.raises(ValueError, match="endpoint 'missing' not found"):
+        abi.encode_endpoint_input_parameters("missing", [])
+
+    with pytest.raises(
+        ValueError, match="cannot decode \\(top-level\\) U32Value, because of: decoded value is too large"
+    ):
+        abi.decode_endpoint_output_parameters("getQuorum", [bytes([1, 0, 0, 0, 0])])
+
+    with pytest.raises(Exception, match="not all parts have been deserialized"):
+        abi.decode_endpoint_output_parameters("getQuorum", [bytes([1]), bytes([2])])
+
+    with pytest.raises(ValueError, match="public key \\(address\\) has invalid length: 1"):
+        abi.decode_endpoint_output_parameters("getAllBoardMembers", [bytes(32), bytes([1])])
+
+    with pytest.raises(Exception, match="cannot decode field 'to', because of: cannot read exactly 32 bytes"):
+        abi.decode_custom_type("CallActionData", bytes([1, 2, 3]))
+
+    with pytest.raises(Exception, match="event \\[missing\\] not found"):
+        abi.decode_event("missing", [], [])
@@ -55,12 +55,13 @@ class OptionValue:
             return
 
         first_byte = data[0]
-        data_after_first_byte = data[1:]
 
         if first_byte != OPTION_MARKER_FOR_PRESENT_VALUE:
             raise ValueError(f"invalid first byte for top-level encoded option: {first_byte}")
 
-        reader = io.BytesIO(data_after_first_byte)
+        # (the data is not sliced, to avoid copying it)
+        reader = io.BytesIO(data)
+        reader.seek(1)
         self.value.decode_nested(reader)
 
     def set_payload(self, value: Any):
@@ -44,3 +44,16 @@ def test_set_payload_and_get_payload():
         match="placeholder value of option should be set before calling set_payload",
     ):
         OptionValue().set_payload(42)
+
+
+def test_decode_top_level():
+    value = OptionValue(StructValue([Field("a", U32Value()), Field("b", BigUIntValue())]))
+    value.decode_top_level(bytes([1, 0, 0, 0, 41, 0, 0, 0, 1, 42]))
+    assert value.get_payload() == SimpleNamespace(a=41, b=42)
+
+    value = OptionValue(U32Value())
+    value.decode_top_level(b"")
+    assert value.get_payload() is None
+
+    with pytest.raises(ValueError, match="invalid first byte for top-level encoded option: 2"):
+        OptionValue(U32Value()).decode_top_level(bytes([2, 0, 0, 0, 41]))
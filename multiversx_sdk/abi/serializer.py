@@ -1,4 +1,5 @@
-from typing import Any, Sequence
+import binascii
+from typing import Any, Sequence, Union
 
 from multiversx_sdk.abi.codec import Codec
 from multiversx_sdk.abi.counted_variadic_values import CountedVariadicValues
@@ -28,6 +29,23 @@ class Serializer:
         parts = self.serialize_to_parts(input_values)
         return self._encode_parts(parts)
 
+    def serialize_to_data(self, input_values: Sequence[Any]) -> bytes:
+        """
+        Same as `serialize()`, but the output is written directly as bytes (e.g. to be used as the data of a transaction),
+        without intermediate strings.
+        """
+        parts = self.serialize_to_parts(input_values)
+        return self.encode_parts_to_data(parts)
+
+    def encode_parts_to_data(self, parts: Sequence[Union[str, bytes]]) -> bytes:
+        """
+        Joins the parts (using the separator) into a single buffer. Parts given as `bytes` (e.g. serialized arguments)
+        are hex-encoded, while parts given as `str` (e.g. function names, or arguments already hex-encoded) are kept as they are.
+        """
+        separator = self.parts_separator.encode()
+        encoded_parts = [binascii.hexlify(part) if isinstance(part, bytes) else part.encode() for part in parts]
+        return separator.join(encoded_parts)
+
     def serialize_to_parts(self, input_values: Sequence[Any]) -> list[bytes]:
         parts_holder = PartsHolder([])
         self._do_serialize(parts_holder, input_values)
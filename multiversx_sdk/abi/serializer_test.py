@@ -204,6 +204,24 @@ def test_serialize():
     assert data == "02@42@43@44"
 
 
+def test_serialize_to_data():
+    serializer = Serializer()
+
+    values = [U8Value(0x42), U8Value(0), BigUIntValue(one_quintillion), StringValue("abc")]
+    data = serializer.serialize_to_data(values)
+    assert data == serializer.serialize(values).encode()
+    assert data == b"42@@0de0b6b3a7640000@616263"
+
+    assert serializer.serialize_to_data([]) == b""
+
+
+def test_encode_parts_to_data():
+    serializer = Serializer()
+
+    data = serializer.encode_parts_to_data(["ESDTTransfer", bytes([0x41, 0x42]), "", bytes([]), "0a"])
+    assert data == b"ESDTTransfer@4142@@@0a"
+
+
 def test_deserialize():
     serializer = Serializer()
 
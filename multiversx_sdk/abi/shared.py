@@ -1,18 +1,19 @@
 import io
 import struct
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
 
 from multiversx_sdk.abi.constants import STRUCT_PACKING_FORMAT_FOR_UINT32
 
+UINT32 = struct.Struct(STRUCT_PACKING_FORMAT_FOR_UINT32)
+
 
 def encode_length(writer: io.BytesIO, length: int):
-    bytes = struct.pack(STRUCT_PACKING_FORMAT_FOR_UINT32, length)
-    writer.write(bytes)
+    writer.write(UINT32.pack(length))
 
 
 def decode_length(reader: io.BytesIO) -> int:
     bytes = read_bytes_exactly(reader, 4)
-    (length,) = struct.unpack(STRUCT_PACKING_FORMAT_FOR_UINT32, bytes)
+    (length,) = UINT32.unpack(bytes)
     return length
 
 
@@ -27,6 +28,33 @@ def read_bytes_exactly(reader: io.BytesIO, num_bytes: int):
     return data
 
 
+def unsigned_integer_to_bytes(value: int) -> bytes:
+    """Encodes a (big) unsigned integer as big-endian bytes, of minimal length (e.g. zero is encoded as no bytes)."""
+    return value.to_bytes((value.bit_length() + 7) // 8, byteorder="big", signed=False)
+
+
+def signed_integer_to_bytes(value: int) -> bytes:
+    """Encodes a (big) signed integer as big-endian bytes (two's complement), of minimal length."""
+    if value == 0:
+        return b""
+
+    length = ((value + (value < 0)).bit_length() + 7 + 1) // 8
+    return value.to_bytes(length, byteorder="big", signed=True)
+
+
+def unsigned_integers_to_bytes(values: Sequence[int]) -> list[bytes]:
+    """Same as `unsigned_integer_to_bytes()`, for many values at once."""
+    return [value.to_bytes((value.bit_length() + 7) // 8, "big") for value in values]
+
+
+def signed_integers_to_bytes(values: Sequence[int]) -> list[bytes]:
+    """Same as `signed_integer_to_bytes()`, for many values at once."""
+    return [
+        value.to_bytes(((value + (value < 0)).bit_length() + 7 + 1) // 8, "big", signed=True) if value else b""
+        for value in values
+    ]
+
+
 def convert_native_value_to_dictionary(obj: Any, raise_on_failure: bool = True) -> Tuple[dict[str, Any], bool]:
     try:
         return dict(obj), True
@@ -5,6 +5,10 @@ import pytest
 from multiversx_sdk.abi.shared import (
     convert_native_value_to_dictionary,
     convert_native_value_to_list,
+    signed_integer_to_bytes,
+    signed_integers_to_bytes,
+    unsigned_integer_to_bytes,
+    unsigned_integers_to_bytes,
 )
 
 
@@ -52,3 +56,29 @@ def test_convert_native_value_to_list():
 
     with pytest.raises(ValueError, match="cannot convert native value to list"):
         items, ok = convert_native_value_to_list(SimpleNamespace(a=1, b=2, c=3))
+
+
+def test_integers_to_bytes():
+    assert unsigned_integer_to_bytes(0) == b""
+    assert unsigned_integer_to_bytes(0xFF) == bytes([0xFF])
+    assert unsigned_integer_to_bytes(0x100) == bytes([0x01, 0x00])
+    assert unsigned_integer_to_bytes(2**520) == bytes([0x01]) + bytes(65)
+
+    assert signed_integer_to_bytes(0) == b""
+    assert signed_integer_to_bytes(0x7F) == bytes([0x7F])
+    assert signed_integer_to_bytes(0x80) == bytes([0x00, 0x80])
+    assert signed_integer_to_bytes(-1) == bytes([0xFF])
+    assert signed_integer_to_bytes(-0x80) == bytes([0x80])
+    assert signed_integer_to_bytes(-0x81) == bytes([0xFF, 0x7F])
+
+    values = [0, 1, 0x7F, 0x80, 0xFF, 0x100, 2**64, 10**30]
+    assert unsigned_integers_to_bytes(values) == [unsigned_integer_to_bytes(value) for value in values]
+
+    values += [-value for value in values] + [-(2**64) - 1]
+    assert signed_integers_to_bytes(values) == [signed_integer_to_bytes(value) for value in values]
+
+    with pytest.raises(OverflowError):
+        unsigned_integer_to_bytes(-1)
+
+    with pytest.raises(OverflowError):
+        unsigned_integers_to_bytes([1, -1])
@@ -1,7 +1,17 @@
+from typing import Sequence
+
+
 class TypeFormula:
-    def __init__(self, name: str, type_parameters: list["TypeFormula"]) -> None:
+    """
+    Formulas created by a `TypeFormulaParser` are interned (per parser): equal formulas (and sub-formulas)
+    are the same object, thus they must not be mutated.
+    """
+
+    __slots__ = ("name", "type_parameters")
+
+    def __init__(self, name: str, type_parameters: Sequence["TypeFormula"]) -> None:
         self.name: str = name
-        self.type_parameters: list[TypeFormula] = type_parameters
+        self.type_parameters: tuple[TypeFormula, ...] = tuple(type_parameters)
 
     def __str__(self) -> str:
         if self.type_parameters:
@@ -1,4 +1,5 @@
-from typing import Any
+import re
+from typing import Any, Callable, Optional, Sequence
 
 from multiversx_sdk.abi.type_formula import TypeFormula
 
@@ -8,8 +9,41 @@ class TypeFormulaParser:
     END_TYPE_PARAMETERS = ">"
     COMMA = ","
     PUNCTUATION = [COMMA, BEGIN_TYPE_PARAMETERS, END_TYPE_PARAMETERS]
+    PUNCTUATION_PATTERN = re.compile("([,<>])")
+
+    def __init__(self, validate_type_formula: Optional[Callable[[TypeFormula, str], None]] = None) -> None:
+        """
+        Args:
+            validate_type_formula: if set, called (once per expression) for each newly parsed formula, along with its expression (e.g. to check that the types are known)
+        """
+        # The parsed formulas are memoized (by expression) and interned (by name and type parameters)
+        # for the lifetime of the parser (e.g. of an ABI), thus they should not be mutated.
+        self.type_formulas_by_expression: dict[str, TypeFormula] = {}
+        self._interned_type_formulas: dict[tuple[str, tuple[TypeFormula, ...]], TypeFormula] = {}
+        self._validate_type_formula = validate_type_formula
+        # Formulas parsed ahead of time (e.g. loaded from a cache), not validated yet.
+        self._preparsed_type_formulas_by_expression: dict[str, TypeFormula] = {}
 
     def parse_expression(self, expression: str) -> TypeFormula:
+        type_formula = self.type_formulas_by_expression.get(expression)
+
+        if type_formula is None:
+            type_formula = self._preparsed_type_formulas_by_expression.pop(expression, None)
+
+            if type_formula is None:
+                type_formula = self._parse_expression(expression)
+            if self._validate_type_formula:
+                self._validate_type_formula(type_formula, expression)
+
+            self.type_formulas_by_expression[expression] = type_formula
+
+        return type_formula
+
+    def add_preparsed_formulas(self, type_formulas_by_expression: dict[str, TypeFormula]) -> None:
+        """Adds formulas parsed ahead of time (e.g. loaded from a cache); they are validated on first use, as the parsed ones."""
+        self._preparsed_type_formulas_by_expression.update(type_formulas_by_expression)
+
+    def _parse_expression(self, expression: str) -> TypeFormula:
         expression = expression.strip()
         tokens = [token for token in self.tokenize_expression(expression) if token != self.COMMA]
         stack: list[Any] = []
@@ -39,36 +73,28 @@ class TypeFormulaParser:
             return item
         elif isinstance(item, str):
             # Expression contained a simple, non-generic type.
-            return TypeFormula(item, [])
+            return self.intern_type_formula(item, [])
         else:
             raise ValueError(f"Unexpected item on stack: {item}")
 
-    def tokenize_expression(self, expression: str) -> list[str]:
-        tokens: list[str] = []
-        current_token = ""
-
-        for character in expression:
-            if self.is_punctuation(character):
-                if current_token:
-                    # Retain current token
-                    tokens.append(current_token.strip())
-                    # Reset current token
-                    current_token = ""
-                # Punctuation character
-                tokens.append(character)
-            else:
-                current_token += character
+    def intern_type_formula(self, name: str, type_parameters: Sequence[TypeFormula]) -> TypeFormula:
+        """Returns the formula (of this parser) with the given name and type parameters (which should be interned, as well)."""
+        key = (name, tuple(type_parameters))
+        type_formula = self._interned_type_formulas.get(key)
 
-        if current_token:
-            # Retain the last token (if any).
-            tokens.append(current_token.strip())
+        if type_formula is None:
+            type_formula = self._interned_type_formulas.setdefault(key, TypeFormula(name, type_parameters))
 
-        return tokens
+        return type_formula
+
+    def tokenize_expression(self, expression: str) -> list[str]:
+        # The punctuation characters are retained (as separate tokens), the other tokens are stripped.
+        return [token.strip() for token in self.PUNCTUATION_PATTERN.split(expression) if token]
 
     def acquire_type_with_parameters(self, stack: list[Any]) -> TypeFormula:
         type_parameters = self.acquire_type_parameters(stack)
         type_name = stack.pop()
-        type_formula = TypeFormula(type_name, type_parameters[::-1])
+        type_formula = self.intern_type_formula(type_name, type_parameters[::-1])
         return type_formula
 
     def acquire_type_parameters(self, stack: list[Any]) -> list[TypeFormula]:
@@ -89,7 +115,7 @@ class TypeFormulaParser:
                 type_parameters.append(item)
             elif isinstance(item, str):
                 # Type parameter is a simple, non-generic type.
-                type_parameters.append(TypeFormula(item, []))
+                type_parameters.append(self.intern_type_formula(item, []))
             else:
                 raise ValueError(f"unexpected type parameter object in stack: {item}")
 
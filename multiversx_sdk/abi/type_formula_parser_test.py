@@ -23,3 +23,27 @@ def test_parse_expression():
         output_expression = str(type_formula)
 
         assert output_expression == expected_expression
+
+
+def test_parse_expression_is_memoized():
+    parser = TypeFormulaParser()
+
+    first = parser.parse_expression("List<Option<u64>>")
+    second = parser.parse_expression("List<Option<u64>>")
+
+    assert first is second
+    assert str(first) == "List<Option<u64>>"
+
+
+def test_parsed_formulas_are_interned():
+    parser = TypeFormulaParser()
+    first = parser.parse_expression("tuple<List<u64>, List<u64>>")
+    second = parser.parse_expression(" tuple<List<u64>,List<u64>>")
+
+    assert first is second
+    assert first.type_parameters == (first.type_parameters[0], first.type_parameters[1])
+    assert first.type_parameters[0] is first.type_parameters[1]
+    assert parser.parse_expression("List<u64>") is first.type_parameters[0]
+
+    # Formulas are interned per parser (e.g. per ABI), not process-wide.
+    assert TypeFormulaParser().parse_expression("tuple<List<u64>, List<u64>>") is not first
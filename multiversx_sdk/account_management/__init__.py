@@ -1,6 +1,18 @@
-from multiversx_sdk.account_management.account_controller import AccountController
-from multiversx_sdk.account_management.account_transactions_factory import (
-    AccountTransactionsFactory,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.account_management.account_controller import AccountController
+    from multiversx_sdk.account_management.account_transactions_factory import (
+        AccountTransactionsFactory,
+    )
+
+_EXPORTS = {
+    "AccountController": "multiversx_sdk.account_management.account_controller",
+    "AccountTransactionsFactory": "multiversx_sdk.account_management.account_transactions_factory",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = ["AccountTransactionsFactory", "AccountController"]
@@ -1,4 +1,18 @@
-from multiversx_sdk.accounts.account import Account
-from multiversx_sdk.accounts.ledger_account import LedgerAccount
+from typing import TYPE_CHECKING
 
-__all__ = ["Account", "LedgerAccount"]
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.accounts.account import Account
+    from multiversx_sdk.accounts.ledger_account import LedgerAccount
+    from multiversx_sdk.accounts.signing_pool import SigningPool
+
+_EXPORTS = {
+    "Account": "multiversx_sdk.accounts.account",
+    "LedgerAccount": "multiversx_sdk.accounts.ledger_account",
+    "SigningPool": "multiversx_sdk.accounts.signing_pool",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
+
+__all__ = ["Account", "LedgerAccount", "SigningPool"]
@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 from multiversx_sdk.core.message import Message, MessageComputer
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
 from multiversx_sdk.core.transaction_computer import TransactionComputer
 from multiversx_sdk.wallet.keypair import KeyPair
 from multiversx_sdk.wallet.mnemonic import Mnemonic
@@ -11,6 +12,8 @@ from multiversx_sdk.wallet.user_pem import UserPEM
 from multiversx_sdk.wallet.user_signer import UserSigner
 from multiversx_sdk.wallet.user_wallet import UserWallet
 
+_transaction_computer = TransactionComputer()
+
 
 class Account:
     def __init__(self, secret_key: UserSecretKey, hrp: Optional[str] = None) -> None:
@@ -55,10 +58,29 @@ class Account:
         return self.public_key.verify(data, signature)
 
     def sign_transaction(self, transaction: Transaction) -> bytes:
-        transaction_computer = TransactionComputer()
-        serialized_tx = transaction_computer.compute_bytes_for_signing(transaction)
+        serialized_tx = _transaction_computer.compute_bytes_for_signing(transaction)
         return self.secret_key.sign(serialized_tx)
 
+    def sign_transactions(
+        self,
+        transactions: Union[TransactionBatch, Sequence[Transaction]],
+        num_processes: int = 1,
+    ) -> None:
+        """Signs many transactions and sets their `signature` in place.
+
+        Args:
+            transactions (Union[TransactionBatch, Sequence[Transaction]]): the transactions to sign\n
+            num_processes (int): if greater than 1, very large batches are signed by a pool of worker processes"""
+        serialized_txs = _transaction_computer.compute_bytes_for_signing_many(transactions)
+        signatures = self.secret_key.sign_many(serialized_txs, num_processes)
+
+        if isinstance(transactions, TransactionBatch):
+            transactions.set_signatures(signatures)
+            return
+
+        for transaction, signature in zip(transactions, signatures):
+            transaction.signature = signature
+
     def sign_message(self, message: Message) -> bytes:
         message_computer = MessageComputer()
         serialized_message = message_computer.compute_bytes_for_signing(message)
@@ -4,6 +4,7 @@ from multiversx_sdk.accounts.account import Account
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.message import Message
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
 from multiversx_sdk.wallet.keypair import KeyPair
 from multiversx_sdk.wallet.user_keys import UserSecretKey
 
@@ -80,6 +81,44 @@ def test_sign_transaction():
     )
 
 
+def test_sign_transactions():
+    account = Account.new_from_pem(alice)
+    bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+    transactions = [
+        Transaction(
+            sender=account.address,
+            receiver=bob,
+            gas_limit=50000,
+            chain_id="local-testnet",
+            nonce=nonce,
+            value=nonce * 1000,
+            options=nonce % 2,
+            version=2,
+        )
+        for nonce in range(6)
+    ]
+    expected = [account.sign_transaction(transaction) for transaction in transactions]
+
+    account.sign_transactions(transactions)
+    assert [transaction.signature for transaction in transactions] == expected
+
+    for transaction in transactions:
+        transaction.signature = b""
+
+    account.sign_transactions(transactions, num_processes=2)
+    assert [transaction.signature for transaction in transactions] == expected
+
+    batch = TransactionBatch(sender=account.address, chain_id="local-testnet", receiver=bob, gas_limit=50000)
+    for nonce in range(6):
+        batch.append(nonce=nonce, value=nonce * 1000)
+
+    account.sign_transactions(batch)
+    assert [batch.get_signature(i) for i in range(len(batch))] == [
+        account.sign_transaction(transaction) for transaction in batch
+    ]
+
+
 def test_sign_message():
     message = Message(
         "hello".encode(),
@@ -0,0 +1,193 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Optional, Sequence, Type
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.message import Message, MessageComputer
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.wallet.constants import USER_SEED_LENGTH
+from multiversx_sdk.wallet.mnemonic import Mnemonic
+from multiversx_sdk.wallet.pem_reader import PemReader
+from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.user_wallet import UserWallet
+
+# The secret keys held by a worker process, by public key (only populated within the worker processes).
+_worker_secret_keys: dict[bytes, UserSecretKey] = {}
+
+
+class SigningPool:
+    """
+    Signs transactions and messages of many sender accounts, in worker processes.
+
+    The accounts are partitioned across the workers: each worker loads (from PEM files, keystores or mnemonics) and holds the
+    secret keys of its own accounts, and only public keys and signatures are sent back to the current process.
+    Batches are split by sender, signed by the workers in parallel, then the signatures are applied, in order.
+
+    Use it as a context manager (or call `close()`), to stop the worker processes.
+    """
+
+    def __init__(self, num_processes: int = 1, hrp: Optional[str] = None) -> None:
+        if num_processes < 1:
+            raise BadUsageError("num_processes must be at least 1")
+
+        self.hrp = hrp
+        self._workers = [ProcessPoolExecutor(max_workers=1) for _ in range(num_processes)]
+        self._worker_by_public_key: dict[bytes, int] = {}
+        self._next_worker = 0
+        self._transaction_computer = TransactionComputer()
+        self._message_computer = MessageComputer()
+
+    def add_pem(self, path: Path, indices: Optional[Sequence[int]] = None) -> list[Address]:
+        """Loads the accounts of a PEM file (all of them, if `indices` is not provided). Returns their addresses."""
+        path = path.expanduser().resolve()
+
+        if indices is None:
+            with PemReader(path) as reader:
+                indices = range(len(reader))
+
+        return self._add_accounts(_load_from_pem, path, list(indices))
+
+    def add_keystore(
+        self,
+        path: Path,
+        password: str,
+        address_indices: Optional[Sequence[int]] = None,
+    ) -> list[Address]:
+        """Loads the account(s) of a keystore. For keystores holding a mnemonic, `address_indices` can be provided
+        (otherwise, the first address is loaded). Returns their addresses."""
+        path = path.expanduser().resolve()
+        indices: list[Optional[int]] = list(address_indices) if address_indices is not None else [None]
+        return self._add_accounts(partial(_load_from_keystore, password), path, indices)
+
+    def add_mnemonic(self, mnemonic: str, address_indices: Sequence[int]) -> list[Address]:
+        """Derives the accounts of the given address indices (e.g. `range(100)`). Returns their addresses."""
+        Mnemonic.assert_text_is_valid(mnemonic.strip())
+        return self._add_accounts(_load_from_mnemonic, mnemonic, list(address_indices))
+
+    def get_addresses(self) -> list[Address]:
+        return [Address(public_key, self.hrp) for public_key in self._worker_by_public_key]
+
+    def sign_transactions(self, transactions: Sequence[Transaction]) -> Sequence[Transaction]:
+        """Signs the transactions (of any of the loaded senders) and sets their `signature`. Returns the transactions, in order."""
+        data_items = self._transaction_computer.compute_bytes_for_signing_many(transactions)
+        public_keys = [transaction.sender.get_public_key() for transaction in transactions]
+        signatures = self._sign(public_keys, data_items)
+
+        for transaction, signature in zip(transactions, signatures):
+            transaction.signature = signature
+
+        return transactions
+
+    def sign_messages(self, messages: Sequence[Message]) -> Sequence[Message]:
+        """Signs the messages (their `address` must be one of the loaded accounts) and sets their `signature`. Returns the messages, in order."""
+        public_keys: list[bytes] = []
+
+        for message in messages:
+            if message.address is None:
+                raise BadUsageError("`address` property of Message is not set")
+            public_keys.append(message.address.get_public_key())
+
+        data_items = [self._message_computer.compute_bytes_for_signing(message) for message in messages]
+        signatures = self._sign(public_keys, data_items)
+
+        for message, signature in zip(messages, signatures):
+            message.signature = signature
+
+        return messages
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _add_accounts(
+        self, load: Callable[[Any, list[Any]], list[bytes]], source: Any, indices: list[Any]
+    ) -> list[Address]:
+        # The indices are split into contiguous chunks, loaded by the workers in parallel (starting with the least recently used worker).
+        num_chunks = min(len(self._workers), len(indices))
+        chunk_size = -(-len(indices) // num_chunks) if num_chunks else 0
+        futures: list[tuple[int, Future[list[bytes]]]] = []
+
+        for start in range(0, len(indices), chunk_size or 1):
+            worker_index = self._next_worker
+            self._next_worker = (self._next_worker + 1) % len(self._workers)
+            future = self._workers[worker_index].submit(load, source, indices[start : start + chunk_size])
+            futures.append((worker_index, future))
+
+        addresses: list[Address] = []
+
+        for worker_index, future in futures:
+            for public_key in future.result():
+                self._worker_by_public_key[public_key] = worker_index
+                addresses.append(Address(public_key, self.hrp))
+
+        return addresses
+
+    def _sign(self, public_keys: list[bytes], data_items: list[bytes]) -> list[bytes]:
+        positions_by_worker: dict[int, list[int]] = {}
+
+        for position, public_key in enumerate(public_keys):
+            worker_index = self._worker_by_public_key.get(public_key)
+            if worker_index is None:
+                raise BadUsageError(f"No account loaded for: {Address(public_key, self.hrp).to_bech32()}")
+            positions_by_worker.setdefault(worker_index, []).append(position)
+
+        futures = {
+            worker_index: self._workers[worker_index].submit(
+                _sign,
+                [public_keys[position] for position in positions],
+                [data_items[position] for position in positions],
+            )
+            for worker_index, positions in positions_by_worker.items()
+        }
+
+        signatures: list[bytes] = [b""] * len(public_keys)
+
+        for worker_index, future in futures.items():
+            for position, signature in zip(positions_by_worker[worker_index], future.result()):
+                signatures[position] = signature
+
+        return signatures
+
+
+def _store_secret_keys(secret_keys: list[UserSecretKey]) -> list[bytes]:
+    """Runs in a worker process. Only the public keys are returned."""
+    public_keys: list[bytes] = []
+
+    for secret_key in secret_keys:
+        public_key = secret_key.generate_public_key().buffer
+        _worker_secret_keys[public_key] = secret_key
+        public_keys.append(public_key)
+
+    return public_keys
+
+
+def _load_from_pem(path: Path, indices: list[int]) -> list[bytes]:
+    with PemReader(path) as reader:
+        return _store_secret_keys([UserSecretKey(reader[index].message[:USER_SEED_LENGTH]) for index in indices])
+
+
+def _load_from_keystore(password: str, path: Path, address_indices: list[Optional[int]]) -> list[bytes]:
+    return _store_secret_keys(UserWallet.load_secret_keys([path] * len(address_indices), password, address_indices))
+
+
+def _load_from_mnemonic(mnemonic: str, address_indices: list[int]) -> list[bytes]:
+    return _store_secret_keys(Mnemonic(mnemonic).derive_keys(address_indices))
+
+
+def _sign(public_keys: list[bytes], data_items: list[bytes]) -> list[bytes]:
+    return [_worker_secret_keys[public_key].sign(data) for public_key, data in zip(public_keys, data_items)]
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.accounts.account import Account
+from multiversx_sdk.accounts.signing_pool import SigningPool
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.message import Message
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.wallet.user_pem import UserPEM
+
+testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
+DUMMY_MNEMONIC = "moral volcano peasant pass circle pen over picture flat shop clap goat never lyrics gather prepare woman film husband gravity behind test tiger improve"
+
+
+def test_load_accounts():
+    with SigningPool(num_processes=2) as pool:
+        pem_addresses = pool.add_pem(testwallets / "multipleUserKeys.pem")
+        keystore_addresses = pool.add_keystore(testwallets / "withDummyMnemonic.json", "password", [0, 1])
+        mnemonic_addresses = pool.add_mnemonic(DUMMY_MNEMONIC, range(3))
+
+        expected_pem_addresses = [
+            pem.public_key.to_address() for pem in UserPEM.from_file_all(testwallets / "multipleUserKeys.pem")
+        ]
+        assert pem_addresses == expected_pem_addresses
+        assert keystore_addresses == mnemonic_addresses[:2]
+        assert mnemonic_addresses[0].to_bech32() == "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+        loaded = {address.to_bech32() for address in pool.get_addresses()}
+        assert loaded == {address.to_bech32() for address in pem_addresses + mnemonic_addresses}
+
+
+def test_sign_transactions_and_messages():
+    accounts = [Account.new_from_pem(testwallets / f"{name}.pem") for name in ["alice", "bob", "carol"]]
+    receiver = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+    transactions = [
+        Transaction(
+            sender=accounts[nonce % 3].address,
+            receiver=receiver,
+            gas_limit=50000,
+            chain_id="local-testnet",
+            nonce=nonce,
+            value=nonce * 1000,
+        )
+        for nonce in range(10)
+    ]
+    messages = [Message(f"hello {index}".encode(), address=accounts[index % 3].address) for index in range(5)]
+
+    expected_transactions_signatures = [
+        accounts[index % 3].sign_transaction(tx) for index, tx in enumerate(transactions)
+    ]
+    expected_messages_signatures = [accounts[index % 3].sign_message(msg) for index, msg in enumerate(messages)]
+
+    with SigningPool(num_processes=2) as pool:
+        for name in ["alice", "bob", "carol"]:
+            pool.add_pem(testwallets / f"{name}.pem")
+
+        assert pool.sign_transactions(transactions) == transactions
+        assert [tx.signature for tx in transactions] == expected_transactions_signatures
+
+        pool.sign_messages(messages)
+        assert [msg.signature for msg in messages] == expected_messages_signatures
+
+        unknown = Address(bytes(32), "erd")
+        unknown_sender = Transaction(sender=unknown, receiver=receiver, gas_limit=50000, chain_id="local-testnet")
+        with pytest.raises(BadUsageError, match="No account loaded for"):
+            pool.sign_transactions([unknown_sender])
@@ -1,5 +1,7 @@
-from multiversx_sdk.abi import BigUIntValue, Serializer
-from multiversx_sdk.abi.string_value import StringValue
+from multiversx_sdk.abi.shared import (
+    unsigned_integer_to_bytes,
+    unsigned_integers_to_bytes,
+)
 from multiversx_sdk.core import Address, TokenComputer, TokenTransfer
 
 
@@ -11,48 +13,36 @@ class TokenTransfersDataBuilder:
 
     def __init__(self, token_computer: TokenComputer) -> None:
         self.token_computer = token_computer
-        self.serializer = Serializer()
 
     def build_args_for_esdt_transfer(self, transfer: TokenTransfer) -> list[str]:
-        args = ["ESDTTransfer"]
-
-        serialized_args = self.serializer.serialize_to_parts(
-            [StringValue(transfer.token.identifier), BigUIntValue(transfer.amount)]
-        )
-        args.extend([arg.hex() for arg in serialized_args])
-
-        return args
+        return [
+            "ESDTTransfer",
+            transfer.token.identifier.encode().hex(),
+            unsigned_integer_to_bytes(transfer.amount).hex(),
+        ]
 
     def build_args_for_single_esdt_nft_transfer(self, transfer: TokenTransfer, receiver: Address) -> list[str]:
-        args = ["ESDTNFTTransfer"]
         token = transfer.token
         identifier = self.token_computer.extract_identifier_from_extended_identifier(token.identifier)
 
-        serialized_args = self.serializer.serialize_to_parts(
-            [
-                StringValue(identifier),
-                BigUIntValue(token.nonce),
-                BigUIntValue(transfer.amount),
-            ]
-        )
-        args.extend([arg.hex() for arg in serialized_args])
-        args.append(receiver.to_hex())
-
-        return args
+        return [
+            "ESDTNFTTransfer",
+            identifier.encode().hex(),
+            unsigned_integer_to_bytes(token.nonce).hex(),
+            unsigned_integer_to_bytes(transfer.amount).hex(),
+            receiver.to_hex(),
+        ]
 
     def build_args_for_multi_esdt_nft_transfer(self, receiver: Address, transfers: list[TokenTransfer]) -> list[str]:
-        serialized_num_of_transfers = self.serializer.serialize([BigUIntValue(len(transfers))])
+        serialized_num_of_transfers = unsigned_integer_to_bytes(len(transfers)).hex()
         args = ["MultiESDTNFTTransfer", receiver.to_hex(), serialized_num_of_transfers]
 
-        for transfer in transfers:
+        # The nonces and the amounts (as big unsigned integers) are encoded in bulk.
+        nonces = unsigned_integers_to_bytes([transfer.token.nonce for transfer in transfers])
+        amounts = unsigned_integers_to_bytes([transfer.amount for transfer in transfers])
+
+        for transfer, nonce, amount in zip(transfers, nonces, amounts):
             identifier = self.token_computer.extract_identifier_from_extended_identifier(transfer.token.identifier)
-            serialized_args = self.serializer.serialize_to_parts(
-                [
-                    StringValue(identifier),
-                    BigUIntValue(transfer.token.nonce),
-                    BigUIntValue(transfer.amount),
-                ]
-            )
-            args.extend([arg.hex() for arg in serialized_args])
+            args.extend([identifier.encode().hex(), nonce.hex(), amount.hex()])
 
         return args
@@ -1,32 +1,69 @@
-from multiversx_sdk.core.address import Address, AddressComputer, AddressFactory
-from multiversx_sdk.core.code_metadata import CodeMetadata
-from multiversx_sdk.core.config import LibraryConfig
-from multiversx_sdk.core.message import Message, MessageComputer
-from multiversx_sdk.core.tokens import (
-    Token,
-    TokenComputer,
-    TokenIdentifierParts,
-    TokenTransfer,
-)
-from multiversx_sdk.core.transaction import Transaction
-from multiversx_sdk.core.transaction_computer import TransactionComputer
-from multiversx_sdk.core.transaction_events_parser import TransactionEventsParser
-from multiversx_sdk.core.transaction_on_network import (
-    SmartContractResult,
-    TransactionEvent,
-    TransactionLogs,
-    TransactionOnNetwork,
-    TransactionStatus,
-    find_events_by_first_topic,
-    find_events_by_identifier,
-)
-from multiversx_sdk.core.transactions_factory_config import TransactionsFactoryConfig
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.core.address import Address, AddressComputer, AddressFactory
+    from multiversx_sdk.core.code_metadata import CodeMetadata
+    from multiversx_sdk.core.config import LibraryConfig
+    from multiversx_sdk.core.message import Message, MessageComputer
+    from multiversx_sdk.core.tokens import (
+        Token,
+        TokenComputer,
+        TokenIdentifierParts,
+        TokenTransfer,
+    )
+    from multiversx_sdk.core.transaction import Transaction
+    from multiversx_sdk.core.transaction_batch import TransactionBatch
+    from multiversx_sdk.core.transaction_computer import TransactionComputer
+    from multiversx_sdk.core.transaction_events_parser import TransactionEventsParser
+    from multiversx_sdk.core.transaction_on_network import (
+        SmartContractResult,
+        TransactionEvent,
+        TransactionLogs,
+        TransactionOnNetwork,
+        TransactionStatus,
+        find_events_by_first_topic,
+        find_events_by_identifier,
+    )
+    from multiversx_sdk.core.transactions_factory_config import (
+        TransactionsFactoryConfig,
+    )
+
+_EXPORTS = {
+    "Address": "multiversx_sdk.core.address",
+    "AddressComputer": "multiversx_sdk.core.address",
+    "AddressFactory": "multiversx_sdk.core.address",
+    "CodeMetadata": "multiversx_sdk.core.code_metadata",
+    "LibraryConfig": "multiversx_sdk.core.config",
+    "Message": "multiversx_sdk.core.message",
+    "MessageComputer": "multiversx_sdk.core.message",
+    "Token": "multiversx_sdk.core.tokens",
+    "TokenComputer": "multiversx_sdk.core.tokens",
+    "TokenIdentifierParts": "multiversx_sdk.core.tokens",
+    "TokenTransfer": "multiversx_sdk.core.tokens",
+    "Transaction": "multiversx_sdk.core.transaction",
+    "TransactionBatch": "multiversx_sdk.core.transaction_batch",
+    "TransactionComputer": "multiversx_sdk.core.transaction_computer",
+    "TransactionEventsParser": "multiversx_sdk.core.transaction_events_parser",
+    "SmartContractResult": "multiversx_sdk.core.transaction_on_network",
+    "TransactionEvent": "multiversx_sdk.core.transaction_on_network",
+    "TransactionLogs": "multiversx_sdk.core.transaction_on_network",
+    "TransactionOnNetwork": "multiversx_sdk.core.transaction_on_network",
+    "TransactionStatus": "multiversx_sdk.core.transaction_on_network",
+    "find_events_by_first_topic": "multiversx_sdk.core.transaction_on_network",
+    "find_events_by_identifier": "multiversx_sdk.core.transaction_on_network",
+    "TransactionsFactoryConfig": "multiversx_sdk.core.transactions_factory_config",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "Address",
     "AddressFactory",
     "AddressComputer",
     "Transaction",
+    "TransactionBatch",
     "TransactionComputer",
     "Message",
     "MessageComputer",
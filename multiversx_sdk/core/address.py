@@ -1,15 +1,27 @@
-from typing import Optional
-
-from Cryptodome.Hash import keccak
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union
 
 from multiversx_sdk.core import bech32
 from multiversx_sdk.core.config import LibraryConfig
 from multiversx_sdk.core.constants import METACHAIN_ID
-from multiversx_sdk.core.errors import BadAddressError, BadPubkeyLengthError
+from multiversx_sdk.core.errors import (
+    BadAddressError,
+    BadPubkeyLengthError,
+    BadUsageError,
+)
+from multiversx_sdk.core.numpy_support import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
 
 SC_HEX_PUBKEY_PREFIX = "0" * 16
 PUBKEY_LENGTH = 32
 
+METACHAIN_PUBKEY_PREFIX = bytes([0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+ZERO_PUBKEY = bytes(PUBKEY_LENGTH)
+CONTRACT_PUBKEY_PREFIX = bytes(8) + bytes([5, 0])
+SHARD_MASK_HIGH = 0b11
+SHARD_MASK_LOW = 0b01
+
 
 class Address:
     """An Address, as an immutable object."""
@@ -151,12 +163,33 @@ class AddressComputer:
 
             8 bytes of zero + 2 bytes for VM type + 20 bytes of hash(owner) + 2 bytes of shard(owner)
         """
+        return self.compute_contract_addresses(deployer, [deployment_nonce])[0]
+
+    def compute_contract_addresses(self, deployer: Address, deployment_nonces: Iterable[int]) -> list[Address]:
+        """Computes the contract addresses for many deployment nonces of the same deployer (e.g. `range(start, stop)`).
+        The parts that only depend on the deployer are computed once.
+
+        Args:
+            deployer (Address): The address of the deployer\n
+            deployment_nonces (Iterable[int]): The nonces of the deployments
+
+        Returns:
+            list[Address]: The computed contract addresses, in the order of the nonces."""
+        # imported here, since it's slow to import and `Address` is often used on its own
+        from Cryptodome.Hash import keccak
+
         deployer_pubkey = deployer.get_public_key()
-        nonce_bytes = deployment_nonce.to_bytes(8, byteorder="little")
-        bytes_to_hash = deployer_pubkey + nonce_bytes
-        contract_pubkey = keccak.new(digest_bits=256).update(bytes_to_hash).digest()
-        contract_pubkey = bytes([0] * 8) + bytes([5, 0]) + contract_pubkey[10:30] + deployer_pubkey[30:]
-        return Address(contract_pubkey, deployer.get_hrp())
+        deployer_shard_bytes = deployer_pubkey[30:]
+        hrp = deployer.get_hrp()
+
+        addresses: list[Address] = []
+        for nonce in deployment_nonces:
+            bytes_to_hash = deployer_pubkey + nonce.to_bytes(8, byteorder="little")
+            contract_pubkey = keccak.new(digest_bits=256).update(bytes_to_hash).digest()
+            contract_pubkey = CONTRACT_PUBKEY_PREFIX + contract_pubkey[10:30] + deployer_shard_bytes
+            addresses.append(Address(contract_pubkey, hrp))
+
+        return addresses
 
     def get_shard_of_address(self, address: Address) -> int:
         """Returns the shard number of a given address.
@@ -168,6 +201,20 @@ class AddressComputer:
             int: The shard number."""
         return get_shard_of_pubkey(address.get_public_key(), self.number_of_shards)
 
+    def get_shards_of_addresses(self, addresses: Sequence[Address]) -> "np.ndarray":
+        """Returns the shard numbers of many addresses, as a NumPy array (see `get_shards_of_pubkeys()`)."""
+        return self.get_shards_of_pubkeys(b"".join(address.get_public_key() for address in addresses))
+
+    def get_shards_of_pubkeys(self, pubkeys: Union[Sequence[bytes], bytes, bytearray, memoryview]) -> "np.ndarray":
+        """Returns the shard numbers of many public keys, computed with NumPy.
+
+        Args:
+            pubkeys: Either a list of public keys, or a contiguous buffer of concatenated 32-byte public keys.
+
+        Returns:
+            np.ndarray: The shard numbers (as `uint32`, since the metachain ID is `2^32 - 1`)."""
+        return get_shards_of_pubkeys(pubkeys, self.number_of_shards)
+
 
 def is_valid_bech32(value: str, expected_hrp: str) -> bool:
     hrp, value_bytes = bech32.bech32_decode(value)
@@ -187,29 +234,53 @@ def _decode_bech32(value: str) -> tuple[str, bytes]:
 
 
 def get_shard_of_pubkey(pubkey: bytes, number_of_shards: int) -> int:
-    mask_high = int("11", 2)
-    mask_low = int("01", 2)
-
     last_byte_of_pubkey = pubkey[31]
 
     if _is_pubkey_of_metachain(pubkey):
         return METACHAIN_ID
 
-    shard = last_byte_of_pubkey & mask_high
+    shard = last_byte_of_pubkey & SHARD_MASK_HIGH
     if shard > number_of_shards - 1:
-        shard = last_byte_of_pubkey & mask_low
+        shard = last_byte_of_pubkey & SHARD_MASK_LOW
 
     return shard
 
 
+def get_shards_of_pubkeys(
+    pubkeys: Union[Sequence[bytes], bytes, bytearray, memoryview], number_of_shards: int
+) -> "np.ndarray":
+    """Vectorized version of `get_shard_of_pubkey()`."""
+    np = import_numpy()
+
+    if isinstance(pubkeys, (bytes, bytearray, memoryview)):
+        buffer = pubkeys
+    else:
+        for pubkey in pubkeys:
+            if len(pubkey) != PUBKEY_LENGTH:
+                raise BadUsageError(f"Each public key must have {PUBKEY_LENGTH} bytes, but got {len(pubkey)}")
+        buffer = b"".join(pubkeys)
+
+    if len(buffer) % PUBKEY_LENGTH:
+        raise BadUsageError(f"The length of the buffer of public keys must be a multiple of {PUBKEY_LENGTH}")
+
+    matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, PUBKEY_LENGTH)
+    last_bytes = matrix[:, PUBKEY_LENGTH - 1].astype(np.uint32)
+
+    shards = last_bytes & SHARD_MASK_HIGH
+    shards = np.where(shards > number_of_shards - 1, last_bytes & SHARD_MASK_LOW, shards)
+
+    metachain_prefix = np.frombuffer(METACHAIN_PUBKEY_PREFIX, dtype=np.uint8)
+    is_metachain = (matrix[:, : len(METACHAIN_PUBKEY_PREFIX)] == metachain_prefix).all(axis=1)
+    is_metachain |= ~matrix.any(axis=1)
+
+    return np.where(is_metachain, np.uint32(METACHAIN_ID), shards).astype(np.uint32)
+
+
 def _is_pubkey_of_metachain(pubkey: bytes) -> bool:
-    metachain_prefix = bytearray([0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
-    pubkey_prefix = pubkey[0 : len(metachain_prefix)]
-    if pubkey_prefix == bytes(metachain_prefix):
+    if pubkey[0 : len(METACHAIN_PUBKEY_PREFIX)] == METACHAIN_PUBKEY_PREFIX:
         return True
 
-    zero_address = bytearray(32)
-    if pubkey == bytes(zero_address):
+    if pubkey == ZERO_PUBKEY:
         return True
 
     return False
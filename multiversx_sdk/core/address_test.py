@@ -7,7 +7,11 @@ from multiversx_sdk.core.address import (
     is_valid_bech32,
 )
 from multiversx_sdk.core.config import LibraryConfig
-from multiversx_sdk.core.errors import BadAddressError, BadPubkeyLengthError
+from multiversx_sdk.core.errors import (
+    BadAddressError,
+    BadPubkeyLengthError,
+    BadUsageError,
+)
 
 
 def test_address():
@@ -80,6 +84,38 @@ def test_get_address_shard():
     assert address_computer.get_shard_of_address(address) == 2
 
 
+def test_get_shards_of_pubkeys():
+    address_computer = AddressComputer()
+    addresses = [
+        Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"),
+        Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"),
+        Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"),
+        Address.new_from_hex("000000000000000000010000000000000000000000000000000000000002ffff"),
+        Address.new_from_hex("0000000000000000000000000000000000000000000000000000000000000000"),
+        Address.new_from_hex("00000000000000000500bb652200ed1f994200ab6699462cab4b1af7b11ebd5f"),
+    ]
+    expected = [1, 0, 2, 4294967295, 4294967295, 1]
+
+    assert address_computer.get_shards_of_addresses(addresses).tolist() == expected
+
+    pubkeys = [address.get_public_key() for address in addresses]
+    assert address_computer.get_shards_of_pubkeys(pubkeys).tolist() == expected
+    assert address_computer.get_shards_of_pubkeys(b"".join(pubkeys)).tolist() == expected
+
+    for number_of_shards in [1, 2, 3, 4]:
+        address_computer = AddressComputer(number_of_shards)
+        pubkeys = [bytes(31) + bytes([last_byte]) for last_byte in range(256)] + [bytes([1] * 31) + bytes([7])]
+        shards = address_computer.get_shards_of_pubkeys(pubkeys).tolist()
+        assert shards == [address_computer.get_shard_of_address(Address(pubkey)) for pubkey in pubkeys]
+
+    with pytest.raises(BadUsageError):
+        address_computer.get_shards_of_pubkeys(bytes(33))
+
+    # The total length is a multiple of 32, but the keys are not.
+    with pytest.raises(BadUsageError):
+        address_computer.get_shards_of_pubkeys([bytes(31), bytes(33)])
+
+
 def test_compute_contract_address():
     deployer = Address.new_from_bech32("erd1j0hxzs7dcyxw08c4k2nv9tfcaxmqy8rj59meq505w92064x0h40qcxh3ap")
     address_computer = AddressComputer()
@@ -92,6 +128,12 @@ def test_compute_contract_address():
     assert contract_address.to_hex() == "000000000000000005006e4f90488e27342f9a46e1809452c85ee7186566bd5e"
     assert contract_address.to_bech32() == "erd1qqqqqqqqqqqqqpgqde8eqjywyu6zlxjxuxqfg5kgtmn3setxh40qen8egy"
 
+    contract_addresses = address_computer.compute_contract_addresses(deployer, range(0, 2))
+    assert [address.to_bech32() for address in contract_addresses] == [
+        "erd1qqqqqqqqqqqqqpgqhdjjyq8dr7v5yq9tv6v5vt9tfvd00vg7h40q6779zn",
+        "erd1qqqqqqqqqqqqqpgqde8eqjywyu6zlxjxuxqfg5kgtmn3setxh40qen8egy",
+    ]
+
 
 def test_address_with_library_config_hrp():
     address = Address(bytes.fromhex("0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1"))
@@ -1,6 +1,6 @@
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Sequence, Union
 
-from multiversx_sdk.core.constants import ARGS_SEPARATOR
+from multiversx_sdk.abi.serializer import Serializer
 from multiversx_sdk.core.interfaces import IGasLimitEstimator
 from multiversx_sdk.core.transaction import Transaction
 
@@ -17,9 +17,14 @@ class BaseFactory:
         self.config = config
         self.gas_limit_estimator = gas_limit_estimator
 
-    def set_payload(self, transaction: Transaction, data_parts: list[str]):
-        data = ARGS_SEPARATOR.join(data_parts)
-        transaction.data = data.encode("utf-8")
+    def set_payload(self, transaction: Transaction, data_parts: Sequence[Union[str, bytes]]):
+        """
+        Sets the data of the transaction, by joining the parts in a single buffer.
+
+        Args:
+            data_parts: the parts, either as `str` (e.g. the function name, or arguments already hex-encoded), or as `bytes` (serialized arguments, to be hex-encoded)
+        """
+        transaction.data = _serializer.encode_parts_to_data(data_parts)
 
     def set_gas_limit(
         self,
@@ -45,3 +50,6 @@ class BaseFactory:
             raise Exception(
                 "Either provide a `gas_limit` parameter or initialize the factory with a `gas_limit_estimator`."
             )
+
+
+_serializer = Serializer()
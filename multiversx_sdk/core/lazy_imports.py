@@ -0,0 +1,34 @@
+import importlib
+from typing import Any, Callable
+
+
+def create_lazy_getattr(
+    package_name: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Creates the module-level `__getattr__` and `__dir__` functions of a package that exports names lazily.
+
+    The module defining an exported name is only imported when the name is first accessed
+    (e.g. `from multiversx_sdk import Address` imports `multiversx_sdk.core.address`, but not the rest of the SDK).
+
+    Args:
+        package_name (str): the name of the package (i.e. `__name__`)\n
+        exports (dict[str, str]): maps each exported name to the module that defines it"""
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        # unlike `importlib.import_module()`, `__import__()` is reported by `python -X importtime`
+        module = __import__(module_name, fromlist=[name])
+        value = getattr(module, name)
+
+        # cache the value, so that `__getattr__` is not called again for the same name
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(package)) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,70 @@
+import importlib
+
+import pytest
+
+from multiversx_sdk.testutils.import_time import measure_import_time
+
+HEAVY_MODULES = [
+    "nacl",
+    "cryptography",
+    "mnemonic",
+    "google.protobuf",
+    "requests",
+    "ledgercomm",
+    "Cryptodome.Hash.keccak",
+    "multiversx_sdk.abi.abi",
+    "multiversx_sdk.wallet.user_keys",
+]
+
+PACKAGES = [
+    "multiversx_sdk",
+    "multiversx_sdk.abi",
+    "multiversx_sdk.account_management",
+    "multiversx_sdk.accounts",
+    "multiversx_sdk.core",
+    "multiversx_sdk.delegation",
+    "multiversx_sdk.entrypoints",
+    "multiversx_sdk.gas_estimator",
+    "multiversx_sdk.governance",
+    "multiversx_sdk.ledger",
+    "multiversx_sdk.multisig",
+    "multiversx_sdk.native_auth",
+    "multiversx_sdk.network_providers",
+    "multiversx_sdk.smart_contracts",
+    "multiversx_sdk.token_management",
+    "multiversx_sdk.transfers",
+    "multiversx_sdk.validators",
+    "multiversx_sdk.wallet",
+]
+
+
+@pytest.mark.parametrize("package_name", PACKAGES)
+def test_all_public_names_are_available(package_name: str):
+    package = importlib.import_module(package_name)
+
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        getattr(package, "NotExported")
+
+
+def test_importing_address_and_transaction_does_not_import_heavy_modules():
+    report = measure_import_time("from multiversx_sdk import Address, Transaction")
+
+    assert "multiversx_sdk.core.address" in report.modules
+    assert "multiversx_sdk.core.transaction" in report.modules
+
+    for module in HEAVY_MODULES:
+        assert module not in report.modules
+
+
+def test_importing_the_package_only_imports_the_lazy_loader():
+    modules = measure_import_time("import multiversx_sdk").modules
+    sdk_modules = {module for module in modules if module.startswith("multiversx_sdk")}
+
+    assert sdk_modules == {"multiversx_sdk", "multiversx_sdk.core", "multiversx_sdk.core.lazy_imports"}
+
+    for module in HEAVY_MODULES:
+        assert module not in modules
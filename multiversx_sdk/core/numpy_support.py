@@ -0,0 +1,13 @@
+from types import ModuleType
+
+
+def import_numpy() -> ModuleType:
+    """NumPy is an optional dependency, only needed by the bulk (vectorized) APIs of the SDK."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "The numpy package is not installed. Please install it using pip install multiversx_sdk[numpy]."
+        ) from e
+
+    return numpy
@@ -1,6 +1,5 @@
 import multiversx_sdk.core.proto.transaction_pb2 as ProtoTransaction
-from multiversx_sdk.abi.biguint_value import BigUIntValue
-from multiversx_sdk.abi.serializer import Serializer
+from multiversx_sdk.abi.shared import unsigned_integer_to_bytes
 from multiversx_sdk.core.transaction import Transaction
 
 
@@ -16,11 +15,8 @@ class ProtoSerializer:
         if tx_value == 0:
             return bytes([0, 0])
 
-        serializer = Serializer()
-        buffer = serializer.serialize_to_parts([BigUIntValue(tx_value)])[0]
-        buffer = bytes([0x00]) + buffer
-
-        return buffer
+        # The value is prefixed by a sign byte (always positive).
+        return bytes([0x00]) + unsigned_integer_to_bytes(tx_value)
 
     def convert_to_proto_message(self, transaction: Transaction) -> ProtoTransaction.Transaction:
         receiver_pubkey = transaction.receiver.get_public_key()
@@ -0,0 +1,428 @@
+import base64
+import json
+from array import array
+from hashlib import blake2b
+from typing import Any, Iterator, Optional, Sequence
+
+from Cryptodome.Hash import keccak
+
+import multiversx_sdk.core.proto.transaction_pb2 as ProtoTransaction
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.constants import (
+    DIGEST_SIZE,
+    MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS,
+    TRANSACTION_MIN_GAS_PRICE,
+    TRANSACTION_OPTIONS_DEFAULT,
+    TRANSACTION_OPTIONS_TX_GUARDED,
+    TRANSACTION_OPTIONS_TX_HASH_SIGN,
+    TRANSACTION_VERSION_DEFAULT,
+)
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.proto.transaction_serializer import ProtoSerializer
+from multiversx_sdk.core.transaction import Transaction
+
+
+class TransactionBatch:
+    """A columnar container for many transactions that share most of their fields.
+
+    The fields shared by the whole batch (sender, chain ID, gas price, version, options, guardian, relayer and,
+    optionally, the receiver, the gas limit and a data prefix) are stored once, while the fields that vary from one
+    transaction to another (nonce, receiver, value, gas limit, data and signatures) are stored in per-field arrays.
+
+    `Transaction` objects are only created on demand (e.g. `batch[i]`). They are copies, so modifying them does not
+    alter the batch; use `set_signature()` (or the other setters) to update the batch itself."""
+
+    def __init__(
+        self,
+        sender: Address,
+        chain_id: str,
+        gas_price: Optional[int] = None,
+        version: Optional[int] = None,
+        options: Optional[int] = None,
+        sender_username: Optional[str] = None,
+        receiver: Optional[Address] = None,
+        receiver_username: Optional[str] = None,
+        gas_limit: Optional[int] = None,
+        data_prefix: Optional[bytes] = None,
+        guardian: Optional[Address] = None,
+        relayer: Optional[Address] = None,
+    ) -> None:
+        """Creates an empty batch. The arguments are the fields shared by all the transactions of the batch.
+
+        Args:
+            sender (Address): the sender of all the transactions\n
+            chain_id (str): the chain ID\n
+            receiver (Optional[Address]): the default receiver, used when `append()` is not given one\n
+            gas_limit (Optional[int]): the default gas limit, used when `append()` is not given one\n
+            data_prefix (Optional[bytes]): bytes prepended to the `data` of every transaction"""
+        self.sender = sender
+        self.chain_id = chain_id
+        self.gas_price = gas_price or TRANSACTION_MIN_GAS_PRICE
+        self.version = version or TRANSACTION_VERSION_DEFAULT
+        self.options = options or TRANSACTION_OPTIONS_DEFAULT
+        self.sender_username = sender_username or ""
+        self.receiver = receiver
+        self.receiver_username = receiver_username or ""
+        self.gas_limit = gas_limit
+        self.data_prefix = data_prefix or bytes()
+        self.guardian = guardian
+        self.relayer = relayer
+
+        self._nonces = array("Q")
+        self._gas_limits = array("Q")
+        self._values: list[int] = []
+        self._receivers: list[Optional[Address]] = []
+        self._data: list[bytes] = []
+        self._signatures: list[bytes] = []
+        self._guardian_signatures: list[bytes] = []
+        self._relayer_signatures: list[bytes] = []
+
+    @classmethod
+    def new_from_transactions(cls, transactions: Sequence[Transaction]) -> "TransactionBatch":
+        """Creates a batch out of existing transactions. All of them must share the sender, chain ID, gas price,
+        version, options, usernames, guardian and relayer; otherwise, a `BadUsageError` is raised."""
+        if not len(transactions):
+            raise BadUsageError("Cannot create a batch out of an empty list of transactions")
+
+        first = transactions[0]
+        batch = cls(
+            sender=first.sender,
+            chain_id=first.chain_id,
+            gas_price=first.gas_price,
+            version=first.version,
+            options=first.options,
+            sender_username=first.sender_username,
+            receiver_username=first.receiver_username,
+            guardian=first.guardian,
+            relayer=first.relayer,
+        )
+
+        for transaction in transactions:
+            batch._ensure_shared_fields_match(transaction)
+            batch.append(
+                nonce=transaction.nonce,
+                receiver=transaction.receiver,
+                value=transaction.value,
+                gas_limit=transaction.gas_limit,
+                data=transaction.data,
+                signature=transaction.signature,
+                guardian_signature=transaction.guardian_signature,
+                relayer_signature=transaction.relayer_signature,
+            )
+
+        return batch
+
+    def append(
+        self,
+        nonce: int,
+        receiver: Optional[Address] = None,
+        value: Optional[int] = None,
+        gas_limit: Optional[int] = None,
+        data: Optional[bytes] = None,
+        signature: Optional[bytes] = None,
+        guardian_signature: Optional[bytes] = None,
+        relayer_signature: Optional[bytes] = None,
+    ) -> int:
+        """Adds a transaction to the batch and returns its index. If `receiver` or `gas_limit` are not provided,
+        the ones of the batch are used. The `data` is appended to the `data_prefix` of the batch."""
+        if receiver is None and self.receiver is None:
+            raise BadUsageError("The `receiver` must be provided, since the batch does not have a default receiver")
+
+        if gas_limit is None:
+            if self.gas_limit is None:
+                raise BadUsageError(
+                    "The `gas_limit` must be provided, since the batch does not have a default gas limit"
+                )
+            gas_limit = self.gas_limit
+
+        self._nonces.append(nonce)
+        self._gas_limits.append(gas_limit)
+        self._values.append(value or 0)
+        self._receivers.append(receiver)
+        self._data.append(data or bytes())
+        self._signatures.append(signature or bytes())
+        self._guardian_signatures.append(guardian_signature or bytes())
+        self._relayer_signatures.append(relayer_signature or bytes())
+
+        return len(self._nonces) - 1
+
+    def get_nonce(self, index: int) -> int:
+        return self._nonces[index]
+
+    def get_receiver(self, index: int) -> Address:
+        receiver = self._receivers[index]
+        return receiver if receiver is not None else self._get_default_receiver()
+
+    def get_value(self, index: int) -> int:
+        return self._values[index]
+
+    def get_gas_limit(self, index: int) -> int:
+        return self._gas_limits[index]
+
+    def get_data(self, index: int) -> bytes:
+        return self.data_prefix + self._data[index]
+
+    def get_gas_limits(self) -> "array[int]":
+        return array("Q", self._gas_limits)
+
+    def get_data_lengths(self) -> list[int]:
+        prefix_length = len(self.data_prefix)
+        return [prefix_length + len(data) for data in self._data]
+
+    def get_signature(self, index: int) -> bytes:
+        return self._signatures[index]
+
+    def set_signature(self, index: int, signature: bytes) -> None:
+        self._signatures[index] = signature
+
+    def set_signatures(self, signatures: Sequence[bytes]) -> None:
+        """Sets the signatures of all the transactions, in order."""
+        self._ensure_column_length(signatures, "signatures")
+        self._signatures = list(signatures)
+
+    def set_guardian_signature(self, index: int, signature: bytes) -> None:
+        self._guardian_signatures[index] = signature
+
+    def set_relayer_signature(self, index: int, signature: bytes) -> None:
+        self._relayer_signatures[index] = signature
+
+    def get_transaction(self, index: int) -> Transaction:
+        """Materializes the transaction at the given index."""
+        return Transaction(
+            sender=self.sender,
+            receiver=self.get_receiver(index),
+            gas_limit=self._gas_limits[index],
+            chain_id=self.chain_id,
+            nonce=self._nonces[index],
+            value=self._values[index],
+            sender_username=self.sender_username,
+            receiver_username=self.receiver_username,
+            gas_price=self.gas_price,
+            data=self.get_data(index),
+            version=self.version,
+            options=self.options,
+            guardian=self.guardian,
+            signature=self._signatures[index],
+            guardian_signature=self._guardian_signatures[index],
+            relayer=self.relayer,
+            relayer_signature=self._relayer_signatures[index],
+        )
+
+    def to_transactions(self) -> list[Transaction]:
+        return [self.get_transaction(index) for index in range(len(self))]
+
+    def to_dictionaries(self) -> list[dict[str, Any]]:
+        """Equivalent to calling `Transaction.to_dictionary()` for every transaction of the batch."""
+        shared: dict[str, Any] = {
+            "sender": self.sender.to_bech32(),
+            "senderUsername": _value_to_b64_or_empty(self.sender_username.encode()),
+            "receiverUsername": _value_to_b64_or_empty(self.receiver_username.encode()),
+            "gasPrice": self.gas_price,
+            "chainID": self.chain_id,
+            "version": self.version,
+            "options": self.options,
+            "guardian": self.guardian.to_bech32() if self.guardian else "",
+            "relayer": self.relayer.to_bech32() if self.relayer else "",
+        }
+        receivers = _Bech32Cache()
+        prefix = self.data_prefix
+
+        dictionaries: list[dict[str, Any]] = []
+        for index in range(len(self)):
+            dictionaries.append(
+                {
+                    "nonce": self._nonces[index],
+                    "value": str(self._values[index]),
+                    "receiver": receivers.get(self.get_receiver(index)),
+                    "sender": shared["sender"],
+                    "senderUsername": shared["senderUsername"],
+                    "receiverUsername": shared["receiverUsername"],
+                    "gasPrice": shared["gasPrice"],
+                    "gasLimit": self._gas_limits[index],
+                    "data": _value_to_b64_or_empty(prefix + self._data[index]),
+                    "chainID": shared["chainID"],
+                    "version": shared["version"],
+                    "options": shared["options"],
+                    "guardian": shared["guardian"],
+                    "signature": self._signatures[index].hex(),
+                    "guardianSignature": self._guardian_signatures[index].hex(),
+                    "relayer": shared["relayer"],
+                    "relayerSignature": self._relayer_signatures[index].hex(),
+                }
+            )
+
+        return dictionaries
+
+    def compute_bytes_for_signing(self, ignore_options: bool = False) -> list[bytes]:
+        """Equivalent to calling `TransactionComputer.compute_bytes_for_signing()` for every transaction of the batch.
+        The shared fields are validated and serialized only once."""
+        self._ensure_fields()
+
+        sender_part = _json_pair("sender", self.sender.to_bech32())
+        if self.sender_username:
+            sender_part += "," + _json_pair("senderUsername", _b64(self.sender_username.encode()))
+        if self.receiver_username:
+            sender_part += "," + _json_pair("receiverUsername", _b64(self.receiver_username.encode()))
+        sender_part += f',"gasPrice":{self.gas_price},"gasLimit":'
+
+        tail = "," + _json_pair("chainID", self.chain_id)
+        if self.version:
+            tail += f',"version":{self.version}'
+        if self.options:
+            tail += f',"options":{self.options}'
+        if self.guardian:
+            tail += "," + _json_pair("guardian", self.guardian.to_bech32())
+        if self.relayer:
+            tail += "," + _json_pair("relayer", self.relayer.to_bech32())
+        tail += "}"
+
+        should_hash = not ignore_options and self._has_options_set(TRANSACTION_OPTIONS_TX_HASH_SIGN)
+        if should_hash and not self.version >= MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS:
+            raise Exception("The transaction version you have set does not allow `options`.")
+
+        receivers = _Bech32Cache()
+        prefix = self.data_prefix
+
+        result: list[bytes] = []
+        for index in range(len(self)):
+            data = prefix + self._data[index]
+            data_part = ',"data":"' + _b64(data) + '"' if data else ""
+            serialized = (
+                f'{{"nonce":{self._nonces[index]},"value":"{self._values[index]}",'
+                f'"receiver":"{receivers.get(self.get_receiver(index))}",'
+                f"{sender_part}{self._gas_limits[index]}{data_part}{tail}"
+            ).encode()
+
+            if should_hash:
+                serialized = keccak.new(digest_bits=256).update(serialized).digest()
+
+            result.append(serialized)
+
+        return result
+
+    def compute_transaction_hashes(self) -> list[bytes]:
+        """Equivalent to calling `TransactionComputer.compute_transaction_hash()` for every transaction of the batch.
+        A single protobuf message is reused: the shared fields are set once, the varying ones are overwritten."""
+        serializer = ProtoSerializer()
+        proto_transaction = ProtoTransaction.Transaction()
+        proto_transaction.SndAddr = self.sender.get_public_key()
+        proto_transaction.SndUserName = self.sender_username.encode()
+        proto_transaction.RcvUserName = self.receiver_username.encode()
+        proto_transaction.GasPrice = self.gas_price
+        proto_transaction.ChainID = self.chain_id.encode()
+        proto_transaction.Version = self.version
+        proto_transaction.Options = self.options
+
+        has_guardian = self.guardian is not None and not self.guardian.is_empty()
+        if has_guardian:
+            proto_transaction.GuardAddr = self.guardian.get_public_key()  # type: ignore
+
+        has_relayer = self.relayer is not None and not self.relayer.is_empty()
+        if has_relayer:
+            proto_transaction.Relayer = self.relayer.get_public_key()  # type: ignore
+
+        prefix = self.data_prefix
+
+        hashes: list[bytes] = []
+        for index in range(len(self)):
+            proto_transaction.Nonce = self._nonces[index]
+            proto_transaction.Value = serializer.serialize_transaction_value(self._values[index])
+            proto_transaction.RcvAddr = self.get_receiver(index).get_public_key()
+            proto_transaction.GasLimit = self._gas_limits[index]
+            proto_transaction.Data = prefix + self._data[index]
+            proto_transaction.Signature = self._signatures[index]
+
+            if has_guardian:
+                proto_transaction.GuardSignature = self._guardian_signatures[index]
+            if has_relayer:
+                proto_transaction.RelayerSignature = self._relayer_signatures[index]
+
+            serialized = proto_transaction.SerializeToString()
+            hashes.append(blake2b(serialized, digest_size=DIGEST_SIZE).digest())
+
+        return hashes
+
+    def _get_default_receiver(self) -> Address:
+        assert self.receiver is not None
+        return self.receiver
+
+    def _has_options_set(self, flag: int) -> bool:
+        return (self.options & flag) == flag
+
+    def _ensure_fields(self) -> None:
+        """Same checks as `TransactionComputer._ensure_fields()`, performed once for the shared fields."""
+        if self.sender.is_empty():
+            raise BadUsageError("Invalid `sender` field. Should be the bech32 address of the sender.")
+
+        if any(receiver is not None and receiver.is_empty() for receiver in self._receivers):
+            raise BadUsageError("Invalid `receiver` field. Should be the bech32 address of the receiver.")
+
+        if self.receiver is not None and self.receiver.is_empty():
+            raise BadUsageError("Invalid `receiver` field. Should be the bech32 address of the receiver.")
+
+        if not len(self.chain_id):
+            raise BadUsageError("The `chainID` field is not set")
+
+        if self.version < MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS:
+            if self._has_options_set(TRANSACTION_OPTIONS_TX_GUARDED) or self._has_options_set(
+                TRANSACTION_OPTIONS_TX_HASH_SIGN
+            ):
+                raise BadUsageError(
+                    f"Non-empty transaction options requires transaction version >= {MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS}"
+                )
+
+    def _ensure_shared_fields_match(self, transaction: Transaction) -> None:
+        for field in [
+            "sender",
+            "chain_id",
+            "gas_price",
+            "version",
+            "options",
+            "sender_username",
+            "receiver_username",
+            "guardian",
+            "relayer",
+        ]:
+            if getattr(transaction, field) != getattr(self, field):
+                raise BadUsageError(f"All the transactions of a batch must have the same `{field}`")
+
+    def _ensure_column_length(self, column: Sequence[Any], name: str) -> None:
+        if len(column) != len(self):
+            raise BadUsageError(f"The number of {name} ({len(column)}) does not match the batch size ({len(self)})")
+
+    def __len__(self) -> int:
+        return len(self._nonces)
+
+    def __getitem__(self, index: int) -> Transaction:
+        return self.get_transaction(index)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(len(self)):
+            yield self.get_transaction(index)
+
+
+class _Bech32Cache:
+    """Addresses (e.g. receivers) are often repeated within a batch; their bech32 representation is only computed once."""
+
+    def __init__(self) -> None:
+        self._cache: dict[bytes, str] = {}
+
+    def get(self, address: Address) -> str:
+        key = address.get_hrp().encode() + address.get_public_key()
+        value = self._cache.get(key)
+        if value is None:
+            value = address.to_bech32()
+            self._cache[key] = value
+        return value
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _value_to_b64_or_empty(value: bytes) -> str:
+    return _b64(value) if len(value) else ""
+
+
+def _json_pair(key: str, value: str) -> str:
+    return f'"{key}":{json.dumps(value)}'
@@ -0,0 +1,140 @@
+from typing import Any
+
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.testutils.wallets import load_wallets
+
+
+class TestTransactionBatch:
+    wallets = load_wallets()
+    alice = wallets["alice"]
+    transaction_computer = TransactionComputer()
+
+    alice_address = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+    bob_address = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+    carol_address = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+    def create_transactions(self, **shared: Any) -> list[Transaction]:
+        return [
+            Transaction(
+                sender=self.alice_address,
+                receiver=self.bob_address,
+                gas_limit=50000,
+                chain_id="D",
+                nonce=7,
+                **shared,
+            ),
+            Transaction(
+                sender=self.alice_address,
+                receiver=self.carol_address,
+                gas_limit=120000,
+                chain_id="D",
+                nonce=8,
+                value=1000000000000000000,
+                data=b"hello",
+                **shared,
+            ),
+            Transaction(
+                sender=self.alice_address,
+                receiver=self.bob_address,
+                gas_limit=80000,
+                chain_id="D",
+                nonce=9,
+                value=42,
+                data=b"ESDTTransfer@54455354@01",
+                **shared,
+            ),
+        ]
+
+    def test_batch_matches_scalar_transactions(self):
+        transactions = self.create_transactions()
+        batch = TransactionBatch.new_from_transactions(transactions)
+
+        assert len(batch) == 3
+        assert batch.to_transactions() == transactions
+        assert batch.to_dictionaries() == [tx.to_dictionary() for tx in transactions]
+        assert batch.compute_bytes_for_signing() == [
+            self.transaction_computer.compute_bytes_for_signing(tx) for tx in transactions
+        ]
+        assert batch.compute_transaction_hashes() == [
+            self.transaction_computer.compute_transaction_hash(tx) for tx in transactions
+        ]
+
+    def test_batch_with_usernames_guardian_relayer_and_hash_signing(self):
+        transactions = self.create_transactions(
+            sender_username="alice",
+            receiver_username="bob",
+            version=2,
+            options=3,
+            guardian=self.carol_address,
+            relayer=self.bob_address,
+        )
+        for tx in transactions:
+            tx.guardian_signature = bytes([1] * 64)
+            tx.relayer_signature = bytes([2] * 64)
+
+        batch = TransactionBatch.new_from_transactions(transactions)
+
+        assert batch.to_dictionaries() == [tx.to_dictionary() for tx in transactions]
+        assert batch.compute_bytes_for_signing() == [
+            self.transaction_computer.compute_bytes_for_signing(tx) for tx in transactions
+        ]
+        assert batch.compute_bytes_for_signing(ignore_options=True) == [
+            self.transaction_computer.compute_bytes_for_signing(tx, ignore_options=True) for tx in transactions
+        ]
+        assert batch.compute_transaction_hashes() == [
+            self.transaction_computer.compute_transaction_hash(tx) for tx in transactions
+        ]
+
+    def test_shared_receiver_gas_limit_and_data_prefix(self):
+        batch = TransactionBatch(
+            sender=self.alice_address,
+            chain_id="D",
+            receiver=self.bob_address,
+            gas_limit=500000,
+            data_prefix=b"ESDTTransfer@",
+        )
+        batch.append(nonce=1, data=b"54455354@01")
+        batch.append(nonce=2, receiver=self.carol_address, gas_limit=600000, data=b"54455354@02")
+
+        first, second = batch
+        assert first.receiver == self.bob_address
+        assert first.gas_limit == 500000
+        assert first.data == b"ESDTTransfer@54455354@01"
+        assert second.receiver == self.carol_address
+        assert second.gas_limit == 600000
+        assert second.data == b"ESDTTransfer@54455354@02"
+
+    def test_sign_batch(self):
+        transactions = self.create_transactions()
+        batch = TransactionBatch.new_from_transactions(transactions)
+
+        signatures = [self.alice.secret_key.sign(data) for data in batch.compute_bytes_for_signing()]
+        batch.set_signatures(signatures)
+
+        for tx in transactions:
+            tx.signature = self.alice.secret_key.sign(self.transaction_computer.compute_bytes_for_signing(tx))
+
+        assert batch.to_transactions() == transactions
+        assert batch.compute_transaction_hashes() == [
+            self.transaction_computer.compute_transaction_hash(tx) for tx in transactions
+        ]
+
+    def test_bad_usage(self):
+        batch = TransactionBatch(sender=self.alice_address, chain_id="D")
+
+        with pytest.raises(BadUsageError, match="The `receiver` must be provided"):
+            batch.append(nonce=1, gas_limit=50000)
+
+        with pytest.raises(BadUsageError, match="The `gas_limit` must be provided"):
+            batch.append(nonce=1, receiver=self.bob_address)
+
+        transactions = self.create_transactions()
+        transactions[1].chain_id = "T"
+        with pytest.raises(BadUsageError, match="must have the same `chain_id`"):
+            TransactionBatch.new_from_transactions(transactions)
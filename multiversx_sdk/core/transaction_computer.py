@@ -2,7 +2,7 @@ import json
 from base64 import b64encode
 from collections import OrderedDict
 from hashlib import blake2b
-from typing import Any
+from typing import Any, Optional, Sequence, Union
 
 from Cryptodome.Hash import keccak
 
@@ -18,6 +18,11 @@ from multiversx_sdk.core.errors import BadUsageError, NotEnoughGasError
 from multiversx_sdk.core.interfaces import INetworkConfig
 from multiversx_sdk.core.proto.transaction_serializer import ProtoSerializer
 from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch, _Bech32Cache
+from multiversx_sdk.core.transaction_fees import (
+    TransactionFees,
+    compute_transaction_fees,
+)
 
 
 class TransactionComputer:
@@ -40,14 +45,73 @@ class TransactionComputer:
 
         return int(fee_for_move + processing_fee)
 
+    def compute_transaction_fees(
+        self,
+        transactions: Union[TransactionBatch, Sequence[Transaction]],
+        network_config: INetworkConfig,
+    ) -> TransactionFees:
+        """Vectorized (NumPy) version of `compute_transaction_fee()`. Instead of raising `NotEnoughGasError`,
+        the under-gassed transactions are flagged in the `not_enough_gas` mask of the result."""
+        if isinstance(transactions, TransactionBatch):
+            return compute_transaction_fees(
+                transactions.get_gas_limits(),
+                transactions.gas_price,
+                transactions.get_data_lengths(),
+                network_config,
+            )
+
+        gas_limits = [transaction.gas_limit for transaction in transactions]
+        gas_prices = [transaction.gas_price for transaction in transactions]
+        data_lengths = [len(transaction.data) for transaction in transactions]
+        return compute_transaction_fees(gas_limits, gas_prices, data_lengths, network_config)
+
     def compute_bytes_for_signing(self, transaction: Transaction, ignore_options: bool = False) -> bytes:
         """If `ignore_options == False`, the method computes the bytes for signing based on the `version` and `options` of the transaction.
         If the least significant bit of the `options` is set, will serialize transaction for hash signing.
 
         If `ignore_options == True`, the transaction is simply serialized."""
+        return self._compute_bytes_for_signing(transaction, ignore_options)
+
+    def compute_bytes_for_signing_many(
+        self,
+        transactions: Union[TransactionBatch, Sequence[Transaction]],
+        ignore_options: bool = False,
+    ) -> list[bytes]:
+        """Equivalent to calling `compute_bytes_for_signing()` for every transaction.
+        The bech32 representation of an address (e.g. the sender, shared by the whole list) is only computed once."""
+        if isinstance(transactions, TransactionBatch):
+            return transactions.compute_bytes_for_signing(ignore_options)
+
+        addresses = _Bech32Cache()
+        return [self._compute_bytes_for_signing(transaction, ignore_options, addresses) for transaction in transactions]
+
+    def compute_bytes_for_signing_many_or_none(
+        self,
+        transactions: Sequence[Transaction],
+        ignore_options: bool = False,
+    ) -> list[Optional[bytes]]:
+        """Same as `compute_bytes_for_signing_many()`, but a malformed transaction (e.g. without a chain ID) yields `None`,
+        instead of raising `BadUsageError` for the whole list."""
+        addresses = _Bech32Cache()
+        data_items: list[Optional[bytes]] = []
+
+        for transaction in transactions:
+            try:
+                data_items.append(self._compute_bytes_for_signing(transaction, ignore_options, addresses))
+            except BadUsageError:
+                data_items.append(None)
+
+        return data_items
+
+    def _compute_bytes_for_signing(
+        self,
+        transaction: Transaction,
+        ignore_options: bool,
+        addresses: Optional[_Bech32Cache] = None,
+    ) -> bytes:
         self._ensure_fields(transaction)
 
-        dictionary = self._to_dictionary(transaction)
+        dictionary = self._to_dictionary(transaction, addresses=addresses)
         serialized = self._dict_to_json(dictionary)
 
         if ignore_options:
@@ -129,14 +193,21 @@ class TransactionComputer:
                     f"Non-empty transaction options requires transaction version >= {MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS}"
                 )
 
-    def _to_dictionary(self, transaction: Transaction, with_signature: bool = False) -> dict[str, Any]:
+    def _to_dictionary(
+        self,
+        transaction: Transaction,
+        with_signature: bool = False,
+        addresses: Optional[_Bech32Cache] = None,
+    ) -> dict[str, Any]:
         """Only used when serializing transaction for signing. Internal use only."""
+        to_bech32 = addresses.get if addresses else Address.to_bech32
+
         dictionary: dict[str, Any] = OrderedDict()
         dictionary["nonce"] = transaction.nonce
         dictionary["value"] = str(transaction.value)
 
-        dictionary["receiver"] = transaction.receiver.to_bech32()
-        dictionary["sender"] = transaction.sender.to_bech32()
+        dictionary["receiver"] = to_bech32(transaction.receiver)
+        dictionary["sender"] = to_bech32(transaction.sender)
 
         if transaction.sender_username:
             dictionary["senderUsername"] = b64encode(transaction.sender_username.encode()).decode()
@@ -163,10 +234,10 @@ class TransactionComputer:
             dictionary["options"] = transaction.options
 
         if transaction.guardian:
-            dictionary["guardian"] = transaction.guardian.to_bech32()
+            dictionary["guardian"] = to_bech32(transaction.guardian)
 
         if transaction.relayer:
-            dictionary["relayer"] = transaction.relayer.to_bech32()
+            dictionary["relayer"] = to_bech32(transaction.relayer)
 
         return dictionary
 
@@ -1,4 +1,5 @@
 from types import SimpleNamespace
+from typing import Any, Sequence
 
 from multiversx_sdk.abi.abi import Abi
 from multiversx_sdk.core.transaction_on_network import TransactionEvent
@@ -17,13 +18,71 @@ class TransactionEventsParser:
         return [self.parse_event(event) for event in events]
 
     def parse_event(self, event: TransactionEvent) -> SimpleNamespace:
-        first_topic = event.topics[0].decode() if len(event.topics) else ""
-        abi_identifier = first_topic if first_topic and self.first_topic_as_identifier else event.identifier
-        topics = event.topics
-        if self.first_topic_as_identifier:
-            topics = topics[1:]
+        abi_identifier, topics = self._split_event(event)
         return self.abi.decode_event(
             event_name=abi_identifier,
             topics=topics,
             additional_data=event.additional_data,
         )
+
+    def parse_events_bulk(self, events: Sequence[TransactionEvent]) -> list[SimpleNamespace]:
+        """
+        Same as `parse_events()`, but the events are grouped by identifier, and each group is decoded in one pass.
+        The parsed events are returned in the original order.
+        """
+        groups = self._group_events(events)
+
+        if len(groups) == 1:
+            [(abi_identifier, (_, items))] = groups.items()
+            return self.abi.decode_events(abi_identifier, items)
+
+        parsed: list[Any] = [None] * len(events)
+
+        for abi_identifier, (positions, items) in groups.items():
+            for position, value in zip(positions, self.abi.decode_events(abi_identifier, items)):
+                parsed[position] = value
+
+        return parsed
+
+    def parse_events_columnar(
+        self, events: Sequence[TransactionEvent], numpy_arrays: bool = False
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Parses the events into columns: for each event identifier, the values of each field,
+        in the original order of the events.
+
+        Args:
+            events: the events to parse
+            numpy_arrays (bool): if set, the columns of fixed-size integers (e.g. u32, i64) are returned as NumPy arrays (requires `numpy`)
+        """
+        return {
+            abi_identifier: self.abi.decode_events_columnar(abi_identifier, items, numpy_arrays)
+            for abi_identifier, (_, items) in self._group_events(events).items()
+        }
+
+    def _group_events(
+        self, events: Sequence[TransactionEvent]
+    ) -> dict[str, tuple[list[int], list[tuple[list[bytes], list[bytes]]]]]:
+        groups: dict[str, tuple[list[int], list[tuple[list[bytes], list[bytes]]]]] = {}
+        split_event = self._split_event
+
+        for position, event in enumerate(events):
+            abi_identifier, topics = split_event(event)
+
+            group = groups.get(abi_identifier)
+            if group is None:
+                group = groups[abi_identifier] = ([], [])
+
+            group[0].append(position)
+            group[1].append((topics, event.additional_data))
+
+        return groups
+
+    def _split_event(self, event: TransactionEvent) -> tuple[str, list[bytes]]:
+        """Returns the identifier of the event (as found in the ABI) and the topics holding the indexed inputs."""
+        first_topic = event.topics[0].decode() if len(event.topics) else ""
+        abi_identifier = first_topic if first_topic and self.first_topic_as_identifier else event.identifier
+        topics = event.topics
+        if self.first_topic_as_identifier:
+            topics = topics[1:]
+        return abi_identifier, topics
@@ -245,6 +245,47 @@ def test_parse_esdt_safe_deposit_event_without_first_topic():
     )
 
 
+def test_parse_events_bulk_and_columnar():
+    abi = Abi.load(testdata / "esdt-safe.abi.json")
+    parser = TransactionEventsParser(abi=abi)
+
+    def create_event(identifier: str, topics: list[bytes], additional_data: list[bytes]) -> TransactionEvent:
+        return TransactionEvent(
+            raw={},
+            address=Address.empty(),
+            identifier="",
+            topics=[identifier.encode(), *topics],
+            data=b"",
+            additional_data=additional_data,
+        )
+
+    events = [
+        create_event("transferOverMaxAmount", [bytes([1]), bytes([2])], []),
+        create_event(
+            "deposit",
+            [
+                bytes.fromhex("726cc2d4b46dd6bd74a4c84d02715bf85cae76318cab81bc09e7c261d4149a67"),
+                bytes.fromhex("0000000c5745474c442d30316534396400000000000000000000000164"),
+            ],
+            [bytes.fromhex("00000000000003db000000")],
+        ),
+        create_event("transferOverMaxAmount", [bytes([3]), bytes([4])], []),
+    ]
+
+    parsed = parser.parse_events_bulk(events)
+    assert parsed == parser.parse_events(events)
+    assert parsed[0] == SimpleNamespace(batch_id=1, tx_id=2)
+    assert parsed[2] == SimpleNamespace(batch_id=3, tx_id=4)
+
+    columns = parser.parse_events_columnar(events)
+    assert list(columns) == ["transferOverMaxAmount", "deposit"]
+    assert columns["transferOverMaxAmount"] == {"batch_id": [1, 3], "tx_id": [2, 4]}
+    assert columns["deposit"]["event_data"] == [parsed[1].event_data]
+
+    assert parser.parse_events_bulk([]) == []
+    assert parser.parse_events_columnar([]) == {}
+
+
 @pytest.mark.networkInteraction
 def test_multisig_start_perform_action():
     api = ApiNetworkProvider("https://devnet-api.multiversx.com")
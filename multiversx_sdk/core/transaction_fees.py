@@ -0,0 +1,106 @@
+import math
+from typing import TYPE_CHECKING, Any, Sequence, Union
+
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.interfaces import INetworkConfig
+from multiversx_sdk.core.numpy_support import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INT64_UPPER_BOUND = 2**63
+
+
+class TransactionFees:
+    """The fees of many transactions, as NumPy arrays holding one entry per transaction.
+
+    Transactions that do not provide enough gas are flagged in `not_enough_gas`; their fees are set to `0`."""
+
+    def __init__(
+        self,
+        move_balance_gas: "np.ndarray",
+        fee_for_move: "np.ndarray",
+        processing_fee: "np.ndarray",
+        fee: "np.ndarray",
+        not_enough_gas: "np.ndarray",
+    ) -> None:
+        self.move_balance_gas = move_balance_gas
+        self.fee_for_move = fee_for_move
+        self.processing_fee = processing_fee
+        self.fee = fee
+        self.not_enough_gas = not_enough_gas
+
+    def __len__(self) -> int:
+        return len(self.fee)
+
+
+def compute_transaction_fees(
+    gas_limits: Union[Sequence[int], "np.ndarray"],
+    gas_prices: Union[int, Sequence[int], "np.ndarray"],
+    data_lengths: Union[Sequence[int], "np.ndarray"],
+    network_config: INetworkConfig,
+) -> TransactionFees:
+    """Vectorized version of `TransactionComputer.compute_transaction_fee()`.
+
+    The results match the scalar method exactly: the processing fee is computed in floating point (as the scalar method
+    does, since `gas_price_modifier` is a float) and the total fee is truncated to an integer.
+
+    Args:
+        gas_limits: the gas limit of each transaction\n
+        gas_prices: the gas price of each transaction, or a single gas price shared by all of them\n
+        data_lengths: the length of the `data` field of each transaction\n
+        network_config (INetworkConfig): `TransactionsFactoryConfig` can be used here, as well"""
+    np = import_numpy()
+
+    limits = np.asarray(gas_limits, dtype=np.int64)
+    lengths = np.asarray(data_lengths, dtype=np.int64)
+    prices = np.broadcast_to(np.asarray(gas_prices, dtype=np.int64), limits.shape)
+
+    if limits.shape != lengths.shape:
+        raise BadUsageError("The number of gas limits does not match the number of data lengths")
+
+    move_balance_gas = network_config.min_gas_limit + lengths * network_config.gas_per_data_byte
+    modifier = network_config.gas_price_modifier
+    _ensure_no_overflow(np, [limits, move_balance_gas], prices, modifier)
+
+    not_enough_gas = move_balance_gas > limits
+    fee_for_move = move_balance_gas * prices
+    diff = limits - move_balance_gas
+
+    if isinstance(modifier, int):
+        processing_fee = diff * (prices * modifier)
+        fee = fee_for_move + processing_fee
+    else:
+        processing_fee = diff * (prices * float(modifier))
+        fee = np.trunc(fee_for_move + processing_fee).astype(np.int64)
+
+    # the scalar method returns the (integer) fee for move as it is, when there is no processing fee
+    fee = np.where(diff == 0, fee_for_move, fee)
+
+    fee_for_move = np.where(not_enough_gas, 0, fee_for_move)
+    processing_fee = np.where(not_enough_gas, 0, processing_fee)
+    fee = np.where(not_enough_gas, 0, fee)
+
+    return TransactionFees(
+        move_balance_gas=move_balance_gas,
+        fee_for_move=fee_for_move,
+        processing_fee=processing_fee,
+        fee=fee,
+        not_enough_gas=not_enough_gas,
+    )
+
+
+def _ensure_no_overflow(
+    np: Any, gas_arrays: list["np.ndarray"], gas_prices: "np.ndarray", gas_price_modifier: float
+) -> None:
+    if not gas_prices.size:
+        return
+
+    max_gas = max(int(np.abs(array).max()) for array in gas_arrays)
+    max_gas_price = int(np.abs(gas_prices).max())
+
+    # fee for move + processing fee
+    max_factor = 1 + max(1, math.ceil(abs(gas_price_modifier)))
+
+    if max_gas * max_gas_price * max_factor >= INT64_UPPER_BOUND:
+        raise BadUsageError("Fees exceed the 64-bit range; use `TransactionComputer.compute_transaction_fee()` instead")
@@ -0,0 +1,92 @@
+import random
+
+import numpy as np
+import pytest
+
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError, NotEnoughGasError
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_batch import TransactionBatch
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.core.transaction_fees import compute_transaction_fees
+
+
+class NetworkConfig:
+    def __init__(self, min_gas_limit: int = 50000, gas_price_modifier: float = 0.01) -> None:
+        self.min_gas_limit = min_gas_limit
+        self.gas_per_data_byte = 1500
+        self.gas_price_modifier = gas_price_modifier
+
+
+class TestTransactionFees:
+    transaction_computer = TransactionComputer()
+    alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+    bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+    def test_compute_transaction_fees(self):
+        fees = compute_transaction_fees(
+            gas_limits=[20, 12010, 50000],
+            gas_prices=500,
+            data_lengths=[0, 8, 17],
+            network_config=NetworkConfig(min_gas_limit=10),
+        )
+
+        assert fees.fee.tolist() == [5050, 6005000, 12877450]
+        assert fees.move_balance_gas.tolist() == [10, 12010, 25510]
+        assert fees.not_enough_gas.tolist() == [False, False, False]
+
+    def test_not_enough_gas_is_flagged(self):
+        fees = compute_transaction_fees(
+            gas_limits=[50000, 100000],
+            gas_prices=[1000000000, 1000000000],
+            data_lengths=[17, 0],
+            network_config=NetworkConfig(),
+        )
+
+        assert fees.not_enough_gas.tolist() == [True, False]
+        assert fees.fee.tolist() == [0, 50500000000000]
+
+    def test_matches_scalar_computation(self):
+        rng = random.Random(42)
+        network_configs = [NetworkConfig(), NetworkConfig(gas_price_modifier=0.3), NetworkConfig(gas_price_modifier=1)]
+
+        transactions: list[Transaction] = []
+        for _ in range(2000):
+            data = bytes(rng.randint(0, 300))
+            gas_limit = rng.choice([50000 + len(data) * 1500, rng.randint(50000, 600_000_000)])
+            transactions.append(
+                Transaction(
+                    sender=self.alice,
+                    receiver=self.bob,
+                    gas_limit=gas_limit,
+                    gas_price=rng.choice([1000000000, rng.randint(1, 5 * 10**9)]),
+                    chain_id="D",
+                    data=data,
+                )
+            )
+
+        for network_config in network_configs:
+            fees = self.transaction_computer.compute_transaction_fees(transactions, network_config)
+
+            for index, transaction in enumerate(transactions):
+                try:
+                    expected = self.transaction_computer.compute_transaction_fee(transaction, network_config)
+                except NotEnoughGasError:
+                    assert fees.not_enough_gas[index]
+                    continue
+
+                assert not fees.not_enough_gas[index]
+                assert int(fees.fee[index]) == expected
+
+    def test_compute_fees_of_batch(self):
+        batch = TransactionBatch(sender=self.alice, chain_id="D", receiver=self.bob, gas_price=500)
+        batch.append(nonce=0, gas_limit=20)
+        batch.append(nonce=1, gas_limit=12010, data=b"testdata")
+
+        fees = self.transaction_computer.compute_transaction_fees(batch, NetworkConfig(min_gas_limit=10))
+        assert isinstance(fees.fee, np.ndarray)
+        assert fees.fee.tolist() == [5050, 6005000]
+
+    def test_overflow_is_rejected(self):
+        with pytest.raises(BadUsageError, match="64-bit range"):
+            compute_transaction_fees([2**40], [2**30], [0], NetworkConfig())
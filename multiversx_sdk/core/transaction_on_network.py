@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.core.transaction_status import TransactionStatus
@@ -55,30 +55,68 @@ class TransactionOnNetwork:
     status: TransactionStatus
     smart_contract_results: list[SmartContractResult]
     logs: TransactionLogs
+    _events_index: Optional["TransactionEventsIndex"] = field(default=None, init=False, repr=False, compare=False)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
 
-def find_events_by_identifier(transaction: TransactionOnNetwork, identifier: str) -> list[TransactionEvent]:
-    return find_events_by_predicate(transaction, lambda event: event.identifier == identifier)
+        # The events index is dropped when the containers of the events are replaced.
+        if name in ("logs", "smart_contract_results"):
+            super().__setattr__("_events_index", None)
 
+    def get_events_index(self) -> "TransactionEventsIndex":
+        """Returns the index of the events of the transaction (built on first use, then reused by all lookups).
+        The index is dropped when `logs` or `smart_contract_results` are reassigned. If the events are changed in place,
+        call `invalidate_events_index()`."""
+        if self._events_index is None:
+            self._events_index = TransactionEventsIndex(self)
+        return self._events_index
 
-def find_events_by_first_topic(transaction: TransactionOnNetwork, topic: str) -> list[TransactionEvent]:
-    def is_topic_matching(event: TransactionEvent):
-        if not len(event.topics):
-            return False
+    def invalidate_events_index(self) -> None:
+        self._events_index = None
+
+
+class TransactionEventsIndex:
+    """
+    Groups the events of a transaction (including the ones of the smart contract results) by identifier
+    and, on first use, by (decoded) first topic, so that lookups do not have to scan all the events.
+    """
+
+    def __init__(self, transaction: TransactionOnNetwork) -> None:
+        self.all_events = tuple(gather_all_events(transaction))
+        self._by_identifier: dict[str, list[TransactionEvent]] = {}
+        self._by_first_topic: Optional[dict[str, list[TransactionEvent]]] = None
 
-        try:
-            decoded_topic = event.topics[0].decode()
-            return decoded_topic == topic
-        except UnicodeDecodeError:
-            return False
+        for event in self.all_events:
+            self._by_identifier.setdefault(event.identifier, []).append(event)
 
-    return find_events_by_predicate(transaction, is_topic_matching)
+    def get_events_by_identifier(self, identifier: str) -> list[TransactionEvent]:
+        return list(self._by_identifier.get(identifier, []))
+
+    def get_events_by_first_topic(self, topic: str) -> list[TransactionEvent]:
+        if self._by_first_topic is None:
+            self._by_first_topic = {}
+
+            for event in self.all_events:
+                first_topic = _decode_first_topic(event)
+                if first_topic is not None:
+                    self._by_first_topic.setdefault(first_topic, []).append(event)
+
+        return list(self._by_first_topic.get(topic, []))
+
+
+def find_events_by_identifier(transaction: TransactionOnNetwork, identifier: str) -> list[TransactionEvent]:
+    return transaction.get_events_index().get_events_by_identifier(identifier)
+
+
+def find_events_by_first_topic(transaction: TransactionOnNetwork, topic: str) -> list[TransactionEvent]:
+    return transaction.get_events_index().get_events_by_first_topic(topic)
 
 
 def find_events_by_predicate(
     transaction: TransactionOnNetwork, predicate: Callable[[TransactionEvent], bool]
 ) -> list[TransactionEvent]:
-    events = gather_all_events(transaction)
+    events = transaction.get_events_index().all_events
     return list(filter(predicate, events))
 
 
@@ -89,3 +127,13 @@ def gather_all_events(transaction: TransactionOnNetwork) -> list[TransactionEven
         all_events.extend(result.logs.events)
 
     return all_events
+
+
+def _decode_first_topic(event: TransactionEvent) -> Optional[str]:
+    if not len(event.topics):
+        return None
+
+    try:
+        return event.topics[0].decode()
+    except UnicodeDecodeError:
+        return None
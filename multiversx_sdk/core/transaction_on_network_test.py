@@ -0,0 +1,92 @@
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.transaction_on_network import (
+    TransactionEvent,
+    TransactionLogs,
+    find_events_by_first_topic,
+    find_events_by_identifier,
+    gather_all_events,
+)
+from multiversx_sdk.testutils.mock_transaction_on_network import (
+    get_empty_smart_contract_result,
+    get_empty_transaction_on_network,
+)
+
+
+def create_event(identifier: str, topics: list[bytes]) -> TransactionEvent:
+    return TransactionEvent(
+        raw={},
+        address=Address.empty(),
+        identifier=identifier,
+        topics=topics,
+        data=b"",
+        additional_data=[],
+    )
+
+
+def test_find_events():
+    transaction = get_empty_transaction_on_network()
+    transaction.logs.events = [
+        create_event("ESDTTransfer", [b"TEST-123456", b"", b"\x01"]),
+        create_event("writeLog", []),
+        create_event("signalError", [b"\xff\xfe", b"error"]),
+    ]
+
+    result = get_empty_smart_contract_result()
+    result.logs.events = [create_event("ESDTTransfer", [b"FOO-abcdef"]), create_event("completedTxEvent", [])]
+    transaction.smart_contract_results = [get_empty_smart_contract_result(), result]
+
+    all_events = gather_all_events(transaction)
+    assert len(all_events) == 5
+
+    assert find_events_by_identifier(transaction, "ESDTTransfer") == [all_events[0], all_events[3]]
+    assert find_events_by_identifier(transaction, "completedTxEvent") == [all_events[4]]
+    assert find_events_by_identifier(transaction, "missing") == []
+
+    assert find_events_by_first_topic(transaction, "TEST-123456") == [all_events[0]]
+    assert find_events_by_first_topic(transaction, "FOO-abcdef") == [all_events[3]]
+    assert find_events_by_first_topic(transaction, "error") == []
+
+    index = transaction.get_events_index()
+    assert index.all_events == tuple(all_events)
+    assert index.get_events_by_first_topic("FOO-abcdef") == [all_events[3]]
+
+
+def test_events_index_is_cached_and_dropped_when_events_are_replaced():
+    transaction = get_empty_transaction_on_network()
+    transaction.logs.events = [create_event("writeLog", [])]
+
+    index = transaction.get_events_index()
+    assert transaction.get_events_index() is index
+
+    # modifying the returned lists must not alter the index
+    find_events_by_identifier(transaction, "writeLog").clear()
+    assert len(find_events_by_identifier(transaction, "writeLog")) == 1
+
+    # the first topics are only indexed when queried
+    assert index._by_first_topic is None
+    find_events_by_first_topic(transaction, "foo")
+    assert index._by_first_topic == {}
+
+    transaction.logs = TransactionLogs(address=Address.empty(), events=[create_event("writeLog", [])] * 2)
+    assert transaction.get_events_index() is not index
+    assert len(find_events_by_identifier(transaction, "writeLog")) == 2
+
+    result = get_empty_smart_contract_result()
+    result.logs.events = [create_event("writeLog", [])]
+    transaction.smart_contract_results = [result]
+    assert len(find_events_by_identifier(transaction, "writeLog")) == 3
+
+    # changes in place are only visible after an explicit invalidation
+    transaction.logs.events.append(create_event("writeLog", []))
+    assert len(find_events_by_identifier(transaction, "writeLog")) == 3
+    transaction.invalidate_events_index()
+    assert len(find_events_by_identifier(transaction, "writeLog")) == 4
+
+
+def test_events_index_is_not_part_of_equality():
+    first = get_empty_transaction_on_network()
+    second = get_empty_transaction_on_network()
+    first.get_events_index()
+
+    assert first == second
+    assert "_events_index" not in repr(first)
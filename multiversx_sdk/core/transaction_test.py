@@ -423,6 +423,33 @@ class TestTransaction:
             == r"""{"nonce":89,"value":"0","receiver":"erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th","sender":"erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th","gasPrice":1000000000,"gasLimit":50000,"chainID":"D","version":2,"relayer":"erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"}"""
         )
 
+    def test_compute_bytes_for_signing_many(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+        bob_on_testnet = Address(bob.get_public_key(), "test")
+
+        transactions = [
+            Transaction(sender=alice, receiver=bob, gas_limit=50000, chain_id="D", nonce=1),
+            Transaction(sender=alice, receiver=bob_on_testnet, gas_limit=50000, chain_id="D", nonce=2, options=1),
+            Transaction(sender=alice, receiver=alice, gas_limit=50000, chain_id="D", guardian=bob, relayer=bob),
+        ]
+
+        expected = [self.transaction_computer.compute_bytes_for_signing(transaction) for transaction in transactions]
+        assert self.transaction_computer.compute_bytes_for_signing_many(transactions) == expected
+
+        expected = [
+            self.transaction_computer.compute_bytes_for_signing(transaction, True) for transaction in transactions
+        ]
+        assert self.transaction_computer.compute_bytes_for_signing_many(transactions, ignore_options=True) == expected
+
+        # Malformed transactions yield None (instead of raising for the whole list).
+        transactions[1].chain_id = ""
+        expected = [self.transaction_computer.compute_bytes_for_signing(transactions[0]), None]
+        assert self.transaction_computer.compute_bytes_for_signing_many_or_none(transactions[:2]) == expected
+
+        with pytest.raises(BadUsageError, match="The `chainID` field is not set"):
+            self.transaction_computer.compute_bytes_for_signing_many(transactions)
+
     def test_relayed_v3(self):
         alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
         bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
@@ -1,13 +1,27 @@
-from multiversx_sdk.delegation.delegation_controller import DelegationController
-from multiversx_sdk.delegation.delegation_transactions_factory import (
-    DelegationTransactionsFactory,
-)
-from multiversx_sdk.delegation.delegation_transactions_outcome_parser import (
-    DelegationTransactionsOutcomeParser,
-)
-from multiversx_sdk.delegation.delegation_transactions_outcome_parser_types import (
-    CreateNewDelegationContractOutcome,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.delegation.delegation_controller import DelegationController
+    from multiversx_sdk.delegation.delegation_transactions_factory import (
+        DelegationTransactionsFactory,
+    )
+    from multiversx_sdk.delegation.delegation_transactions_outcome_parser import (
+        DelegationTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.delegation.delegation_transactions_outcome_parser_types import (
+        CreateNewDelegationContractOutcome,
+    )
+
+_EXPORTS = {
+    "DelegationController": "multiversx_sdk.delegation.delegation_controller",
+    "DelegationTransactionsFactory": "multiversx_sdk.delegation.delegation_transactions_factory",
+    "DelegationTransactionsOutcomeParser": "multiversx_sdk.delegation.delegation_transactions_outcome_parser",
+    "CreateNewDelegationContractOutcome": "multiversx_sdk.delegation.delegation_transactions_outcome_parser_types",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "DelegationController",
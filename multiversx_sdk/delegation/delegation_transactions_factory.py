@@ -1,4 +1,4 @@
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 
 from multiversx_sdk.abi import Serializer
 from multiversx_sdk.abi.biguint_value import BigUIntValue
@@ -25,13 +25,13 @@ class DelegationTransactionsFactory(BaseFactory):
     def create_transaction_for_new_delegation_contract(
         self, sender: Address, total_delegation_cap: int, service_fee: int, amount: int
     ) -> Transaction:
-        parts = ["createNewDelegationContract"]
+        parts: list[Union[str, bytes]] = ["createNewDelegationContract"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [BigUIntValue(total_delegation_cap), BigUIntValue(service_fee)]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -358,13 +358,13 @@ class DelegationTransactionsFactory(BaseFactory):
         website: str,
         identifier: str,
     ) -> Transaction:
-        parts = ["setMetaData"]
+        parts: list[Union[str, bytes]] = ["setMetaData"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [StringValue(name), StringValue(website), StringValue(identifier)]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
         gas_limit = self.config.gas_limit_delegation_operations + self.config.additional_gas_for_delegation_operations
 
         transaction = Transaction(
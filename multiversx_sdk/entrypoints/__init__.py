@@ -1,12 +1,35 @@
-from multiversx_sdk.entrypoints.entrypoints import (
-    DevnetEntrypoint,
-    LocalnetEntrypoint,
-    MainnetEntrypoint,
-    NetworkEntrypoint,
-    TestnetEntrypoint,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.entrypoints.co_signing_engine import (
+        CoSigningEngine,
+        CoSigningStats,
+    )
+    from multiversx_sdk.entrypoints.entrypoints import (
+        DevnetEntrypoint,
+        LocalnetEntrypoint,
+        MainnetEntrypoint,
+        NetworkEntrypoint,
+        TestnetEntrypoint,
+    )
+
+_EXPORTS = {
+    "CoSigningEngine": "multiversx_sdk.entrypoints.co_signing_engine",
+    "CoSigningStats": "multiversx_sdk.entrypoints.co_signing_engine",
+    "DevnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "LocalnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "MainnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "NetworkEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+    "TestnetEntrypoint": "multiversx_sdk.entrypoints.entrypoints",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
+    "CoSigningEngine",
+    "CoSigningStats",
     "DevnetEntrypoint",
     "MainnetEntrypoint",
     "NetworkEntrypoint",
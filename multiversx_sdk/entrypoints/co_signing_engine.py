@@ -0,0 +1,180 @@
+import time
+from typing import Optional, Protocol, Sequence
+
+from multiversx_sdk.accounts.account import Account
+from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.wallet.user_keys import verify_many
+
+DEFAULT_SEND_CHUNK_SIZE = 100
+
+REJECTED_MALFORMED = "malformed transaction"
+REJECTED_INVALID_SIGNATURE = "invalid sender signature"
+REJECTED_UNEXPECTED_RELAYER = "relayer is not the co-signer"
+REJECTED_UNEXPECTED_GUARDIAN = "guardian is not the co-signer"
+REJECTED_NOT_GUARDED = "options not set for guarded transaction"
+
+
+# fmt: off
+class INetworkProvider(Protocol):
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        ...
+# fmt: on
+
+
+class CoSigningStats:
+    def __init__(self) -> None:
+        self.received = 0
+        self.co_signed = 0
+        self.sent = 0
+        self.rejected: dict[str, int] = {}
+        self.not_accepted_by_network = 0
+        self.co_signing_seconds = 0.0
+        self.sending_seconds = 0.0
+
+    @property
+    def co_signed_per_second(self) -> float:
+        """The number of transactions verified and co-signed per second (sending excluded)."""
+        return self.co_signed / self.co_signing_seconds if self.co_signing_seconds else 0.0
+
+    @property
+    def sent_per_second(self) -> float:
+        return self.sent / self.sending_seconds if self.sending_seconds else 0.0
+
+
+class CoSigningEngine:
+    """
+    Co-signs, as relayer (relayed V3) and / or as guardian, batches of transactions already signed by their senders, then sends them.
+
+    The bytes for signing of a batch are computed once: they are used to verify the senders' signatures (in bulk)
+    and to sign as relayer / guardian. The relayer and guardian fields are part of the bytes signed by the senders,
+    thus they have to be set (see `prepare()`) before the senders sign; the engine only checks them.
+    """
+
+    def __init__(
+        self,
+        network_provider: INetworkProvider,
+        relayer: Optional[Account] = None,
+        guardian: Optional[Account] = None,
+        send_chunk_size: int = DEFAULT_SEND_CHUNK_SIZE,
+        num_processes: int = 1,
+    ) -> None:
+        """
+        Args:
+            network_provider (INetworkProvider): used to send the transactions (e.g. a `ProxyNetworkProvider`)\n
+            relayer (Optional[Account]): the relayer account, if the engine co-signs relayed V3 transactions\n
+            guardian (Optional[Account]): the guardian account, if the engine co-signs guarded transactions\n
+            send_chunk_size (int): the maximum number of transactions sent by a single `send_transactions()` call\n
+            num_processes (int): if greater than 1, very large batches are verified and co-signed by a pool of worker processes
+        """
+        if relayer is None and guardian is None:
+            raise BadUsageError("At least one of `relayer` and `guardian` must be provided")
+
+        self.network_provider = network_provider
+        self.relayer = relayer
+        self.guardian = guardian
+        self.send_chunk_size = send_chunk_size
+        self.num_processes = num_processes
+        self.stats = CoSigningStats()
+        self._transaction_computer = TransactionComputer()
+
+    def prepare(self, transactions: Sequence[Transaction]) -> None:
+        """Sets the relayer and / or the guardian (and the options of guarded transactions), before the senders sign."""
+        for transaction in transactions:
+            if self.relayer:
+                transaction.relayer = self.relayer.address
+            if self.guardian:
+                self._transaction_computer.apply_guardian(transaction, self.guardian.address)
+
+    def co_sign(self, transactions: Sequence[Transaction]) -> list[Optional[str]]:
+        """Verifies the senders' signatures and co-signs the valid transactions (in place).
+        Returns, for each transaction, the reason of its rejection (or `None`, if it has been co-signed)."""
+        started_at = time.perf_counter()
+
+        # The malformed transactions (without bytes for signing) are rejected upfront.
+        data_by_index = {
+            index: data
+            for index, data in enumerate(
+                self._transaction_computer.compute_bytes_for_signing_many_or_none(transactions)
+            )
+            if data is not None
+        }
+        well_formed = list(data_by_index)
+
+        public_keys = [transactions[index].sender.get_public_key() for index in well_formed]
+        signatures = [transactions[index].signature for index in well_formed]
+        is_valid = verify_many(public_keys, list(data_by_index.values()), signatures, self.num_processes)
+
+        rejections: list[Optional[str]] = [REJECTED_MALFORMED] * len(transactions)
+        for index, valid in zip(well_formed, is_valid):
+            rejections[index] = self._check_fields(transactions[index]) if valid else REJECTED_INVALID_SIGNATURE
+
+        accepted = [index for index, rejection in enumerate(rejections) if rejection is None]
+        accepted_data_items = [data_by_index[index] for index in accepted]
+
+        if self.relayer:
+            relayer_signatures = self.relayer.secret_key.sign_many(accepted_data_items, self.num_processes)
+            for index, signature in zip(accepted, relayer_signatures):
+                transactions[index].relayer_signature = signature
+
+        if self.guardian:
+            guardian_signatures = self.guardian.secret_key.sign_many(accepted_data_items, self.num_processes)
+            for index, signature in zip(accepted, guardian_signatures):
+                transactions[index].guardian_signature = signature
+
+        self.stats.received += len(transactions)
+        self.stats.co_signed += len(accepted)
+        self.stats.co_signing_seconds += time.perf_counter() - started_at
+
+        for rejection in rejections:
+            if rejection is not None:
+                self.stats.rejected[rejection] = self.stats.rejected.get(rejection, 0) + 1
+
+        return rejections
+
+    def send(self, transactions: Sequence[Transaction]) -> list[bytes]:
+        """Sends the transactions in chunks. Returns their hashes, in order (empty, for the ones not accepted by the network)."""
+        started_at = time.perf_counter()
+        hashes: list[bytes] = []
+
+        for start in range(0, len(transactions), self.send_chunk_size):
+            chunk = list(transactions[start : start + self.send_chunk_size])
+            num_sent, chunk_hashes = self.network_provider.send_transactions(chunk)
+            hashes.extend(chunk_hashes)
+
+            self.stats.sent += num_sent
+            self.stats.not_accepted_by_network += len(chunk) - num_sent
+
+        self.stats.sending_seconds += time.perf_counter() - started_at
+        return hashes
+
+    def co_sign_and_send(self, transactions: Sequence[Transaction]) -> list[bytes]:
+        """Co-signs the transactions, then sends the accepted ones.
+        Returns the hashes, in order (empty, for the rejected transactions and the ones not accepted by the network)."""
+        rejections = self.co_sign(transactions)
+        accepted = [index for index, rejection in enumerate(rejections) if rejection is None]
+        accepted_hashes = self.send([transactions[index] for index in accepted])
+
+        hashes = [b""] * len(transactions)
+        for index, transaction_hash in zip(accepted, accepted_hashes):
+            hashes[index] = transaction_hash
+
+        return hashes
+
+    def _check_fields(self, transaction: Transaction) -> Optional[str]:
+        if self.relayer and not _is_same_account(transaction.relayer, self.relayer):
+            return REJECTED_UNEXPECTED_RELAYER
+
+        if self.guardian:
+            if not _is_same_account(transaction.guardian, self.guardian):
+                return REJECTED_UNEXPECTED_GUARDIAN
+            if not self._transaction_computer.has_options_set_for_guarded_transaction(transaction):
+                return REJECTED_NOT_GUARDED
+
+        return None
+
+
+def _is_same_account(address: Optional[Address], account: Account) -> bool:
+    return address is not None and address.get_public_key() == account.address.get_public_key()
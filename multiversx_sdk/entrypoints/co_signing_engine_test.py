@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.accounts.account import Account
+from multiversx_sdk.core.errors import BadUsageError
+from multiversx_sdk.core.transaction import Transaction
+from multiversx_sdk.core.transaction_computer import TransactionComputer
+from multiversx_sdk.entrypoints.co_signing_engine import (
+    REJECTED_INVALID_SIGNATURE,
+    REJECTED_MALFORMED,
+    REJECTED_UNEXPECTED_RELAYER,
+    CoSigningEngine,
+)
+
+testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
+
+
+class NetworkProviderMock:
+    def __init__(self) -> None:
+        self.chunks: list[list[Transaction]] = []
+
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        self.chunks.append(transactions)
+        # The mock rejects the transactions with odd nonces.
+        hashes = [
+            TransactionComputer().compute_transaction_hash(tx) if tx.nonce % 2 == 0 else b"" for tx in transactions
+        ]
+        return len([tx_hash for tx_hash in hashes if tx_hash]), hashes
+
+
+def test_co_sign_and_send():
+    alice = Account.new_from_pem(testwallets / "alice.pem")
+    bob = Account.new_from_pem(testwallets / "bob.pem")
+    carol = Account.new_from_pem(testwallets / "carol.pem")
+    grace = Account.new_from_pem(testwallets / "grace.pem")
+
+    provider = NetworkProviderMock()
+    engine = CoSigningEngine(provider, relayer=carol, guardian=grace, send_chunk_size=2)
+
+    transactions = [
+        Transaction(sender=alice.address, receiver=bob.address, gas_limit=150000, chain_id="D", nonce=nonce)
+        for nonce in range(6)
+    ]
+    engine.prepare(transactions)
+
+    for transaction in transactions:
+        transaction.signature = alice.sign_transaction(transaction)
+
+    # A bad sender signature, and a transaction (properly signed) with another relayer.
+    transactions[1].signature = bytes(64)
+    transactions[3].relayer = bob.address
+    transactions[3].signature = alice.sign_transaction(transactions[3])
+
+    hashes = engine.co_sign_and_send(transactions)
+
+    computer = TransactionComputer()
+    for index in [0, 2, 4, 5]:
+        data = computer.compute_bytes_for_signing(transactions[index])
+        assert carol.verify(data, transactions[index].relayer_signature)
+        assert grace.verify(data, transactions[index].guardian_signature)
+
+    assert transactions[1].relayer_signature == b""
+    assert transactions[3].guardian_signature == b""
+
+    assert [len(chunk) for chunk in provider.chunks] == [2, 2]
+    assert [bool(tx_hash) for tx_hash in hashes] == [True, False, True, False, True, False]
+
+    assert engine.stats.received == 6
+    assert engine.stats.co_signed == 4
+    assert engine.stats.sent == 3
+    assert engine.stats.not_accepted_by_network == 1
+    assert engine.stats.rejected == {REJECTED_INVALID_SIGNATURE: 1, REJECTED_UNEXPECTED_RELAYER: 1}
+
+
+def test_co_sign_rejects_malformed_transactions():
+    alice = Account.new_from_pem(testwallets / "alice.pem")
+    bob = Account.new_from_pem(testwallets / "bob.pem")
+    carol = Account.new_from_pem(testwallets / "carol.pem")
+
+    engine = CoSigningEngine(NetworkProviderMock(), relayer=carol)
+
+    transactions = [
+        Transaction(sender=alice.address, receiver=bob.address, gas_limit=150000, chain_id="D", nonce=nonce)
+        for nonce in range(3)
+    ]
+    engine.prepare(transactions)
+
+    for transaction in transactions:
+        transaction.signature = alice.sign_transaction(transaction)
+
+    transactions[1].chain_id = ""
+
+    assert engine.co_sign(transactions) == [None, REJECTED_MALFORMED, None]
+    assert transactions[1].relayer_signature == b""
+    assert transactions[2].relayer_signature != b""
+    assert engine.stats.co_signed == 2
+    assert engine.stats.rejected == {REJECTED_MALFORMED: 1}
+
+
+def test_co_signer_is_required():
+    with pytest.raises(BadUsageError):
+        CoSigningEngine(NetworkProviderMock())
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from multiversx_sdk.abi.abi import Abi
 from multiversx_sdk.account_management import AccountController
@@ -19,6 +19,7 @@ from multiversx_sdk.delegation import DelegationController
 from multiversx_sdk.delegation.delegation_transactions_factory import (
     DelegationTransactionsFactory,
 )
+from multiversx_sdk.entrypoints.co_signing_engine import CoSigningEngine
 from multiversx_sdk.entrypoints.config import (
     DevnetEntrypointConfig,
     LocalnetEntrypointConfig,
@@ -53,7 +54,7 @@ from multiversx_sdk.transfers.transfer_transactions_factory import (
     TransferTransactionsFactory,
 )
 from multiversx_sdk.transfers.transfers_controller import TransfersController
-from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.user_keys import UserSecretKey, verify_many
 from multiversx_sdk.wallet.user_verifer import UserVerifier
 
 
@@ -121,6 +122,43 @@ class NetworkEntrypoint:
             signature=message.signature,
         )
 
+    def verify_transactions(self, transactions: Sequence[Transaction], num_processes: int = 1) -> list[bool]:
+        """Verifies the signatures of many transactions (e.g. from different senders) and returns one result per transaction.
+        Invalid signatures yield `False` (and are not logged).
+
+        Args:
+            transactions (Sequence[Transaction]): the signed transactions\n
+            num_processes (int): if greater than 1, very large batches are verified by a pool of worker processes"""
+        # For the transactions signed by hash, the bytes for signing are the bytes for verifying, as well.
+        data_items = TransactionComputer().compute_bytes_for_signing_many_or_none(transactions)
+        public_keys = [transaction.sender.get_public_key() for transaction in transactions]
+        # Malformed transactions (without bytes for verifying) are given an empty signature, thus they yield `False`.
+        signatures = [
+            transaction.signature if data is not None else b"" for transaction, data in zip(transactions, data_items)
+        ]
+
+        return verify_many(public_keys, [data or b"" for data in data_items], signatures, num_processes)
+
+    def verify_messages(self, messages: Sequence[Message], num_processes: int = 1) -> list[bool]:
+        """Verifies the signatures of many messages and returns one result per message.
+        Invalid signatures yield `False` (and are not logged).
+
+        Args:
+            messages (Sequence[Message]): the signed messages; their `address` must be set\n
+            num_processes (int): if greater than 1, very large batches are verified by a pool of worker processes"""
+        message_computer = MessageComputer()
+        public_keys: list[bytes] = []
+
+        for message in messages:
+            if message.address is None:
+                raise Exception("`address` property of Message is not set")
+            public_keys.append(message.address.get_public_key())
+
+        data_items = [message_computer.compute_bytes_for_verifying(message) for message in messages]
+        signatures = [message.signature for message in messages]
+
+        return verify_many(public_keys, data_items, signatures, num_processes)
+
     def recall_account_nonce(self, address: Address) -> int:
         return self.network_provider.get_account(address).nonce
 
@@ -153,6 +191,19 @@ class NetworkEntrypoint:
     def create_gas_limit_estimator(self) -> GasLimitEstimator:
         return GasLimitEstimator(network_provider=self.network_provider, gas_multiplier=self.gas_limit_multiplier)
 
+    def create_co_signing_engine(
+        self,
+        relayer: Optional[Account] = None,
+        guardian: Optional[Account] = None,
+        num_processes: int = 1,
+    ) -> CoSigningEngine:
+        return CoSigningEngine(
+            network_provider=self.network_provider,
+            relayer=relayer,
+            guardian=guardian,
+            num_processes=num_processes,
+        )
+
     def create_delegation_controller(self) -> DelegationController:
         return DelegationController(
             self._get_chain_id(),
@@ -6,6 +6,8 @@ from multiversx_sdk.abi.abi import Abi
 from multiversx_sdk.accounts import Account
 from multiversx_sdk.accounts.ledger_account import LedgerAccount
 from multiversx_sdk.core.address import Address
+from multiversx_sdk.core.message import Message
+from multiversx_sdk.core.transaction import Transaction
 from multiversx_sdk.entrypoints.entrypoints import DevnetEntrypoint, NetworkEntrypoint
 from multiversx_sdk.entrypoints.errors import InvalidNetworkProviderKindError
 from multiversx_sdk.network_providers.api_network_provider import ApiNetworkProvider
@@ -232,6 +234,39 @@ class TestEntrypoint:
         _ = entrypoint.create_delegation_controller()
         assert entrypoint.chain_id == "D"
 
+    def test_verify_transactions_and_messages(self):
+        alice = Account.new_from_pem(self.alice_pem)
+        grace = Account.new_from_pem(self.grace_pem)
+
+        transactions = [
+            Transaction(sender=sender.address, receiver=alice.address, gas_limit=50000, chain_id="D", nonce=nonce)
+            for nonce, sender in enumerate([alice, grace, alice, grace])
+        ]
+        transactions[2].options = 1
+        alice.sign_transactions(transactions[0::2])
+        grace.sign_transactions(transactions[1::2])
+        transactions[3].signature = bytes(64)
+
+        expected = [True, True, True, False]
+        assert self.entrypoint.verify_transactions(transactions) == expected
+        # A malformed transaction only fails its own verification.
+        malformed = Transaction(sender=alice.address, receiver=alice.address, gas_limit=50000, chain_id="D")
+        malformed.signature = alice.sign_transaction(malformed)
+        malformed.chain_id = ""
+        assert self.entrypoint.verify_transactions(transactions + [malformed]) == expected + [False]
+
+        assert self.entrypoint.verify_transactions(transactions, num_processes=2) == expected
+        assert [self.entrypoint.verify_transaction_signature(transaction) for transaction in transactions] == expected
+
+        messages = [Message(b"hello", address=alice.address), Message(b"world", address=grace.address)]
+        messages[0].signature = alice.sign_message(messages[0])
+        messages[1].signature = alice.sign_message(messages[1])
+
+        assert self.entrypoint.verify_messages(messages) == [True, False]
+
+        with pytest.raises(Exception, match="`address` property of Message is not set"):
+            self.entrypoint.verify_messages([Message(b"hello")])
+
     def test_should_estimate_gas_limit(self):
         entrypoint = DevnetEntrypoint(with_gas_limit_estimator=True, gas_limit_multiplier=1.5)
         controller = entrypoint.create_transfers_controller()
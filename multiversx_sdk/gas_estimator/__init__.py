@@ -1,4 +1,15 @@
-from multiversx_sdk.gas_estimator.gas_limit_estimator import GasLimitEstimator
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.gas_estimator.gas_limit_estimator import GasLimitEstimator
+
+_EXPORTS = {
+    "GasLimitEstimator": "multiversx_sdk.gas_estimator.gas_limit_estimator",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "GasLimitEstimator",
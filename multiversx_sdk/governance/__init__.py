@@ -1,20 +1,41 @@
-from multiversx_sdk.governance.governance_controller import GovernanceController
-from multiversx_sdk.governance.governance_transactions_factory import (
-    GovernanceTransactionsFactory,
-)
-from multiversx_sdk.governance.governance_transactions_outcome_parser import (
-    GovernanceTransactionsOutcomeParser,
-)
-from multiversx_sdk.governance.resources import (
-    CloseProposalOutcome,
-    DelegatedVoteInfo,
-    DelegateVoteOutcome,
-    GovernanceConfig,
-    NewProposalOutcome,
-    ProposalInfo,
-    VoteOutcome,
-    VoteType,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.governance.governance_controller import GovernanceController
+    from multiversx_sdk.governance.governance_transactions_factory import (
+        GovernanceTransactionsFactory,
+    )
+    from multiversx_sdk.governance.governance_transactions_outcome_parser import (
+        GovernanceTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.governance.resources import (
+        CloseProposalOutcome,
+        DelegatedVoteInfo,
+        DelegateVoteOutcome,
+        GovernanceConfig,
+        NewProposalOutcome,
+        ProposalInfo,
+        VoteOutcome,
+        VoteType,
+    )
+
+_EXPORTS = {
+    "GovernanceController": "multiversx_sdk.governance.governance_controller",
+    "GovernanceTransactionsFactory": "multiversx_sdk.governance.governance_transactions_factory",
+    "GovernanceTransactionsOutcomeParser": "multiversx_sdk.governance.governance_transactions_outcome_parser",
+    "CloseProposalOutcome": "multiversx_sdk.governance.resources",
+    "DelegatedVoteInfo": "multiversx_sdk.governance.resources",
+    "DelegateVoteOutcome": "multiversx_sdk.governance.resources",
+    "GovernanceConfig": "multiversx_sdk.governance.resources",
+    "NewProposalOutcome": "multiversx_sdk.governance.resources",
+    "ProposalInfo": "multiversx_sdk.governance.resources",
+    "VoteOutcome": "multiversx_sdk.governance.resources",
+    "VoteType": "multiversx_sdk.governance.resources",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "VoteType",
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union
 
 from multiversx_sdk.abi.biguint_value import BigUIntValue
 from multiversx_sdk.abi.serializer import Serializer
@@ -34,11 +34,10 @@ class GovernanceTransactionsFactory(BaseFactory):
         end_vote_epoch: int,
         native_token_amount: int,
     ) -> Transaction:
-        data_parts = ["proposal"]
+        data_parts: list[Union[str, bytes]] = ["proposal"]
         serialized_args = self._serializer.serialize_to_parts(
             [StringValue(commit_hash), BigUIntValue(start_vote_epoch), BigUIntValue(end_vote_epoch)]
         )
-        serialized_args = [arg.hex() for arg in serialized_args]
         data_parts.extend(serialized_args)
 
         transaction = Transaction(
@@ -61,7 +60,7 @@ class GovernanceTransactionsFactory(BaseFactory):
         vote: VoteType,
     ) -> Transaction:
         serialized_args = self._serializer.serialize_to_parts([BigUIntValue(proposal_nonce), StringValue(vote.value)])
-        data_parts = ["vote"] + [arg.hex() for arg in serialized_args]
+        data_parts: list[Union[str, bytes]] = ["vote", *serialized_args]
 
         transaction = Transaction(
             sender=sender,
@@ -142,7 +141,7 @@ class GovernanceTransactionsFactory(BaseFactory):
         min_veto_threshold: int,
         min_pass_threshold: int,
     ) -> Transaction:
-        data_parts = ["changeConfig"]
+        data_parts: list[Union[str, bytes]] = ["changeConfig"]
         args = self._serializer.serialize_to_parts(
             [
                 StringValue(str(proposal_fee)),
@@ -152,7 +151,7 @@ class GovernanceTransactionsFactory(BaseFactory):
                 StringValue(str(min_pass_threshold)),
             ]
         )
-        data_parts = data_parts + [arg.hex() for arg in args]
+        data_parts.extend(args)
 
         transaction = Transaction(
             sender=sender,
@@ -1,3 +1,14 @@
-from multiversx_sdk.ledger.ledger_app import LedgerApp
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.ledger.ledger_app import LedgerApp
+
+_EXPORTS = {
+    "LedgerApp": "multiversx_sdk.ledger.ledger_app",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = ["LedgerApp"]
@@ -1,27 +1,55 @@
-from multiversx_sdk.multisig.multisig_controller import MultisigController
-from multiversx_sdk.multisig.multisig_transactions_factory import (
-    MultisigTransactionsFactory,
-)
-from multiversx_sdk.multisig.multisig_transactions_outcome_parser import (
-    MultisigTransactionsOutcomeParser,
-)
-from multiversx_sdk.multisig.resources import (
-    Action,
-    ActionFullInfo,
-    AddBoardMember,
-    AddProposer,
-    CallActionData,
-    ChangeQuorum,
-    EsdtTokenPayment,
-    EsdtTransferExecuteData,
-    RemoveUser,
-    SCDeployFromSource,
-    SCUpgradeFromSource,
-    SendAsyncCall,
-    SendTransferExecuteEgld,
-    SendTransferExecuteEsdt,
-    UserRole,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.multisig.multisig_controller import MultisigController
+    from multiversx_sdk.multisig.multisig_transactions_factory import (
+        MultisigTransactionsFactory,
+    )
+    from multiversx_sdk.multisig.multisig_transactions_outcome_parser import (
+        MultisigTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.multisig.resources import (
+        Action,
+        ActionFullInfo,
+        AddBoardMember,
+        AddProposer,
+        CallActionData,
+        ChangeQuorum,
+        EsdtTokenPayment,
+        EsdtTransferExecuteData,
+        RemoveUser,
+        SCDeployFromSource,
+        SCUpgradeFromSource,
+        SendAsyncCall,
+        SendTransferExecuteEgld,
+        SendTransferExecuteEsdt,
+        UserRole,
+    )
+
+_EXPORTS = {
+    "MultisigController": "multiversx_sdk.multisig.multisig_controller",
+    "MultisigTransactionsFactory": "multiversx_sdk.multisig.multisig_transactions_factory",
+    "MultisigTransactionsOutcomeParser": "multiversx_sdk.multisig.multisig_transactions_outcome_parser",
+    "Action": "multiversx_sdk.multisig.resources",
+    "ActionFullInfo": "multiversx_sdk.multisig.resources",
+    "AddBoardMember": "multiversx_sdk.multisig.resources",
+    "AddProposer": "multiversx_sdk.multisig.resources",
+    "CallActionData": "multiversx_sdk.multisig.resources",
+    "ChangeQuorum": "multiversx_sdk.multisig.resources",
+    "EsdtTokenPayment": "multiversx_sdk.multisig.resources",
+    "EsdtTransferExecuteData": "multiversx_sdk.multisig.resources",
+    "RemoveUser": "multiversx_sdk.multisig.resources",
+    "SCDeployFromSource": "multiversx_sdk.multisig.resources",
+    "SCUpgradeFromSource": "multiversx_sdk.multisig.resources",
+    "SendAsyncCall": "multiversx_sdk.multisig.resources",
+    "SendTransferExecuteEgld": "multiversx_sdk.multisig.resources",
+    "SendTransferExecuteEsdt": "multiversx_sdk.multisig.resources",
+    "UserRole": "multiversx_sdk.multisig.resources",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "MultisigTransactionsFactory",
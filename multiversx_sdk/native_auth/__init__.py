@@ -1,8 +1,22 @@
-from multiversx_sdk.native_auth.config import (
-    NativeAuthClientConfig,
-    NativeAuthServerConfig,
-)
-from multiversx_sdk.native_auth.native_auth_client import NativeAuthClient
-from multiversx_sdk.native_auth.native_auth_server import NativeAuthServer
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.native_auth.config import (
+        NativeAuthClientConfig,
+        NativeAuthServerConfig,
+    )
+    from multiversx_sdk.native_auth.native_auth_client import NativeAuthClient
+    from multiversx_sdk.native_auth.native_auth_server import NativeAuthServer
+
+_EXPORTS = {
+    "NativeAuthClientConfig": "multiversx_sdk.native_auth.config",
+    "NativeAuthServerConfig": "multiversx_sdk.native_auth.config",
+    "NativeAuthClient": "multiversx_sdk.native_auth.native_auth_client",
+    "NativeAuthServer": "multiversx_sdk.native_auth.native_auth_server",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = ["NativeAuthClient", "NativeAuthClientConfig", "NativeAuthServerConfig", "NativeAuthServer"]
@@ -1,31 +1,65 @@
-from multiversx_sdk.network_providers.account_awaiter import AccountAwaiter
-from multiversx_sdk.network_providers.api_network_provider import ApiNetworkProvider
-from multiversx_sdk.network_providers.config import (
-    NetworkProviderConfig,
-    RequestsRetryOptions,
-)
-from multiversx_sdk.network_providers.errors import NetworkProviderError
-from multiversx_sdk.network_providers.proxy_network_provider import ProxyNetworkProvider
-from multiversx_sdk.network_providers.resources import (
-    AccountOnNetwork,
-    AccountStorage,
-    AccountStorageEntry,
-    AwaitingOptions,
-    BlockCoordinates,
-    BlockOnNetwork,
-    FungibleTokenMetadata,
-    GenericResponse,
-    NetworkConfig,
-    NetworkStatus,
-    TokenAmountOnNetwork,
-    TokensCollectionMetadata,
-    TransactionCostResponse,
-)
-from multiversx_sdk.network_providers.transaction_awaiter import TransactionAwaiter
-from multiversx_sdk.network_providers.transaction_decoder import (
-    TransactionDecoder,
-    TransactionMetadata,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.network_providers.account_awaiter import AccountAwaiter
+    from multiversx_sdk.network_providers.api_network_provider import ApiNetworkProvider
+    from multiversx_sdk.network_providers.config import (
+        NetworkProviderConfig,
+        RequestsRetryOptions,
+    )
+    from multiversx_sdk.network_providers.errors import NetworkProviderError
+    from multiversx_sdk.network_providers.proxy_network_provider import (
+        ProxyNetworkProvider,
+    )
+    from multiversx_sdk.network_providers.resources import (
+        AccountOnNetwork,
+        AccountStorage,
+        AccountStorageEntry,
+        AwaitingOptions,
+        BlockCoordinates,
+        BlockOnNetwork,
+        FungibleTokenMetadata,
+        GenericResponse,
+        NetworkConfig,
+        NetworkStatus,
+        TokenAmountOnNetwork,
+        TokensCollectionMetadata,
+        TransactionCostResponse,
+    )
+    from multiversx_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+    from multiversx_sdk.network_providers.transaction_decoder import (
+        TransactionDecoder,
+        TransactionMetadata,
+    )
+
+_EXPORTS = {
+    "AccountAwaiter": "multiversx_sdk.network_providers.account_awaiter",
+    "ApiNetworkProvider": "multiversx_sdk.network_providers.api_network_provider",
+    "NetworkProviderConfig": "multiversx_sdk.network_providers.config",
+    "RequestsRetryOptions": "multiversx_sdk.network_providers.config",
+    "NetworkProviderError": "multiversx_sdk.network_providers.errors",
+    "ProxyNetworkProvider": "multiversx_sdk.network_providers.proxy_network_provider",
+    "AccountOnNetwork": "multiversx_sdk.network_providers.resources",
+    "AccountStorage": "multiversx_sdk.network_providers.resources",
+    "AccountStorageEntry": "multiversx_sdk.network_providers.resources",
+    "AwaitingOptions": "multiversx_sdk.network_providers.resources",
+    "BlockCoordinates": "multiversx_sdk.network_providers.resources",
+    "BlockOnNetwork": "multiversx_sdk.network_providers.resources",
+    "FungibleTokenMetadata": "multiversx_sdk.network_providers.resources",
+    "GenericResponse": "multiversx_sdk.network_providers.resources",
+    "NetworkConfig": "multiversx_sdk.network_providers.resources",
+    "NetworkStatus": "multiversx_sdk.network_providers.resources",
+    "TokenAmountOnNetwork": "multiversx_sdk.network_providers.resources",
+    "TokensCollectionMetadata": "multiversx_sdk.network_providers.resources",
+    "TransactionCostResponse": "multiversx_sdk.network_providers.resources",
+    "TransactionAwaiter": "multiversx_sdk.network_providers.transaction_awaiter",
+    "TransactionDecoder": "multiversx_sdk.network_providers.transaction_decoder",
+    "TransactionMetadata": "multiversx_sdk.network_providers.transaction_decoder",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "NetworkProviderError",
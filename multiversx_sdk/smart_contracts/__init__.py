@@ -1,21 +1,39 @@
-from multiversx_sdk.smart_contracts.smart_contract_controller import (
-    SmartContractController,
-)
-from multiversx_sdk.smart_contracts.smart_contract_query import (
-    SmartContractQuery,
-    SmartContractQueryResponse,
-)
-from multiversx_sdk.smart_contracts.smart_contract_transactions_factory import (
-    SmartContractTransactionsFactory,
-)
-from multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser import (
-    SmartContractTransactionsOutcomeParser,
-)
-from multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types import (
-    DeployedSmartContract,
-    ParsedSmartContractCallOutcome,
-    SmartContractDeployOutcome,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.smart_contracts.smart_contract_controller import (
+        SmartContractController,
+    )
+    from multiversx_sdk.smart_contracts.smart_contract_query import (
+        SmartContractQuery,
+        SmartContractQueryResponse,
+    )
+    from multiversx_sdk.smart_contracts.smart_contract_transactions_factory import (
+        SmartContractTransactionsFactory,
+    )
+    from multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser import (
+        SmartContractTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types import (
+        DeployedSmartContract,
+        ParsedSmartContractCallOutcome,
+        SmartContractDeployOutcome,
+    )
+
+_EXPORTS = {
+    "SmartContractController": "multiversx_sdk.smart_contracts.smart_contract_controller",
+    "SmartContractQuery": "multiversx_sdk.smart_contracts.smart_contract_query",
+    "SmartContractQueryResponse": "multiversx_sdk.smart_contracts.smart_contract_query",
+    "SmartContractTransactionsFactory": "multiversx_sdk.smart_contracts.smart_contract_transactions_factory",
+    "SmartContractTransactionsOutcomeParser": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser",
+    "DeployedSmartContract": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+    "ParsedSmartContractCallOutcome": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+    "SmartContractDeployOutcome": "multiversx_sdk.smart_contracts.smart_contract_transactions_outcome_parser_types",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "SmartContractQuery",
@@ -68,7 +68,8 @@ class SmartContractTransactionsFactory(BaseFactory):
         )
 
         prepared_arg = self._encode_deploy_arguments(list(arguments))
-        parts = [arg.hex() for arg in serialized_parts + prepared_arg]
+        # (the raw parts are hex-encoded by "set_payload()", directly into the data of the transaction)
+        parts = serialized_parts + prepared_arg
 
         transaction = Transaction(
             sender=sender,
@@ -133,7 +134,6 @@ class SmartContractTransactionsFactory(BaseFactory):
             if not data_parts
             else data_parts.append(self.serializer.serialize([StringValue(function)]))
         )
-        data_parts += [arg.hex() for arg in prepared_arguments]
 
         transaction = Transaction(
             sender=sender,
@@ -143,7 +143,7 @@ class SmartContractTransactionsFactory(BaseFactory):
             value=native_transfer_amount,
         )
 
-        self.set_payload(transaction, data_parts)
+        self.set_payload(transaction, [*data_parts, *prepared_arguments])
         self.set_gas_limit(transaction=transaction, gas_limit=gas_limit)
 
         return transaction
@@ -166,13 +166,13 @@ class SmartContractTransactionsFactory(BaseFactory):
 
         metadata = CodeMetadata(is_upgradeable, is_readable, is_payable, is_payable_by_sc)
 
-        parts = ["upgradeContract"]
+        parts: list[Union[str, bytes]] = ["upgradeContract"]
         serialized_parts = self.serializer.serialize_to_parts(
             [BytesValue(bytecode), CodeMetadataValue.new_from_code_metadata(metadata)]
         )
 
         prepared_arguments = self._encode_upgrade_arguments(list(arguments))
-        parts += [arg.hex() for arg in serialized_parts + prepared_arguments]
+        parts += serialized_parts + prepared_arguments
 
         transaction = Transaction(
             sender=sender,
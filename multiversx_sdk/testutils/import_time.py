@@ -0,0 +1,72 @@
+"""Measures the import time of common entry points of the SDK, using `python -X importtime`.
+
+Usage: python -m multiversx_sdk.testutils.import_time
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ENTRY_POINTS = [
+    "import multiversx_sdk",
+    "from multiversx_sdk import Address, Transaction",
+    "from multiversx_sdk import Address, Transaction, TransactionComputer",
+    "from multiversx_sdk import Account, UserSecretKey",
+    "from multiversx_sdk.abi import Abi",
+    "from multiversx_sdk import ProxyNetworkProvider",
+    "from multiversx_sdk import DevnetEntrypoint",
+    "from multiversx_sdk import *",
+]
+
+
+class ImportTimeReport:
+    def __init__(self, statement: str, total_microseconds: int, modules: list[str]) -> None:
+        self.statement = statement
+        self.total_microseconds = total_microseconds
+        self.modules = modules
+
+
+def measure_import_time(statement: str) -> ImportTimeReport:
+    """Runs the statement in a fresh interpreter and parses the output of `-X importtime`.
+    The total time is the sum of the cumulative times of the top-level imports."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent.parent,
+    )
+
+    total_microseconds = 0
+    modules: list[str] = []
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        modules.append(name.strip())
+
+        # nested imports are indented (two more spaces per level)
+        if not name.startswith("  "):
+            total_microseconds += int(cumulative)
+
+    return ImportTimeReport(statement, total_microseconds, modules)
+
+
+def measure_best_import_time(statement: str, repeat: int = 5) -> int:
+    return min(measure_import_time(statement).total_microseconds for _ in range(repeat))
+
+
+def main() -> None:
+    # imports done by the interpreter itself (e.g. "site") are subtracted
+    baseline = measure_best_import_time("pass")
+
+    for statement in ENTRY_POINTS:
+        best = measure_best_import_time(statement) - baseline
+        modules = measure_import_time(statement).modules
+        print(f"{best / 1000:>8.1f} ms  {len(modules):>5} modules  {statement}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,77 @@
-from multiversx_sdk.token_management.token_management_controller import (
-    TokenManagementController,
-)
-from multiversx_sdk.token_management.token_management_transactions_factory import (
-    TokenManagementTransactionsFactory,
-    TokenType,
-)
-from multiversx_sdk.token_management.token_management_transactions_outcome_parser import (
-    TokenManagementTransactionsOutcomeParser,
-)
-from multiversx_sdk.token_management.token_management_transactions_outcome_parser_types import (
-    AddQuantityOutcome,
-    BurnOutcome,
-    BurnQuantityOutcome,
-    ChangeTokenToDynamicOutcome,
-    FreezeOutcome,
-    IssueFungibleOutcome,
-    IssueNonFungibleOutcome,
-    IssueSemiFungibleOutcome,
-    MetadataRecreateOutcome,
-    MintOutcome,
-    ModifyCreatorOutcome,
-    ModifyRoyaltiesOutcome,
-    NFTCreateOutcome,
-    PauseOutcome,
-    RegisterAndSetAllRolesOutcome,
-    RegisterDynamicOutcome,
-    RegisterMetaEsdtOutcome,
-    SetNewUrisOutcome,
-    SetSpecialRoleOutcome,
-    UnFreezeOutcome,
-    UnPauseOutcome,
-    UpdateAttributesOutcome,
-    UpdateMetadataOutcome,
-    WipeOutcome,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.token_management.token_management_controller import (
+        TokenManagementController,
+    )
+    from multiversx_sdk.token_management.token_management_transactions_factory import (
+        TokenManagementTransactionsFactory,
+        TokenType,
+    )
+    from multiversx_sdk.token_management.token_management_transactions_outcome_parser import (
+        TokenManagementTransactionsOutcomeParser,
+    )
+    from multiversx_sdk.token_management.token_management_transactions_outcome_parser_types import (
+        AddQuantityOutcome,
+        BurnOutcome,
+        BurnQuantityOutcome,
+        ChangeTokenToDynamicOutcome,
+        FreezeOutcome,
+        IssueFungibleOutcome,
+        IssueNonFungibleOutcome,
+        IssueSemiFungibleOutcome,
+        MetadataRecreateOutcome,
+        MintOutcome,
+        ModifyCreatorOutcome,
+        ModifyRoyaltiesOutcome,
+        NFTCreateOutcome,
+        PauseOutcome,
+        RegisterAndSetAllRolesOutcome,
+        RegisterDynamicOutcome,
+        RegisterMetaEsdtOutcome,
+        SetNewUrisOutcome,
+        SetSpecialRoleOutcome,
+        UnFreezeOutcome,
+        UnPauseOutcome,
+        UpdateAttributesOutcome,
+        UpdateMetadataOutcome,
+        WipeOutcome,
+    )
+
+_EXPORTS = {
+    "TokenManagementController": "multiversx_sdk.token_management.token_management_controller",
+    "TokenManagementTransactionsFactory": "multiversx_sdk.token_management.token_management_transactions_factory",
+    "TokenType": "multiversx_sdk.token_management.token_management_transactions_factory",
+    "TokenManagementTransactionsOutcomeParser": "multiversx_sdk.token_management.token_management_transactions_outcome_parser",
+    "AddQuantityOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "BurnOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "BurnQuantityOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ChangeTokenToDynamicOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "FreezeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueNonFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "IssueSemiFungibleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "MetadataRecreateOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "MintOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ModifyCreatorOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "ModifyRoyaltiesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "NFTCreateOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "PauseOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterAndSetAllRolesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterDynamicOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "RegisterMetaEsdtOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "SetNewUrisOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "SetSpecialRoleOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UnFreezeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UnPauseOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UpdateAttributesOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "UpdateMetadataOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+    "WipeOutcome": "multiversx_sdk.token_management.token_management_transactions_outcome_parser_types",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "TokenManagementTransactionsFactory",
@@ -1,6 +1,6 @@
 import logging
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 from multiversx_sdk.abi import Serializer
 from multiversx_sdk.abi.biguint_value import BigUIntValue
@@ -48,7 +48,7 @@ class TokenManagementTransactionsFactory(BaseFactory):
     ) -> Transaction:
         self._notify_about_unsetting_burn_role_globally()
 
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "issue",
         ]
 
@@ -73,7 +73,7 @@ class TokenManagementTransactionsFactory(BaseFactory):
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -113,7 +113,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
     ) -> Transaction:
         self._notify_about_unsetting_burn_role_globally()
 
-        parts = ["issueSemiFungible"]
+        parts: list[Union[str, bytes]] = ["issueSemiFungible"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -138,7 +138,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -168,7 +168,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
     ) -> Transaction:
         self._notify_about_unsetting_burn_role_globally()
 
-        parts = ["issueNonFungible"]
+        parts: list[Union[str, bytes]] = ["issueNonFungible"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -193,7 +193,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -224,7 +224,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
     ) -> Transaction:
         self._notify_about_unsetting_burn_role_globally()
 
-        parts = ["registerMetaESDT"]
+        parts: list[Union[str, bytes]] = ["registerMetaESDT"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -250,7 +250,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -275,7 +275,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
     ) -> Transaction:
         self._notify_about_unsetting_burn_role_globally()
 
-        parts = ["registerAndSetAllRoles"]
+        parts: list[Union[str, bytes]] = ["registerAndSetAllRoles"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -286,7 +286,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -348,7 +348,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         add_role_local_burn: bool = False,
         add_role_esdt_transfer_role: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "setSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -362,7 +362,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -385,7 +385,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         remove_role_local_burn: bool = False,
         remove_role_esdt_transfer_role: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "unSetSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -399,7 +399,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -428,7 +428,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         add_role_esdt_modify_creator: bool = False,
         add_role_nft_recreate: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "setSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -448,7 +448,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -476,7 +476,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         remove_role_esdt_modify_creator: bool = False,
         remove_role_nft_recreate: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "unSetSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -495,7 +495,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -563,7 +563,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         add_role_esdt_modify_creator: bool = False,
         add_role_nft_recreate: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "setSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -584,7 +584,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -613,7 +613,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         remove_role_esdt_modify_creator: bool = False,
         remove_role_nft_recreate: bool = False,
     ) -> Transaction:
-        parts = [
+        parts: list[Union[str, bytes]] = [
             "unSetSpecialRole",
             self.serializer.serialize([StringValue(token_identifier)]),
             user.to_hex(),
@@ -633,7 +633,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -661,7 +661,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         if not uris:
             raise BadUsageError("No URIs provided")
 
-        parts = ["ESDTNFTCreate"]
+        parts: list[Union[str, bytes]] = ["ESDTNFTCreate"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -675,7 +675,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         # Note that the following is an approximation (a reasonable one):
         nft_data = name + hash + attributes.hex() + "".join(uris)
@@ -834,7 +834,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         token_nonce: int,
         attributes: bytes,
     ) -> Transaction:
-        parts = ["ESDTNFTUpdateAttributes"]
+        parts: list[Union[str, bytes]] = ["ESDTNFTUpdateAttributes"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -844,7 +844,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -865,7 +865,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         token_nonce: int,
         quantity_to_add: int,
     ) -> Transaction:
-        parts = ["ESDTNFTAddQuantity"]
+        parts: list[Union[str, bytes]] = ["ESDTNFTAddQuantity"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -875,7 +875,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -896,7 +896,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         token_nonce: int,
         quantity_to_burn: int,
     ) -> Transaction:
-        parts = ["ESDTNFTBurn"]
+        parts: list[Union[str, bytes]] = ["ESDTNFTBurn"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -906,7 +906,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -927,7 +927,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         token_nonce: int,
         new_royalties: int,
     ) -> Transaction:
-        parts = ["ESDTModifyRoyalties"]
+        parts: list[Union[str, bytes]] = ["ESDTModifyRoyalties"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -937,7 +937,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -961,7 +961,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         if not new_uris:
             raise BadUsageError("No URIs provided")
 
-        parts = ["ESDTSetNewURIs"]
+        parts: list[Union[str, bytes]] = ["ESDTSetNewURIs"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -971,7 +971,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -1017,7 +1017,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         new_attributes: bytes,
         new_uris: list[str],
     ) -> Transaction:
-        parts = ["ESDTMetaDataUpdate"]
+        parts: list[Union[str, bytes]] = ["ESDTMetaDataUpdate"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -1031,7 +1031,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -1056,7 +1056,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         new_attributes: bytes,
         new_uris: list[str],
     ) -> Transaction:
-        parts = ["ESDTMetaDataRecreate"]
+        parts: list[Union[str, bytes]] = ["ESDTMetaDataRecreate"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -1070,7 +1070,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -1132,7 +1132,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         if token_type == TokenType.FNG:
             raise Exception("Cannot register fungible token as dynamic")
 
-        parts = ["registerDynamic"]
+        parts: list[Union[str, bytes]] = ["registerDynamic"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -1142,7 +1142,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         if token_type == TokenType.META and denominator is not None:
             parts.append(self.serializer.serialize([BigUIntValue(denominator)]))
@@ -1171,7 +1171,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         if token_type == TokenType.FNG:
             raise Exception("Cannot register fungible token as dynamic")
 
-        parts = ["registerAndSetAllRolesDynamic"]
+        parts: list[Union[str, bytes]] = ["registerAndSetAllRolesDynamic"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [
@@ -1181,7 +1181,7 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
             ]
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         if token_type == TokenType.META and denominator is not None:
             parts.append(self.serializer.serialize([BigUIntValue(denominator)]))
@@ -1355,13 +1355,13 @@ Once the token is registered, you can unset this role by calling "unsetBurnRoleG
         token_nonce: int,
         uris: list[str],
     ) -> Transaction:
-        parts = ["ESDTNFTAddURI"]
+        parts: list[Union[str, bytes]] = ["ESDTNFTAddURI"]
 
         serialized_parts = self.serializer.serialize_to_parts(
             [StringValue(token_identifier), BigUIntValue(token_nonce), *map(StringValue, uris)],
         )
 
-        parts.extend([part.hex() for part in serialized_parts])
+        parts.extend(serialized_parts)
 
         transaction = Transaction(
             sender=sender,
@@ -1,6 +1,18 @@
-from multiversx_sdk.transfers.transfer_transactions_factory import (
-    TransferTransactionsFactory,
-)
-from multiversx_sdk.transfers.transfers_controller import TransfersController
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.transfers.transfer_transactions_factory import (
+        TransferTransactionsFactory,
+    )
+    from multiversx_sdk.transfers.transfers_controller import TransfersController
+
+_EXPORTS = {
+    "TransferTransactionsFactory": "multiversx_sdk.transfers.transfer_transactions_factory",
+    "TransfersController": "multiversx_sdk.transfers.transfers_controller",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = ["TransferTransactionsFactory", "TransfersController"]
@@ -1,8 +1,21 @@
-from multiversx_sdk.validators.validators_controller import ValidatorsController
-from multiversx_sdk.validators.validators_signers import ValidatorsSigners
-from multiversx_sdk.validators.validators_transactions_factory import (
-    ValidatorsTransactionsFactory,
-)
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.validators.validators_controller import ValidatorsController
+    from multiversx_sdk.validators.validators_signers import ValidatorsSigners
+    from multiversx_sdk.validators.validators_transactions_factory import (
+        ValidatorsTransactionsFactory,
+    )
+
+_EXPORTS = {
+    "ValidatorsController": "multiversx_sdk.validators.validators_controller",
+    "ValidatorsSigners": "multiversx_sdk.validators.validators_signers",
+    "ValidatorsTransactionsFactory": "multiversx_sdk.validators.validators_transactions_factory",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "ValidatorsTransactionsFactory",
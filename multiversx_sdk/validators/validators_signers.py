@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from multiversx_sdk.wallet.errors import CannotSignError
+from multiversx_sdk.wallet.libraries.bls_facade import get_bls_facade
 from multiversx_sdk.wallet.validator_keys import ValidatorPublicKey
 from multiversx_sdk.wallet.validator_pem import ValidatorPEM
 from multiversx_sdk.wallet.validator_signer import ValidatorSigner
@@ -23,3 +25,12 @@ class ValidatorsSigners:
 
     def get_public_keys(self) -> list[ValidatorPublicKey]:
         return [signer.get_pubkey() for signer in self.signers]
+
+    def sign(self, data: bytes) -> list[bytes]:
+        """Signs the same data with the key of each node, in order."""
+        secret_keys = [signer.secret_key.buffer for signer in self.signers]
+
+        try:
+            return get_bls_facade().compute_message_signatures(data, secret_keys)
+        except Exception as err:
+            raise CannotSignError() from err
@@ -67,27 +67,26 @@ class ValidatorsTransactionsFactory(BaseFactory):
         node_operator: Address,
         validators_file: ValidatorsSigners,
         rewards_address: Optional[Address] = None,
-    ) -> list[str]:
-        data_parts = ["stake"]
+    ) -> list[Union[str, bytes]]:
+        data_parts: list[Union[str, bytes]] = ["stake"]
 
         num_of_nodes = validators_file.get_num_of_nodes()
 
         call_arguments: list[ISingleValue] = []
         call_arguments.append(U32Value(num_of_nodes))
 
-        validator_signers = validators_file.get_signers()
+        public_keys = validators_file.get_public_keys()
+        signed_messages = validators_file.sign(node_operator.get_public_key())
 
-        for validator in validator_signers:
-            signed_message = validator.sign(node_operator.get_public_key())
-
-            call_arguments.append(BytesValue(validator.secret_key.generate_public_key().buffer))
+        for public_key, signed_message in zip(public_keys, signed_messages):
+            call_arguments.append(BytesValue(public_key.buffer))
             call_arguments.append(BytesValue(signed_message))
 
         if rewards_address:
             call_arguments.append(AddressValue.new_from_address(rewards_address))
 
         args = self.serializer.serialize_to_parts(call_arguments)
-        return data_parts + [arg.hex() for arg in args]
+        return data_parts + args
 
     def create_transaction_for_topping_up(
         self,
@@ -329,9 +328,9 @@ class ValidatorsTransactionsFactory(BaseFactory):
         fee: int,
     ) -> Transaction:
         serializer = Serializer()
-        args = [arg.hex() for arg in serializer.serialize_to_parts([BigUIntValue(max_cap), BigUIntValue(fee)])]
+        args = serializer.serialize_to_parts([BigUIntValue(max_cap), BigUIntValue(fee)])
 
-        data_parts = ["makeNewContractFromValidatorData"] + args
+        data_parts: list[Union[str, bytes]] = ["makeNewContractFromValidatorData", *args]
 
         transaction = Transaction(
             sender=sender,
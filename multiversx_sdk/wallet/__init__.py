@@ -1,14 +1,48 @@
-from multiversx_sdk.wallet.keypair import KeyPair
-from multiversx_sdk.wallet.mnemonic import Mnemonic
-from multiversx_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
-from multiversx_sdk.wallet.user_pem import UserPEM
-from multiversx_sdk.wallet.user_signer import UserSigner
-from multiversx_sdk.wallet.user_verifer import UserVerifier
-from multiversx_sdk.wallet.user_wallet import UserWallet
-from multiversx_sdk.wallet.validator_keys import ValidatorPublicKey, ValidatorSecretKey
-from multiversx_sdk.wallet.validator_pem import ValidatorPEM
-from multiversx_sdk.wallet.validator_signer import ValidatorSigner
-from multiversx_sdk.wallet.validator_verifier import ValidatorVerifier
+from typing import TYPE_CHECKING
+
+from multiversx_sdk.core.lazy_imports import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from multiversx_sdk.wallet.keypair import KeyPair
+    from multiversx_sdk.wallet.keystore_provisioner import (
+        KeystoreProvisioner,
+        KeystoreProvisioningStats,
+    )
+    from multiversx_sdk.wallet.mnemonic import Mnemonic
+    from multiversx_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
+    from multiversx_sdk.wallet.user_keys_generator import UserKeysGenerator
+    from multiversx_sdk.wallet.user_pem import UserPEM
+    from multiversx_sdk.wallet.user_signer import UserSigner
+    from multiversx_sdk.wallet.user_verifer import UserVerifier
+    from multiversx_sdk.wallet.user_wallet import UserWallet
+    from multiversx_sdk.wallet.validator_keys import (
+        ValidatorPublicKey,
+        ValidatorSecretKey,
+    )
+    from multiversx_sdk.wallet.validator_pem import ValidatorPEM
+    from multiversx_sdk.wallet.validator_signer import ValidatorSigner
+    from multiversx_sdk.wallet.validator_verifier import ValidatorVerifier
+
+_EXPORTS = {
+    "KeyPair": "multiversx_sdk.wallet.keypair",
+    "KeystoreProvisioner": "multiversx_sdk.wallet.keystore_provisioner",
+    "KeystoreProvisioningStats": "multiversx_sdk.wallet.keystore_provisioner",
+    "Mnemonic": "multiversx_sdk.wallet.mnemonic",
+    "UserPublicKey": "multiversx_sdk.wallet.user_keys",
+    "UserSecretKey": "multiversx_sdk.wallet.user_keys",
+    "UserKeysGenerator": "multiversx_sdk.wallet.user_keys_generator",
+    "UserPEM": "multiversx_sdk.wallet.user_pem",
+    "UserSigner": "multiversx_sdk.wallet.user_signer",
+    "UserVerifier": "multiversx_sdk.wallet.user_verifer",
+    "UserWallet": "multiversx_sdk.wallet.user_wallet",
+    "ValidatorPublicKey": "multiversx_sdk.wallet.validator_keys",
+    "ValidatorSecretKey": "multiversx_sdk.wallet.validator_keys",
+    "ValidatorPEM": "multiversx_sdk.wallet.validator_pem",
+    "ValidatorSigner": "multiversx_sdk.wallet.validator_signer",
+    "ValidatorVerifier": "multiversx_sdk.wallet.validator_verifier",
+}
+
+__getattr__, __dir__ = create_lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "UserSigner",
@@ -24,4 +58,7 @@ __all__ = [
     "UserWallet",
     "UserPEM",
     "KeyPair",
+    "UserKeysGenerator",
+    "KeystoreProvisioner",
+    "KeystoreProvisioningStats",
 ]
@@ -1,11 +1,14 @@
 import hashlib
 import hmac
 import struct
+from functools import partial
+from typing import Iterable
 
 from mnemonic import Mnemonic
 
 from multiversx_sdk.wallet.constants import BIP39_LANGUAGE
 from multiversx_sdk.wallet.errors import InvalidMnemonicError
+from multiversx_sdk.wallet.worker_processes import run_in_worker_processes
 
 # TODO: Rename "core.py" to "bip39.py".
 
@@ -22,6 +25,13 @@ def derive_keys(mnemonic: str, address_index: int = 0):
     return secret_key
 
 
+def derive_keys_for_indices(mnemonic: str, address_indices: Iterable[int], num_processes: int = 1) -> list[bytes]:
+    """Same as calling `derive_keys()` for each index, but the seed and the common part of the derivation path
+    are only computed once. If `num_processes` is greater than 1, the indices are split across worker processes."""
+    bip39seed = mnemonic_to_bip39seed(mnemonic)
+    return bip39seed_to_secret_keys(bip39seed, address_indices, num_processes)
+
+
 # References:
 # https://github.com/trezor/python-mnemonic/blob/master/src/mnemonic/mnemonic.py
 # https://ethereum.stackexchange.com/a/72871/59887
@@ -47,12 +57,43 @@ def bip39seed_to_master_key(seed: bytes):
 
 # Reference: https://github.com/alepop/ed25519-hd-key
 def bip39seed_to_secret_key(seed: bytes, address_index: int = 0):
+    key, chain_code = _derive_path_prefix(seed)
+    key, _ = _ckd_priv(key, chain_code, address_index + HARDENED_OFFSET)
+    return key
+
+
+def bip39seed_to_secret_keys(seed: bytes, address_indices: Iterable[int], num_processes: int = 1) -> list[bytes]:
+    key, chain_code = _derive_path_prefix(seed)
+    address_indices = list(address_indices)
+
+    if num_processes <= 1 or len(address_indices) <= 1:
+        return _derive_last_segment(key, chain_code, address_indices)
+
+    return run_in_worker_processes(partial(_derive_last_segment, key, chain_code), num_processes, address_indices)
+
+
+def _derive_path_prefix(seed: bytes) -> tuple[bytes, bytes]:
+    """Derives the key and the chain code of the path shared by all addresses (i.e. "m/44'/508'/0'/0'")."""
     key, chain_code = bip39seed_to_master_key(seed)
 
-    for segment in BIP39_DERIVATION_PATH + [address_index]:
+    for segment in BIP39_DERIVATION_PATH:
         key, chain_code = _ckd_priv(key, chain_code, segment + HARDENED_OFFSET)
 
-    return key
+    return key, chain_code
+
+
+def _derive_last_segment(key: bytes, chain_code: bytes, address_indices: list[int]) -> list[bytes]:
+    # All children share the parent chain code (the HMAC key): the keyed HMAC is created once, then copied.
+    parent_hmac = hmac.new(chain_code, digestmod=hashlib.sha512)
+    prefix = b"\x00" + key
+    secret_keys: list[bytes] = []
+
+    for address_index in address_indices:
+        child_hmac = parent_hmac.copy()
+        child_hmac.update(prefix + struct.pack(">I", address_index + HARDENED_OFFSET))
+        secret_keys.append(child_hmac.digest()[:32])
+
+    return secret_keys
 
 
 # Reference: https://github.com/alepop/ed25519-hd-key
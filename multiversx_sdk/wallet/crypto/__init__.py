@@ -1,9 +1,11 @@
 from multiversx_sdk.wallet.crypto import decryptor, encryptor
 from multiversx_sdk.wallet.crypto.encrypted_data import EncryptedData
+from multiversx_sdk.wallet.crypto.key_derivation_cache import KeyDerivationCache
 from multiversx_sdk.wallet.crypto.randomness import Randomness
 
 __all__ = [
     "EncryptedData",
+    "KeyDerivationCache",
     "Randomness",
     "encryptor",
     "decryptor",
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
@@ -8,6 +10,7 @@ from multiversx_sdk.wallet.crypto.constants import (
     KEY_DERIVATION_FUNCTION_SCRYPT,
 )
 from multiversx_sdk.wallet.crypto.encrypted_data import EncryptedData
+from multiversx_sdk.wallet.crypto.key_derivation_cache import KeyDerivationCache
 from multiversx_sdk.wallet.errors import (
     InvalidKeystoreFilePasswordError,
     UnknownCipherError,
@@ -15,9 +18,15 @@ from multiversx_sdk.wallet.errors import (
 )
 
 
-def decrypt(encrypted_data: EncryptedData, password: str) -> bytes:
+def decrypt(
+    encrypted_data: EncryptedData,
+    password: str,
+    key_derivation_cache: Optional[KeyDerivationCache] = None,
+) -> bytes:
     """
     Also see: https://github.com/multiversx/mx-sdk-js-wallet/blob/main/src/crypto/decryptor.ts
+
+    If a `key_derivation_cache` is provided, the (costly) scrypt derivation is skipped for keystores decrypted before.
     """
     backend = default_backend()
 
@@ -31,16 +40,20 @@ def decrypt(encrypted_data: EncryptedData, password: str) -> bytes:
     iv = bytes.fromhex(encrypted_data.iv)
     ciphertext = bytes.fromhex(encrypted_data.ciphertext)
 
-    kdf = Scrypt(
-        salt=salt,
-        length=encrypted_data.kdfparams.dklen,
-        n=encrypted_data.kdfparams.n,
-        r=encrypted_data.kdfparams.r,
-        p=encrypted_data.kdfparams.p,
-        backend=backend,
-    )
+    derived_key = key_derivation_cache.get(encrypted_data, password) if key_derivation_cache is not None else None
+
+    if derived_key is None:
+        kdf = Scrypt(
+            salt=salt,
+            length=encrypted_data.kdfparams.dklen,
+            n=encrypted_data.kdfparams.n,
+            r=encrypted_data.kdfparams.r,
+            p=encrypted_data.kdfparams.p,
+            backend=backend,
+        )
+
+        derived_key = kdf.derive(bytes(password.encode()))
 
-    derived_key = kdf.derive(bytes(password.encode()))
     derived_key_first_half = derived_key[0:16]
     derived_key_second_half = derived_key[16:32]
 
@@ -52,6 +65,9 @@ def decrypt(encrypted_data: EncryptedData, password: str) -> bytes:
     if computed_mac != actual_mac:
         raise InvalidKeystoreFilePasswordError()
 
+    if key_derivation_cache is not None:
+        key_derivation_cache.put(encrypted_data, password, derived_key)
+
     cipher = Cipher(algorithms.AES(derived_key_first_half), modes.CTR(iv), backend=backend)
     decryptor = cipher.decryptor()
     data = decryptor.update(ciphertext) + decryptor.finalize()
@@ -0,0 +1,54 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from multiversx_sdk.wallet.crypto.encrypted_data import EncryptedData
+
+DEFAULT_KEY_DERIVATION_CACHE_MAX_SIZE = 128
+
+
+class KeyDerivationCache:
+    """
+    An opt-in, in-memory (never persisted), bounded cache of the keys derived (using scrypt) when decrypting keystores.
+    Thus, a keystore can be decrypted again (e.g. to derive other address indices from its mnemonic) without re-running the KDF.
+
+    Entries are keyed by the salt, the KDF parameters and a hash of the password. Only the keys that passed the MAC check are stored.
+    When full, the least recently used entry is evicted. The cache holds key material: keep its lifetime short, call `clear()` when done.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_KEY_DERIVATION_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, int, int, int, int, bytes], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, encrypted_data: EncryptedData, password: str) -> Optional[bytes]:
+        key = self._create_key(encrypted_data, password)
+
+        with self._lock:
+            derived_key = self._entries.get(key)
+            if derived_key is not None:
+                self._entries.move_to_end(key)
+            return derived_key
+
+    def put(self, encrypted_data: EncryptedData, password: str, derived_key: bytes) -> None:
+        key = self._create_key(encrypted_data, password)
+
+        with self._lock:
+            self._entries[key] = derived_key
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _create_key(self, encrypted_data: EncryptedData, password: str) -> tuple[str, int, int, int, int, bytes]:
+        params = encrypted_data.kdfparams
+        password_hash = hashlib.sha256(password.encode()).digest()
+        return (encrypted_data.salt, params.n, params.r, params.p, params.dklen, password_hash)
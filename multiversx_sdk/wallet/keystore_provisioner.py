@@ -0,0 +1,153 @@
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence
+
+from multiversx_sdk.core.config import LibraryConfig
+from multiversx_sdk.wallet.crypto.constants import RANDOM_IV_LENGTH, RANDOM_SALT_LENGTH
+from multiversx_sdk.wallet.crypto.randomness import Randomness
+from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.user_wallet import UserWallet
+
+DEFAULT_KEYSTORES_PER_BATCH = 32
+_UUID_LENGTH = 16
+
+
+class KeystoreProvisioningStats:
+    def __init__(self) -> None:
+        self.created = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def keystores_per_second(self) -> float:
+        return self.created / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class KeystoreProvisioner:
+    """
+    Creates many keystore files (with `kind=secretKey`), named after their addresses, e.g. for provisioning wallets in bulk.
+
+    The key derivation function (scrypt) dominates the cost of a keystore: if `num_processes` is greater than 1, the keystores
+    are encrypted and written by a pool of worker processes, in batches. The files are the same as the ones written by
+    `UserWallet.from_secret_key(...).save(...)`, thus they can be opened with `UserWallet.load_secret_key()` / `decrypt_secret_key()`.
+    """
+
+    def __init__(
+        self,
+        password: str,
+        address_hrp: Optional[str] = None,
+        num_processes: int = 1,
+        keystores_per_batch: int = DEFAULT_KEYSTORES_PER_BATCH,
+    ) -> None:
+        """
+        Args:
+            password (str): the password of all the keystores\n
+            address_hrp (Optional[str]): the human-readable part of the addresses\n
+            num_processes (int): the number of worker processes (1 means the keystores are created in the current process)\n
+            keystores_per_batch (int): the number of keystores created by a worker before reporting back
+        """
+        self.password = password
+        self.address_hrp = address_hrp or LibraryConfig.default_address_hrp
+        self.num_processes = num_processes
+        self.keystores_per_batch = keystores_per_batch
+        self.stats = KeystoreProvisioningStats()
+
+    def create(
+        self,
+        directory: Path,
+        count: int,
+        on_progress: Optional[Callable[[KeystoreProvisioningStats], None]] = None,
+    ) -> list[Path]:
+        """Generates `count` new secret keys and writes their keystores. The secret keys are generated by the workers, as well.
+        Returns the paths of the keystores. `on_progress` is called after each batch."""
+        return self._provision(directory, [None] * count, on_progress)
+
+    def save(
+        self,
+        directory: Path,
+        secret_keys: Sequence[UserSecretKey],
+        on_progress: Optional[Callable[[KeystoreProvisioningStats], None]] = None,
+    ) -> list[Path]:
+        """Writes the keystores of the given secret keys. Returns their paths, in order. `on_progress` is called after each batch."""
+        return self._provision(directory, [secret_key.get_bytes() for secret_key in secret_keys], on_progress)
+
+    def _provision(
+        self,
+        directory: Path,
+        seeds: list[Optional[bytes]],
+        on_progress: Optional[Callable[[KeystoreProvisioningStats], None]],
+    ) -> list[Path]:
+        directory = directory.expanduser().resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self.stats = KeystoreProvisioningStats()
+        started_at = time.perf_counter()
+
+        batches = [
+            seeds[start : start + self.keystores_per_batch] for start in range(0, len(seeds), self.keystores_per_batch)
+        ]
+        paths_by_batch: list[list[Path]] = [[] for _ in batches]
+
+        for batch_index, paths in self._run(directory, batches):
+            paths_by_batch[batch_index] = paths
+
+            self.stats.created += len(paths)
+            self.stats.elapsed_seconds = time.perf_counter() - started_at
+
+            if on_progress:
+                on_progress(self.stats)
+
+        return [path for paths in paths_by_batch for path in paths]
+
+    def _run(self, directory: Path, batches: list[list[Optional[bytes]]]) -> Iterator[tuple[int, list[Path]]]:
+        if self.num_processes <= 1 or len(batches) <= 1:
+            for batch_index, batch in enumerate(batches):
+                yield batch_index, _write_keystores(directory, self.password, self.address_hrp, batch)
+            return
+
+        # At most "num_processes" batches are submitted at once, so that the progress is reported as the batches complete.
+        with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
+            next_batch_index = 0
+            pending: dict[Future[list[Path]], int] = {}
+
+            while next_batch_index < len(batches) or pending:
+                while next_batch_index < len(batches) and len(pending) < self.num_processes:
+                    batch = batches[next_batch_index]
+                    future = executor.submit(_write_keystores, directory, self.password, self.address_hrp, batch)
+                    pending[future] = next_batch_index
+                    next_batch_index += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+
+def _write_keystores(directory: Path, password: str, address_hrp: str, seeds: list[Optional[bytes]]) -> list[Path]:
+    """Runs in a worker process (see `KeystoreProvisioner`). The randomness of the whole batch is drawn at once."""
+    randomness_length = RANDOM_SALT_LENGTH + RANDOM_IV_LENGTH + _UUID_LENGTH
+    random_bytes = os.urandom(randomness_length * len(seeds))
+    paths: list[Path] = []
+
+    for index, seed in enumerate(seeds):
+        secret_key = UserSecretKey(seed) if seed is not None else UserSecretKey.generate()
+
+        offset = index * randomness_length
+        salt = random_bytes[offset : offset + RANDOM_SALT_LENGTH]
+        offset += RANDOM_SALT_LENGTH
+        iv = random_bytes[offset : offset + RANDOM_IV_LENGTH]
+        offset += RANDOM_IV_LENGTH
+        id = str(uuid.UUID(bytes=random_bytes[offset : offset + _UUID_LENGTH], version=4))
+
+        wallet = UserWallet.from_secret_key(secret_key, password, Randomness(salt, iv, id))
+        address = secret_key.generate_public_key().to_address(address_hrp).to_bech32()
+        path = directory / f"{address}.json"
+
+        with open(path, "w") as file:
+            file.write(wallet.to_json(address_hrp))
+
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+from multiversx_sdk.wallet.keystore_provisioner import (
+    KeystoreProvisioner,
+    KeystoreProvisioningStats,
+)
+from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.user_wallet import UserWallet
+
+
+def test_create_keystores(tmp_path: Path):
+    progress: list[int] = []
+
+    def on_progress(stats: KeystoreProvisioningStats):
+        progress.append(stats.created)
+
+    provisioner = KeystoreProvisioner("password", num_processes=2, keystores_per_batch=2)
+    paths = provisioner.create(tmp_path, 5, on_progress)
+
+    assert len(paths) == 5
+    assert progress == [2, 4, 5]
+    assert provisioner.stats.created == 5
+    assert provisioner.stats.keystores_per_second > 0
+
+    for path in paths:
+        secret_key = UserWallet.load_secret_key(path, "password")
+        assert path.name == f"{secret_key.generate_public_key().to_address().to_bech32()}.json"
+
+
+def test_save_keystores(tmp_path: Path):
+    secret_keys = [UserSecretKey.generate() for _ in range(3)]
+
+    provisioner = KeystoreProvisioner("password", keystores_per_batch=2)
+    paths = provisioner.save(tmp_path, secret_keys)
+
+    assert [UserWallet.load_secret_key(path, "password") for path in paths] == secret_keys
+
+    # Same layout as the keystores written by "UserWallet.save()".
+    UserWallet.from_secret_key(secret_keys[0], "password").save(tmp_path / "reference.json")
+    reference = json.loads((tmp_path / "reference.json").read_text())
+    keystore = json.loads(paths[0].read_text())
+
+    assert keystore.keys() == reference.keys()
+    assert keystore["crypto"].keys() == reference["crypto"].keys()
+    assert keystore["crypto"]["kdfparams"] == {
+        **reference["crypto"]["kdfparams"],
+        "salt": keystore["crypto"]["kdfparams"]["salt"],
+    }
+    assert keystore["bech32"] == reference["bech32"]
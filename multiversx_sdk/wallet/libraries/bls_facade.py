@@ -1,14 +1,24 @@
+import binascii
 import ctypes
 import logging
 import platform
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from multiversx_sdk.wallet.errors import LibraryNotFoundError, UnsupportedOSError
 
 
 class BLSFacade:
+    """
+    The native library exchanges hex strings (it does not accept raw buffers, nor does it export aggregated verification).
+    The hex conversions are done with `binascii` and, for the batch methods, the shared inputs are converted only once.
+
+    The library is loaded once per process and shared by all instances (also see `get_bls_facade()`).
+    """
+
     _library: Optional[ctypes.CDLL] = None
+    _library_lock = threading.Lock()
 
     def __init__(self) -> None:
         pass
@@ -17,45 +27,81 @@ class BLSFacade:
         generate_private_key_function = self._get_library().generatePrivateKey
 
         output = generate_private_key_function()
-        output_bytes = ctypes.string_at(output)
-        private_key_hex = output_bytes.decode()
-        private_key = bytes.fromhex(private_key_hex)
-        return private_key
+        return _decode_hex_output(output)
 
     def generate_public_key(self, private_key: bytes) -> bytes:
+        return self.generate_public_keys([private_key])[0]
+
+    def generate_public_keys(self, private_keys: Sequence[bytes]) -> list[bytes]:
         generate_public_key_function = self._get_library().generatePublicKey
 
-        output = generate_public_key_function(private_key.hex().encode())
-        output_bytes = ctypes.string_at(output)
-        public_key_hex = output_bytes.decode()
-        public_key = bytes.fromhex(public_key_hex)
-        return public_key
+        return [
+            _decode_hex_output(generate_public_key_function(binascii.hexlify(private_key)))
+            for private_key in private_keys
+        ]
 
     def compute_message_signature(self, message: bytes, private_key: bytes) -> bytes:
+        return self.compute_messages_signatures([message], private_key)[0]
+
+    def compute_messages_signatures(self, messages: Sequence[bytes], private_key: bytes) -> list[bytes]:
+        """Signs many messages with the same private key."""
         compute_message_signature_function = self._get_library().computeMessageSignature
+        private_key_hex = binascii.hexlify(private_key)
 
-        output = compute_message_signature_function(message.hex().encode(), private_key.hex().encode())
+        return [
+            _decode_hex_output(compute_message_signature_function(binascii.hexlify(message), private_key_hex))
+            for message in messages
+        ]
+
+    def compute_message_signatures(self, message: bytes, private_keys: Sequence[bytes]) -> list[bytes]:
+        """Signs the same message with many private keys (e.g. the public key of a node operator, signed by each of its nodes)."""
+        compute_message_signature_function = self._get_library().computeMessageSignature
+        message_hex = binascii.hexlify(message)
 
-        output_bytes = ctypes.string_at(output)
-        signature_hex = output_bytes.decode()
-        signature = bytes.fromhex(signature_hex)
-        return signature
+        return [
+            _decode_hex_output(compute_message_signature_function(message_hex, binascii.hexlify(private_key)))
+            for private_key in private_keys
+        ]
 
     def verify_message_signature(self, public_key: bytes, message: bytes, signature: bytes) -> bool:
+        return self.verify_messages_signatures([public_key], [message], [signature])[0]
+
+    def verify_messages_signatures(
+        self,
+        public_keys: Sequence[bytes],
+        messages: Sequence[bytes],
+        signatures: Sequence[bytes],
+    ) -> list[bool]:
+        """Verifies many signatures, one by one (each item has its own public key, message and signature)."""
+        if not len(public_keys) == len(messages) == len(signatures):
+            raise ValueError("public_keys, messages and signatures must have the same length")
+
         verify_message_signature_function = self._get_library().verifyMessageSignature
+        public_keys_hex: dict[bytes, bytes] = {}
+        results: list[bool] = []
+
+        for public_key, message, signature in zip(public_keys, messages, signatures):
+            public_key_hex = public_keys_hex.get(public_key)
+            if public_key_hex is None:
+                public_key_hex = public_keys_hex[public_key] = binascii.hexlify(public_key)
 
-        output = verify_message_signature_function(
-            public_key.hex().encode(), message.hex().encode(), signature.hex().encode()
-        )
+            output = verify_message_signature_function(
+                public_key_hex, binascii.hexlify(message), binascii.hexlify(signature)
+            )
+            results.append(ctypes.c_int(output).value == 1)
 
-        output_int = ctypes.c_int(output)
-        return output_int.value == 1
+        return results
 
     def _get_library(self) -> ctypes.CDLL:
-        if self._library is None:
-            self._library = self._load_library()
+        library = BLSFacade._library
+
+        if library is None:
+            with BLSFacade._library_lock:
+                if BLSFacade._library is None:
+                    BLSFacade._library = self._load_library()
+                library = BLSFacade._library
 
-        return self._library
+        return library
 
     def _load_library(self) -> ctypes.CDLL:
         lib_path = self._get_library_path()
@@ -102,3 +148,18 @@ class BLSFacade:
             raise UnsupportedOSError(os_name)
 
         return Path(__file__).parent / lib_name
+
+
+_facade = BLSFacade()
+
+
+def get_bls_facade() -> BLSFacade:
+    """Returns the process-wide facade (the facade is stateless, thus it can be shared)."""
+    return _facade
+
+
+def _decode_hex_output(output: Optional[bytes]) -> bytes:
+    # (the "c_char_p" outputs are already converted to "bytes" by "ctypes")
+    if not output:
+        return b""
+    return binascii.unhexlify(output)
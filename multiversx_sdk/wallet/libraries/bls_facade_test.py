@@ -1,4 +1,4 @@
-from multiversx_sdk.wallet.libraries.bls_facade import BLSFacade
+from multiversx_sdk.wallet.libraries.bls_facade import BLSFacade, get_bls_facade
 
 
 def test_generate_public_key():
@@ -107,3 +107,24 @@ def test_generate_sign_and_verify():
     ok = facade.verify_message_signature(public_key, message, signature)
 
     assert ok
+
+
+def test_batch_operations():
+    facade = get_bls_facade()
+    assert facade is get_bls_facade()
+
+    private_key = bytes.fromhex("7cff99bd671502db7d15bc8abc0c9a804fb925406fbdd50f1e4c17a4cd774247")
+    public_key = bytes.fromhex(
+        "e7beaa95b3877f47348df4dd1cb578a4f7cabf7a20bfeefe5cdd263878ff132b765e04fef6f40c93512b666c47ed7719b8902f6c922c04247989b7137e837cc81a62e54712471c97a2ddab75aa9c2f58f813ed4c0fa722bde0ab718bff382208"
+    )
+    signature = bytes.fromhex(
+        "84fd0a3a9d4f1ea2d4b40c6da67f9b786284a1c3895b7253fec7311597cda3f757862bb0690a92a13ce612c33889fd86"
+    )
+
+    assert facade.generate_public_keys([private_key, private_key]) == [public_key, public_key]
+    assert facade.compute_messages_signatures([b"hello", b"hello"], private_key) == [signature, signature]
+    assert facade.compute_message_signatures(b"hello", [private_key]) == [signature]
+    assert facade.verify_messages_signatures([public_key] * 2, [b"hello", b"helloWorld"], [signature] * 2) == [
+        True,
+        False,
+    ]
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 import mnemonic
 
 from multiversx_sdk.wallet import core
@@ -38,6 +40,18 @@ class Mnemonic:
         secret_key = core.derive_keys(self.text, address_index)
         return UserSecretKey(secret_key)
 
+    def derive_keys(self, address_indices: Iterable[int], num_processes: int = 1) -> list[UserSecretKey]:
+        """Derives the keys of many addresses (e.g. `range(10_000)`), in order. The seed is only computed once.
+        If `num_processes` is greater than 1, large ranges are split across worker processes."""
+        address_indices = list(address_indices)
+
+        for address_index in address_indices:
+            if address_index < 0:
+                raise InvalidAddressIndexError(address_index)
+
+        secret_keys = core.derive_keys_for_indices(self.text, address_indices, num_processes)
+        return [UserSecretKey(secret_key) for secret_key in secret_keys]
+
     def get_text(self) -> str:
         return self.text
 
@@ -33,6 +33,25 @@ def test_derive_keys():
         mnemonic.derive_key()
 
 
+def test_derive_many_keys():
+    mnemonic = Mnemonic(
+        "moral volcano peasant pass circle pen over picture flat shop clap goat never lyrics gather prepare woman film husband gravity behind test tiger improve"
+    )
+    expected = [mnemonic.derive_key(index) for index in [0, 1, 2, 7, 42]]
+
+    assert mnemonic.derive_keys([0, 1, 2, 7, 42]) == expected
+    assert mnemonic.derive_keys([0, 1, 2, 7, 42], num_processes=2) == expected
+    assert [key.hex() for key in mnemonic.derive_keys(range(3))] == [
+        "413f42575f7f26fad3317a778771212fdb80245850981e48b58a4f25e344e8f9",
+        "b8ca6f8203fb4b545a8e83c5384da033c415db155b53fb5b8eba7ff5a039d639",
+        "e253a571ca153dc2aee845819f74bcc9773b0586edead15a94cb7235a5027436",
+    ]
+    assert mnemonic.derive_keys([]) == []
+
+    with pytest.raises(InvalidAddressIndexError):
+        mnemonic.derive_keys([0, -1])
+
+
 def test_convert_entropy_to_mnemonic_and_back():
     def test_conversion(text: str, entropy_hex: str) -> None:
         entropy_from_mnemonic = Mnemonic(text).get_entropy()
@@ -0,0 +1,106 @@
+import base64
+import mmap
+import sys
+from array import array
+from pathlib import Path
+from types import TracebackType
+from typing import Iterator, Optional, Type, Union
+
+from multiversx_sdk.wallet.pem_entry import (
+    HEADER_MARKER,
+    PemEntry,
+    _clean_lines,
+    _parse_label,
+)
+
+_HEADER_MARKER_BYTES = HEADER_MARKER.encode()
+
+
+class PemReader:
+    """
+    Reads the entries of a (possibly very large) PEM file lazily, without parsing the whole file upfront.
+
+    The byte offsets of the entries are indexed incrementally, only as far as needed: accessing `reader[index]` only
+    scans the file up to that entry, then parses (decodes) that entry alone. By default, the file is memory-mapped.
+
+    Use it as a context manager (or call `close()`), since the file is kept open while reading.
+    """
+
+    def __init__(self, path: Path, use_mmap: bool = True) -> None:
+        path = path.expanduser().resolve()
+        self._data: Union[mmap.mmap, bytes]
+
+        with open(path, "rb") as file:
+            # Empty files cannot be memory-mapped.
+            if use_mmap and path.stat().st_size > 0:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = file.read()
+
+        self._offsets = array("q")
+        self._scan_position = 0
+        self._is_fully_indexed = False
+
+    def __getitem__(self, index: int) -> PemEntry:
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or not self._index_entries(index + 1):
+            raise IndexError("PEM entry index out of range")
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if self._index_entries(index + 2) else len(self._data)
+        return _parse_entry(self._data[start:end])
+
+    def __iter__(self) -> Iterator[PemEntry]:
+        index = 0
+
+        while self._index_entries(index + 1):
+            yield self[index]
+            index += 1
+
+    def __len__(self) -> int:
+        self._index_entries(sys.maxsize)
+        return len(self._offsets)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> "PemReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _index_entries(self, count: int) -> bool:
+        """Scans the file (only as far as needed) for the first `count` entries. Returns whether they exist."""
+        while len(self._offsets) < count and not self._is_fully_indexed:
+            position = self._data.find(_HEADER_MARKER_BYTES, self._scan_position)
+
+            if position < 0:
+                self._is_fully_indexed = True
+            else:
+                self._offsets.append(position)
+                self._scan_position = position + len(_HEADER_MARKER_BYTES)
+
+        return len(self._offsets) >= count
+
+
+def _parse_entry(block: bytes) -> PemEntry:
+    """Parses the text between the header of an entry and the header of the next one (or the end of the file)."""
+    lines = _clean_lines(block.decode().splitlines())
+    payload_lines: list[str] = []
+
+    for line in lines[1:]:
+        if "-----" in line:
+            break
+        payload_lines.append(line)
+
+    message_hex = base64.b64decode("".join(payload_lines)).decode()
+    return PemEntry(_parse_label(lines[0]), bytes.fromhex(message_hex))
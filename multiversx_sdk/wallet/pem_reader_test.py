@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.wallet.pem_entry import PemEntry
+from multiversx_sdk.wallet.pem_reader import PemReader
+from multiversx_sdk.wallet.user_pem import UserPEM
+
+testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_read_entries_lazily(use_mmap: bool):
+    path = testwallets / "multipleUserKeys.pem"
+    expected = PemEntry.from_text_all(path.read_text())
+
+    with PemReader(path, use_mmap) as reader:
+        entry = reader[1]
+        assert (entry.label, entry.message) == (expected[1].label, expected[1].message)
+
+        entry = reader[-1]
+        assert (entry.label, entry.message) == (expected[2].label, expected[2].message)
+
+        assert [(entry.label, entry.message) for entry in reader] == [(item.label, item.message) for item in expected]
+        assert len(reader) == 3
+
+        with pytest.raises(IndexError):
+            reader[3]
+
+        with pytest.raises(IndexError):
+            reader[-4]
+
+
+def test_read_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.pem"
+    path.write_text("")
+
+    with PemReader(path) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+
+
+def test_user_pem_from_file_and_iterate_file():
+    path = testwallets / "multipleUserKeys.pem"
+
+    assert UserPEM.from_file(path, 2).label == "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+    assert [item.secret_key for item in UserPEM.iterate_file(path)] == [
+        item.secret_key for item in UserPEM.from_file_all(path)
+    ]
+
+    with pytest.raises(IndexError):
+        UserPEM.from_file(path, 3)
@@ -1,6 +1,8 @@
 import logging
-from typing import Optional
+from functools import partial
+from typing import Optional, Sequence
 
+import nacl.bindings
 import nacl.signing
 from nacl.exceptions import CryptoError
 
@@ -10,6 +12,7 @@ from multiversx_sdk.wallet.errors import (
     InvalidPublicKeyLengthError,
     InvalidSecretKeyLengthError,
 )
+from multiversx_sdk.wallet.worker_processes import run_in_worker_processes
 
 logger = logging.getLogger("user_keys")
 
@@ -20,6 +23,8 @@ class UserSecretKey:
             raise InvalidSecretKeyLengthError()
 
         self.buffer = buffer
+        # (seed, public key, expanded secret key), derived lazily from the buffer, then reused by "sign()".
+        self._keypair: Optional[tuple[bytes, bytes, bytes]] = None
 
     @classmethod
     def generate(cls) -> "UserSecretKey":
@@ -33,14 +38,36 @@ class UserSecretKey:
         return cls(buffer)
 
     def generate_public_key(self) -> "UserPublicKey":
-        public_key = bytes(nacl.signing.SigningKey(self.buffer).verify_key)
+        _, public_key = self._get_keypair()
         return UserPublicKey(public_key)
 
     def sign(self, data: bytes) -> bytes:
-        signing_key = nacl.signing.SigningKey(self.buffer)
-        signed = signing_key.sign(data)
-        signature = signed.signature
-        return signature
+        expanded_key, _ = self._get_keypair()
+        signed = nacl.bindings.crypto_sign(data, expanded_key)
+        return signed[: nacl.bindings.crypto_sign_BYTES]
+
+    def sign_many(self, data_items: Sequence[bytes], num_processes: int = 1) -> list[bytes]:
+        """Signs many items, in order. The expanded key is derived once, for the whole batch.
+
+        If `num_processes` is greater than 1, the items are split into contiguous chunks, signed by a pool of worker processes.
+        This only pays off for very large batches (tens of thousands of items), since the pool itself has a startup cost.
+        """
+        if num_processes <= 1 or len(data_items) <= 1:
+            expanded_key, _ = self._get_keypair()
+            return _sign_with_expanded_key(expanded_key, data_items)
+
+        return run_in_worker_processes(partial(_sign_chunk, self.buffer), num_processes, data_items)
+
+    def _get_keypair(self) -> tuple[bytes, bytes]:
+        """Returns the expanded secret key (seed + public key, as expected by libsodium) and the public key."""
+        keypair = self._keypair
+
+        # The cache is invalidated if the buffer gets replaced.
+        if keypair is None or keypair[0] is not self.buffer:
+            public_key, expanded_key = nacl.bindings.crypto_sign_seed_keypair(bytes(self.buffer))
+            keypair = self._keypair = (self.buffer, public_key, expanded_key)
+
+        return keypair[2], keypair[1]
 
     def hex(self) -> str:
         return self.buffer.hex()
@@ -61,15 +88,69 @@ class UserSecretKey:
         return self.buffer == value.buffer
 
 
+def _sign_with_expanded_key(expanded_key: bytes, data_items: Sequence[bytes]) -> list[bytes]:
+    crypto_sign = nacl.bindings.crypto_sign
+    signature_length = nacl.bindings.crypto_sign_BYTES
+    return [crypto_sign(data, expanded_key)[:signature_length] for data in data_items]
+
+
+def _sign_chunk(secret_key: bytes, data_items: list[bytes]) -> list[bytes]:
+    """Runs in a worker process (see `UserSecretKey.sign_many()`)."""
+    return UserSecretKey(secret_key).sign_many(data_items)
+
+
+def verify_many(
+    public_keys: Sequence[bytes],
+    data_items: Sequence[bytes],
+    signatures: Sequence[bytes],
+    num_processes: int = 1,
+) -> list[bool]:
+    """Verifies many signatures (each item has its own public key), in order.
+
+    Unlike `UserPublicKey.verify()`, failures are not logged: malformed public keys or signatures simply yield `False`.
+    If `num_processes` is greater than 1, the items are split into contiguous chunks, verified by a pool of worker processes.
+    """
+    if not len(public_keys) == len(data_items) == len(signatures):
+        raise ValueError("public_keys, data_items and signatures must have the same length")
+
+    if num_processes <= 1 or len(data_items) <= 1:
+        return _verify_chunk(public_keys, data_items, signatures)
+
+    return run_in_worker_processes(_verify_chunk, num_processes, public_keys, data_items, signatures)
+
+
+def _verify_chunk(public_keys: Sequence[bytes], data_items: Sequence[bytes], signatures: Sequence[bytes]) -> list[bool]:
+    crypto_sign_open = nacl.bindings.crypto_sign_open
+    signature_length = nacl.bindings.crypto_sign_BYTES
+    results: list[bool] = []
+
+    for public_key, data, signature in zip(public_keys, data_items, signatures):
+        if len(public_key) != USER_PUBKEY_LENGTH or len(signature) != signature_length:
+            results.append(False)
+            continue
+
+        try:
+            crypto_sign_open(bytes(signature) + data, bytes(public_key))
+            results.append(True)
+        except CryptoError:
+            results.append(False)
+
+    return results
+
+
 class UserPublicKey:
     def __init__(self, buffer: bytes) -> None:
         if len(buffer) != USER_PUBKEY_LENGTH:
             raise InvalidPublicKeyLengthError()
 
         self.buffer = bytes(buffer)
+        self._verify_key: Optional[nacl.signing.VerifyKey] = None
 
     def verify(self, data: bytes, signature: bytes) -> bool:
-        verify_key = nacl.signing.VerifyKey(self.buffer)
+        if self._verify_key is None:
+            self._verify_key = nacl.signing.VerifyKey(self.buffer)
+
+        verify_key = self._verify_key
 
         try:
             verify_key.verify(data, signature)
@@ -81,6 +162,12 @@ class UserPublicKey:
             logger.error(str(e))
             return False
 
+    def verify_many(
+        self, data_items: Sequence[bytes], signatures: Sequence[bytes], num_processes: int = 1
+    ) -> list[bool]:
+        """Verifies many signatures, in order (see `verify_many()`)."""
+        return verify_many([self.buffer] * len(data_items), data_items, signatures, num_processes)
+
     def to_address(self, hrp: Optional[str] = None) -> Address:
         return Address(self.buffer, hrp)
 
@@ -0,0 +1,215 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import nacl.bindings
+import nacl.utils
+
+from multiversx_sdk.core.address import get_shard_of_pubkey
+from multiversx_sdk.core.bech32 import CHARSET
+from multiversx_sdk.core.config import LibraryConfig
+from multiversx_sdk.wallet.constants import USER_SEED_LENGTH
+from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.user_pem import UserPEM
+from multiversx_sdk.wallet.user_wallet import UserWallet
+
+DEFAULT_ATTEMPTS_PER_BATCH = 2000
+# A public key (256 bits) is encoded by 52 bech32 characters, the last one holding a single bit (and padding).
+MAX_BECH32_PREFIX_LENGTH = 51
+
+
+class KeyGenerationStats:
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.found = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def attempts_per_second(self) -> float:
+        """The number of candidate keys tried per second."""
+        return self.attempts / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def found_per_second(self) -> float:
+        """The number of matching keys found per second."""
+        return self.found / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class UserKeysGenerator:
+    """
+    Generates secret keys whose addresses are in a given shard and / or start with a given bech32 prefix.
+
+    The candidates are checked on their public keys (the prefix is matched on the bits it encodes, without bech32-encoding the candidates).
+    If `num_processes` is greater than 1, the search is spread across a pool of worker processes.
+    """
+
+    def __init__(
+        self,
+        shard: Optional[int] = None,
+        bech32_prefix: Optional[str] = None,
+        number_of_shards: int = 3,
+        hrp: Optional[str] = None,
+        num_processes: int = 1,
+        attempts_per_batch: int = DEFAULT_ATTEMPTS_PER_BATCH,
+    ) -> None:
+        """
+        Args:
+            shard (Optional[int]): the shard of the generated addresses\n
+            bech32_prefix (Optional[str]): the beginning of the generated addresses, after the separator (e.g. "qqq"); `"erd1qqq"` is accepted, as well\n
+            number_of_shards (int): the number of shards of the network\n
+            hrp (Optional[str]): the human-readable part of the addresses (used when writing PEM and keystore files)\n
+            num_processes (int): the number of worker processes (1 means the search runs in the current process)\n
+            attempts_per_batch (int): the number of candidates tried by a worker before reporting back
+        """
+        self.shard = shard
+        self.number_of_shards = number_of_shards
+        self.hrp = hrp or LibraryConfig.default_address_hrp
+        self.num_processes = num_processes
+        self.attempts_per_batch = attempts_per_batch
+        self.bech32_prefix = _strip_hrp(bech32_prefix or "", self.hrp)
+        self.stats = KeyGenerationStats()
+
+        if shard is not None and not 0 <= shard < number_of_shards:
+            raise ValueError(f"shard must be in [0, {number_of_shards})")
+
+        if len(self.bech32_prefix) > MAX_BECH32_PREFIX_LENGTH:
+            raise ValueError(f"bech32_prefix must have at most {MAX_BECH32_PREFIX_LENGTH} characters")
+
+        invalid_characters = set(self.bech32_prefix) - set(CHARSET)
+        if invalid_characters:
+            raise ValueError(f"bech32_prefix contains characters not allowed by bech32: {sorted(invalid_characters)}")
+
+    def generate(
+        self,
+        count: int,
+        on_progress: Optional[Callable[[KeyGenerationStats], None]] = None,
+    ) -> Iterator[UserSecretKey]:
+        """Yields `count` secret keys, as soon as they are found. `on_progress` is called after each batch of attempts."""
+        self.stats = KeyGenerationStats()
+        started_at = time.perf_counter()
+
+        for seeds, attempts in self._search(count):
+            self.stats.attempts += attempts
+            self.stats.elapsed_seconds = time.perf_counter() - started_at
+
+            for seed in seeds:
+                if self.stats.found == count:
+                    break
+
+                self.stats.found += 1
+                yield UserSecretKey(seed)
+
+            if on_progress:
+                on_progress(self.stats)
+
+    def generate_to_pem(
+        self,
+        path: Path,
+        count: int,
+        on_progress: Optional[Callable[[KeyGenerationStats], None]] = None,
+    ) -> KeyGenerationStats:
+        """Writes the keys to a PEM file, as they are found."""
+        path = path.expanduser().resolve()
+
+        with open(path, "w") as file:
+            for secret_key in self.generate(count, on_progress):
+                label = secret_key.generate_public_key().to_address(self.hrp).to_bech32()
+                file.write(UserPEM(label, secret_key).to_text() + "\n")
+                file.flush()
+
+        return self.stats
+
+    def generate_to_keystores(
+        self,
+        directory: Path,
+        password: str,
+        count: int,
+        on_progress: Optional[Callable[[KeyGenerationStats], None]] = None,
+    ) -> KeyGenerationStats:
+        """Writes each key to a keystore file (with `kind=secretKey`), named after its address, as they are found."""
+        directory = directory.expanduser().resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for secret_key in self.generate(count, on_progress):
+            address = secret_key.generate_public_key().to_address(self.hrp).to_bech32()
+            wallet = UserWallet.from_secret_key(secret_key, password)
+            wallet.save(directory / f"{address}.json", self.hrp)
+
+        return self.stats
+
+    def _search(self, count: int) -> Iterator[tuple[list[bytes], int]]:
+        search = _KeySearch(self.shard, self.number_of_shards, self.bech32_prefix)
+        found = 0
+
+        if self.num_processes <= 1:
+            while found < count:
+                seeds = search.run(self.attempts_per_batch)
+                found += len(seeds)
+                yield seeds, self.attempts_per_batch
+            return
+
+        with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
+            pending: set[Future[list[bytes]]] = {
+                executor.submit(search.run, self.attempts_per_batch) for _ in range(self.num_processes)
+            }
+
+            try:
+                while found < count:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        seeds = future.result()
+                        found += len(seeds)
+                        yield seeds, self.attempts_per_batch
+
+                        if found < count:
+                            pending.add(executor.submit(search.run, self.attempts_per_batch))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class _KeySearch:
+    """The (picklable) search, run by the worker processes."""
+
+    def __init__(self, shard: Optional[int], number_of_shards: int, bech32_prefix: str) -> None:
+        self.shard = shard
+        self.number_of_shards = number_of_shards
+
+        # Each bech32 character encodes 5 bits: the prefix is matched against the first bits of the public key.
+        self.prefix_bits_length = 5 * len(bech32_prefix)
+        self.prefix_bytes_length = -(-self.prefix_bits_length // 8)
+        self.prefix_shift = 8 * self.prefix_bytes_length - self.prefix_bits_length
+        self.prefix_value = 0
+        for character in bech32_prefix:
+            self.prefix_value = (self.prefix_value << 5) | CHARSET.index(character)
+
+    def run(self, attempts: int) -> list[bytes]:
+        """Returns the seeds (secret keys) found among `attempts` random candidates."""
+        seed_keypair = nacl.bindings.crypto_sign_seed_keypair
+        random = nacl.utils.random
+        seeds: list[bytes] = []
+
+        for _ in range(attempts):
+            seed = random(USER_SEED_LENGTH)
+            public_key, _ = seed_keypair(seed)
+
+            if self.shard is not None and get_shard_of_pubkey(public_key, self.number_of_shards) != self.shard:
+                continue
+
+            if self.prefix_bits_length:
+                head = int.from_bytes(public_key[: self.prefix_bytes_length], "big") >> self.prefix_shift
+                if head != self.prefix_value:
+                    continue
+
+            seeds.append(seed)
+
+        return seeds
+
+
+def _strip_hrp(bech32_prefix: str, hrp: str) -> str:
+    separator = f"{hrp}1"
+    if bech32_prefix.startswith(separator):
+        return bech32_prefix[len(separator) :]
+    return bech32_prefix
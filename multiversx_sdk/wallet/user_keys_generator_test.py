@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from multiversx_sdk.core.address import AddressComputer
+from multiversx_sdk.wallet.user_keys_generator import (
+    KeyGenerationStats,
+    UserKeysGenerator,
+)
+from multiversx_sdk.wallet.user_pem import UserPEM
+from multiversx_sdk.wallet.user_wallet import UserWallet
+
+
+def test_generate_keys_in_shard():
+    address_computer = AddressComputer()
+
+    for num_processes in [1, 2]:
+        generator = UserKeysGenerator(shard=2, num_processes=num_processes, attempts_per_batch=50)
+        secret_keys = list(generator.generate(5))
+
+        assert len(secret_keys) == 5
+        assert len(set(key.hex() for key in secret_keys)) == 5
+        assert all(
+            address_computer.get_shard_of_address(key.generate_public_key().to_address()) == 2 for key in secret_keys
+        )
+        assert generator.stats.found == 5
+        assert generator.stats.attempts >= 5
+        assert generator.stats.attempts_per_second >= generator.stats.found_per_second > 0
+
+
+def test_generate_keys_with_prefix():
+    generator = UserKeysGenerator(shard=0, bech32_prefix="erd1q", attempts_per_batch=100)
+    progress: list[int] = []
+
+    def on_progress(stats: KeyGenerationStats):
+        progress.append(stats.attempts)
+
+    for secret_key in generator.generate(3, on_progress):
+        address = secret_key.generate_public_key().to_address()
+        assert address.to_bech32().startswith("erd1q")
+        assert AddressComputer().get_shard_of_address(address) == 0
+
+    assert progress == sorted(progress)
+    assert progress[-1] == generator.stats.attempts
+
+    with pytest.raises(ValueError, match="characters not allowed"):
+        UserKeysGenerator(bech32_prefix="qb")
+
+    with pytest.raises(ValueError, match="shard must be in"):
+        UserKeysGenerator(shard=3)
+
+
+def test_generate_to_pem_and_keystores(tmp_path: Path):
+    generator = UserKeysGenerator(shard=1, attempts_per_batch=20)
+
+    stats = generator.generate_to_pem(tmp_path / "keys.pem", 3)
+    items = UserPEM.from_file_all(tmp_path / "keys.pem")
+    assert stats.found == 3
+    assert [item.label for item in items] == [item.public_key.to_address().to_bech32() for item in items]
+
+    generator.generate_to_keystores(tmp_path / "keystores", "password", 2)
+    paths = sorted((tmp_path / "keystores").glob("*.json"))
+    assert len(paths) == 2
+
+    for path in paths:
+        secret_key = UserWallet.load_secret_key(path, "password")
+        assert secret_key.generate_public_key().to_address().to_bech32() == path.stem
@@ -1,7 +1,9 @@
 from pathlib import Path
+from typing import Iterator
 
 from multiversx_sdk.wallet.constants import USER_SEED_LENGTH
 from multiversx_sdk.wallet.pem_entry import PemEntry
+from multiversx_sdk.wallet.pem_reader import PemReader
 from multiversx_sdk.wallet.user_keys import UserSecretKey
 
 
@@ -13,7 +15,16 @@ class UserPEM:
 
     @classmethod
     def from_file(cls, path: Path, index: int = 0) -> "UserPEM":
-        return cls.from_file_all(path)[index]
+        # Only the requested entry is parsed (see "PemReader").
+        with PemReader(path) as reader:
+            return cls._from_entry(reader[index])
+
+    @classmethod
+    def iterate_file(cls, path: Path) -> Iterator["UserPEM"]:
+        """Yields the entries of a (possibly very large) PEM file one by one, parsing them lazily."""
+        with PemReader(path) as reader:
+            for entry in reader:
+                yield cls._from_entry(entry)
 
     @classmethod
     def from_file_all(cls, path: Path) -> list["UserPEM"]:
@@ -31,12 +42,16 @@ class UserPEM:
         result_items: list[UserPEM] = []
 
         for entry in entries:
-            secret_key = UserSecretKey(entry.message[0:USER_SEED_LENGTH])
-            item = cls(entry.label, secret_key)
+            item = cls._from_entry(entry)
             result_items.append(item)
 
         return result_items
 
+    @classmethod
+    def _from_entry(cls, entry: PemEntry) -> "UserPEM":
+        secret_key = UserSecretKey(entry.message[0:USER_SEED_LENGTH])
+        return cls(entry.label, secret_key)
+
     def save(self, path: Path):
         path = path.expanduser().resolve()
         path.write_text(self.to_text())
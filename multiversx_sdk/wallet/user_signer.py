@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Sequence
 
 from multiversx_sdk.wallet.errors import CannotSignError
 from multiversx_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
@@ -35,6 +36,13 @@ class UserSigner:
         except Exception as err:
             raise CannotSignError() from err
 
+    def sign_many(self, data_items: Sequence[bytes], num_processes: int = 1) -> list[bytes]:
+        """Signs many items, in order (see `UserSecretKey.sign_many()`)."""
+        try:
+            return self.secret_key.sign_many(data_items, num_processes)
+        except Exception as err:
+            raise CannotSignError() from err
+
     def _try_sign(self, data: bytes) -> bytes:
         signature = self.secret_key.sign(data)
         return signature
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -10,8 +11,10 @@ from multiversx_sdk.core import (
     Transaction,
     TransactionComputer,
 )
+from multiversx_sdk.wallet.crypto.key_derivation_cache import KeyDerivationCache
 from multiversx_sdk.wallet.crypto.randomness import Randomness
-from multiversx_sdk.wallet.user_keys import UserSecretKey
+from multiversx_sdk.wallet.errors import InvalidKeystoreFilePasswordError
+from multiversx_sdk.wallet.user_keys import UserSecretKey, verify_many
 from multiversx_sdk.wallet.user_pem import UserPEM
 from multiversx_sdk.wallet.user_signer import UserSigner
 from multiversx_sdk.wallet.user_verifer import UserVerifier
@@ -184,6 +187,47 @@ def test_sign_transaction():
     assert verifier.verify(transaction_computer.compute_bytes_for_signing(tx), tx.signature)
 
 
+def test_sign_many():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    data_items = [f"hello {i}".encode() for i in range(8)]
+    expected = [signer.sign(data) for data in data_items]
+
+    assert signer.sign_many(data_items) == expected
+    assert signer.sign_many(data_items, num_processes=2) == expected
+    assert signer.sign_many([]) == []
+
+
+def test_verify_many():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    verifier = UserVerifier(signer.get_pubkey())
+    data_items = [f"hello {i}".encode() for i in range(4)]
+    signatures = signer.sign_many(data_items)
+
+    assert verifier.verify_many(data_items, signatures) == [True] * 4
+    assert verifier.verify_many(data_items, signatures[::-1]) == [False] * 4
+    assert verifier.verify_many(data_items, [bytes(64), b"", signatures[2], signatures[3][:-1]]) == [
+        False,
+        False,
+        True,
+        False,
+    ]
+
+    public_keys = [signer.get_pubkey().buffer, bytes(32), b"", signer.get_pubkey().buffer]
+    assert verify_many(public_keys, data_items, signatures) == [True, False, False, True]
+    assert verify_many(public_keys, data_items, signatures, num_processes=2) == [True, False, False, True]
+
+    with pytest.raises(ValueError):
+        verify_many(public_keys, data_items, signatures[:2])
+
+
+def test_signing_key_is_refreshed_when_buffer_changes():
+    secret_key = UserSecretKey.new_from_string("413f42575f7f26fad3317a778771212fdb80245850981e48b58a4f25e344e8f9")
+    assert secret_key.generate_public_key().hex() == "0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1"
+
+    secret_key.buffer = bytes.fromhex("b8ca6f8203fb4b545a8e83c5384da033c415db155b53fb5b8eba7ff5a039d639")
+    assert secret_key.generate_public_key().hex() == "8049d639e5a6980d1cd2392abcce41029cda74a1563523a202f09641cc2618f8"
+
+
 def test_sign_message():
     message = Message(
         "hello".encode(),
@@ -273,6 +317,71 @@ def test_load_secret_key_with_mnemonic():
     )
 
 
+def test_load_secret_keys():
+    paths = [testwallets / "alice.json", testwallets / "withDummyMnemonic.json", testwallets / "withDummyMnemonic.json"]
+    expected = [
+        "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th",
+        "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx",
+        "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8",
+    ]
+
+    for num_processes in [1, 2]:
+        secret_keys = UserWallet.load_secret_keys(paths, "password", [None, 1, 2], num_processes)
+        assert [key.generate_public_key().to_address("erd").to_bech32() for key in secret_keys] == expected
+
+    with pytest.raises(Exception, match="must have the same length"):
+        UserWallet.load_secret_keys(paths, ["password"])
+
+
+def test_load_secret_keys_decrypts_each_keystore_once(monkeypatch: pytest.MonkeyPatch):
+    keystore_path = testwallets / "withDummyMnemonic.json"
+    decrypt_mnemonic = UserWallet.decrypt_mnemonic
+    calls: list[str] = []
+
+    def decrypt_mnemonic_spy(keyfile_object: dict[str, Any], password: str, key_derivation_cache: Any = None):
+        calls.append(password)
+        return decrypt_mnemonic(keyfile_object, password, key_derivation_cache)
+
+    monkeypatch.setattr(UserWallet, "decrypt_mnemonic", decrypt_mnemonic_spy)
+
+    paths = [keystore_path, testwallets / "alice.json", keystore_path, keystore_path]
+    secret_keys = UserWallet.load_secret_keys(paths, "password", [2, None, 0, 2])
+
+    assert calls == ["password"]
+    assert secret_keys[0] == secret_keys[3] == UserWallet.load_secret_key(keystore_path, "password", 2)
+    assert secret_keys[1] == UserWallet.load_secret_key(paths[1], "password")
+    assert secret_keys[2] == UserWallet.load_secret_key(keystore_path, "password", 0)
+
+
+def test_load_secret_key_with_key_derivation_cache():
+    keystore_path = testwallets / "withDummyMnemonic.json"
+    cache = KeyDerivationCache(max_size=1)
+
+    first = UserWallet.load_secret_key(keystore_path, "password", 1, key_derivation_cache=cache)
+    assert len(cache) == 1
+
+    # Re-opening the keystore (for another address index) reuses the derived key.
+    second = UserWallet.load_secret_key(keystore_path, "password", 2, key_derivation_cache=cache)
+    assert len(cache) == 1
+    assert first.generate_public_key().to_address("erd").to_bech32() == (
+        "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+    )
+    assert second.generate_public_key().to_address("erd").to_bech32() == (
+        "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+    )
+
+    # A wrong password misses the cache (and is not cached).
+    with pytest.raises(InvalidKeystoreFilePasswordError):
+        UserWallet.load_secret_key(keystore_path, "wrong", 1, key_derivation_cache=cache)
+
+    # The cache is bounded.
+    UserWallet.load_secret_key(testwallets / "alice.json", "password", key_derivation_cache=cache)
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
 def test_decrypt_secret_key_with_keystore_mnemonic():
     user_wallet = UserWallet.from_mnemonic(DUMMY_MNEMONIC, "")
     mnemonic_json = user_wallet.to_dict()
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from multiversx_sdk.core.address import Address
 from multiversx_sdk.wallet.user_keys import UserPublicKey
 
@@ -14,3 +16,8 @@ class UserVerifier:
 
     def verify(self, data: bytes, signature: bytes) -> bool:
         return self.public_key.verify(data, signature)
+
+    def verify_many(
+        self, data_items: Sequence[bytes], signatures: Sequence[bytes], num_processes: int = 1
+    ) -> list[bool]:
+        return self.public_key.verify_many(data_items, signatures, num_processes)
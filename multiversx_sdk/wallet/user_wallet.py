@@ -2,12 +2,19 @@ import json
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, Sequence, Union
 
-from multiversx_sdk.wallet.crypto import EncryptedData, Randomness, decryptor, encryptor
+from multiversx_sdk.wallet.crypto import (
+    EncryptedData,
+    KeyDerivationCache,
+    Randomness,
+    decryptor,
+    encryptor,
+)
 from multiversx_sdk.wallet.interfaces import IRandomness
 from multiversx_sdk.wallet.mnemonic import Mnemonic
 from multiversx_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
+from multiversx_sdk.wallet.worker_processes import run_in_worker_processes
 
 
 class UserWalletKind(str, Enum):
@@ -59,36 +66,53 @@ class UserWallet:
         return cls(kind=UserWalletKind.MNEMONIC.value, encrypted_data=encrypted_data)
 
     @classmethod
-    def decrypt_secret_key(cls, keyfile_object: dict[str, Any], password: str) -> UserSecretKey:
+    def decrypt_secret_key(
+        cls,
+        keyfile_object: dict[str, Any],
+        password: str,
+        key_derivation_cache: Optional[KeyDerivationCache] = None,
+    ) -> UserSecretKey:
         # Here, we check the "kind" field only for files that have it. Older keystore files (holding only secret keys) do not have this field.
         kind = keyfile_object.get("kind", None)
         if kind and kind != UserWalletKind.SECRET_KEY.value:
             raise Exception(f"Expected kind to be {UserWalletKind.SECRET_KEY.value}, but it was {kind}")
 
         encrypted_data = EncryptedData.from_keyfile_object(keyfile_object)
-        buffer = decryptor.decrypt(encrypted_data, password)
+        buffer = decryptor.decrypt(encrypted_data, password, key_derivation_cache)
         buffer = buffer.rjust(32, b"\x00")
         seed = buffer[:32]
         return UserSecretKey(seed)
 
     @classmethod
-    def decrypt_mnemonic(cls, keyfile_object: dict[str, Any], password: str) -> Mnemonic:
+    def decrypt_mnemonic(
+        cls,
+        keyfile_object: dict[str, Any],
+        password: str,
+        key_derivation_cache: Optional[KeyDerivationCache] = None,
+    ) -> Mnemonic:
         if keyfile_object["kind"] != UserWalletKind.MNEMONIC.value:
             raise Exception(f"Expected kind to be {UserWalletKind.MNEMONIC.value}, but it was {keyfile_object['kind']}")
 
         encrypted_data = EncryptedData.from_keyfile_object(keyfile_object)
-        buffer = decryptor.decrypt(encrypted_data, password)
+        buffer = decryptor.decrypt(encrypted_data, password, key_derivation_cache)
         mnemonic = Mnemonic(buffer.decode())
         return mnemonic
 
     @classmethod
-    def load_secret_key(cls, path: Path, password: str, address_index: Optional[int] = None) -> "UserSecretKey":
+    def load_secret_key(
+        cls,
+        path: Path,
+        password: str,
+        address_index: Optional[int] = None,
+        key_derivation_cache: Optional[KeyDerivationCache] = None,
+    ) -> "UserSecretKey":
         """
         Loads a secret key from a keystore file.
 
         :param path: The path to the keystore file.
         :param password: The password to decrypt the keystore file.
         :param address_index: The index of the address to load. This is only used when the keystore file contains a mnemonic, and the secret key has to be derived from this mnemonic.
+        :param key_derivation_cache: If provided, the keystore can be opened again (e.g. for other address indices) without re-running the key derivation function.
         """
         key_file_json = path.expanduser().resolve().read_text()
         key_file_object = json.loads(key_file_json)
@@ -98,15 +122,101 @@ class UserWallet:
         if kind == UserWalletKind.SECRET_KEY.value:
             if address_index is not None:
                 raise Exception("address_index must not be provided when kind == 'secretKey'")
-            secret_key = cls.decrypt_secret_key(key_file_object, password)
+            secret_key = cls.decrypt_secret_key(key_file_object, password, key_derivation_cache)
         elif kind == UserWalletKind.MNEMONIC.value:
-            mnemonic = cls.decrypt_mnemonic(key_file_object, password)
+            mnemonic = cls.decrypt_mnemonic(key_file_object, password, key_derivation_cache)
             secret_key = mnemonic.derive_key(address_index or 0)
         else:
             raise Exception(f"Unknown kind: {kind}")
 
         return secret_key
 
+    @classmethod
+    def load_secret_keys(
+        cls,
+        paths: Sequence[Path],
+        passwords: Union[str, Sequence[str]],
+        address_indices: Optional[Sequence[Optional[int]]] = None,
+        num_processes: int = 1,
+        key_derivation_cache: Optional[KeyDerivationCache] = None,
+    ) -> list["UserSecretKey"]:
+        """
+        Loads the secret keys from many keystore files, in order. The same file can be given multiple times (e.g. for different address indices).
+        Each file is read and decrypted once (per password); the keys of a mnemonic are derived together (see `Mnemonic.derive_keys()`).
+
+        :param paths: The paths to the keystore files.
+        :param passwords: One password for all the files, or one password per file.
+        :param address_indices: One address index (or `None`) per file; see `load_secret_key()`.
+        :param num_processes: If greater than 1, the files are decrypted by a pool of worker processes (the key derivation function is CPU-bound).
+        :param key_derivation_cache: Used when decrypting in the current process. Worker processes use their own (short-lived) caches.
+        """
+        passwords = [passwords] * len(paths) if isinstance(passwords, str) else list(passwords)
+        address_indices = list(address_indices) if address_indices is not None else [None] * len(paths)
+
+        if not len(paths) == len(passwords) == len(address_indices):
+            raise Exception("paths, passwords and address_indices must have the same length")
+
+        # The positions of the requested keys, grouped by keystore (and password).
+        positions_by_keystore: dict[tuple[Path, str], list[int]] = {}
+        for position, (path, password) in enumerate(zip(paths, passwords)):
+            positions_by_keystore.setdefault((path.expanduser().resolve(), password), []).append(position)
+
+        keystores = list(positions_by_keystore)
+        keystores_paths = [path for path, _ in keystores]
+        keystores_passwords = [password for _, password in keystores]
+        keystores_address_indices = [
+            [address_indices[position] for position in positions] for positions in positions_by_keystore.values()
+        ]
+
+        if num_processes <= 1 or len(keystores) <= 1:
+            key_derivation_cache = key_derivation_cache if key_derivation_cache is not None else KeyDerivationCache()
+            keys_by_keystore = [
+                cls._load_secret_keys_from_keystore(path, password, indices, key_derivation_cache, num_processes)
+                for path, password, indices in zip(keystores_paths, keystores_passwords, keystores_address_indices)
+            ]
+        else:
+            keys_by_keystore = [
+                [UserSecretKey(buffer) for buffer in buffers]
+                for buffers in run_in_worker_processes(
+                    _load_secret_keys_chunk,
+                    num_processes,
+                    keystores_paths,
+                    keystores_passwords,
+                    keystores_address_indices,
+                )
+            ]
+
+        secret_keys_by_position: dict[int, UserSecretKey] = {}
+        for positions, keys in zip(positions_by_keystore.values(), keys_by_keystore):
+            secret_keys_by_position.update(zip(positions, keys))
+
+        return [secret_keys_by_position[position] for position in range(len(paths))]
+
+    @classmethod
+    def _load_secret_keys_from_keystore(
+        cls,
+        path: Path,
+        password: str,
+        address_indices: Sequence[Optional[int]],
+        key_derivation_cache: Optional[KeyDerivationCache] = None,
+        num_processes: int = 1,
+    ) -> list["UserSecretKey"]:
+        """Same as calling `load_secret_key()` for each address index, but the keystore file is read and decrypted only once."""
+        key_file_object = json.loads(path.read_text())
+        kind = key_file_object.get("kind", UserWalletKind.SECRET_KEY.value)
+
+        if kind == UserWalletKind.SECRET_KEY.value:
+            if any(address_index is not None for address_index in address_indices):
+                raise Exception("address_index must not be provided when kind == 'secretKey'")
+            secret_key = cls.decrypt_secret_key(key_file_object, password, key_derivation_cache)
+            return [secret_key] * len(address_indices)
+
+        if kind == UserWalletKind.MNEMONIC.value:
+            mnemonic = cls.decrypt_mnemonic(key_file_object, password, key_derivation_cache)
+            return mnemonic.derive_keys([address_index or 0 for address_index in address_indices], num_processes)
+
+        raise Exception(f"Unknown kind: {kind}")
+
     def save(self, path: Path, address_hrp: Optional[str] = None):
         path = path.expanduser().resolve()
         json_content = self.to_json(address_hrp)
@@ -166,3 +276,15 @@ class UserWallet:
             },
             "mac": self.encrypted_data.mac,
         }
+
+
+def _load_secret_keys_chunk(
+    paths: list[Path], passwords: list[str], address_indices: list[list[Optional[int]]]
+) -> list[list[bytes]]:
+    """Runs in a worker process (see `UserWallet.load_secret_keys()`). Loads the keys of each keystore, for the given address indices."""
+    key_derivation_cache = KeyDerivationCache()
+    keys_by_keystore = [
+        UserWallet._load_secret_keys_from_keystore(path, password, indices, key_derivation_cache)
+        for path, password, indices in zip(paths, passwords, address_indices)
+    ]
+    return [[secret_key.get_bytes() for secret_key in keys] for keys in keys_by_keystore]
@@ -1,9 +1,11 @@
+from typing import Optional, Sequence
+
 from multiversx_sdk.wallet.constants import (
     VALIDATOR_PUBKEY_LENGTH,
     VALIDATOR_SECRETKEY_LENGTH,
 )
 from multiversx_sdk.wallet.errors import InvalidSecretKeyLengthError
-from multiversx_sdk.wallet.libraries.bls_facade import BLSFacade
+from multiversx_sdk.wallet.libraries.bls_facade import get_bls_facade
 
 
 class ValidatorSecretKey:
@@ -15,7 +17,7 @@ class ValidatorSecretKey:
 
     @classmethod
     def generate(cls) -> "ValidatorSecretKey":
-        secret_key_bytes = BLSFacade().generate_private_key()
+        secret_key_bytes = get_bls_facade().generate_private_key()
         return cls(secret_key_bytes)
 
     @classmethod
@@ -23,14 +25,29 @@ class ValidatorSecretKey:
         buffer = bytes.fromhex(buffer_hex.strip())
         return cls(buffer)
 
+    @property
+    def buffer(self) -> bytes:
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer: bytes) -> None:
+        self._buffer = buffer
+        # Derived (lazily) from the buffer, thus reset along with it.
+        self._public_key: Optional[bytes] = None
+
     def generate_public_key(self) -> "ValidatorPublicKey":
-        public_key_bytes = BLSFacade().generate_public_key(self.buffer)
-        return ValidatorPublicKey(public_key_bytes)
+        if self._public_key is None:
+            self._public_key = get_bls_facade().generate_public_key(self.buffer)
+
+        return ValidatorPublicKey(self._public_key)
 
     def sign(self, data: bytes) -> bytes:
-        signature = BLSFacade().compute_message_signature(data, self.buffer)
+        signature = get_bls_facade().compute_message_signature(data, self.buffer)
         return signature
 
+    def sign_many(self, data_items: Sequence[bytes]) -> list[bytes]:
+        return get_bls_facade().compute_messages_signatures(data_items, self.buffer)
+
     def hex(self) -> str:
         return self.buffer.hex()
 
@@ -54,9 +71,13 @@ class ValidatorPublicKey:
         return ValidatorPublicKey(buffer)
 
     def verify(self, data: bytes, signature: bytes) -> bool:
-        ok = BLSFacade().verify_message_signature(self.buffer, data, signature)
+        ok = get_bls_facade().verify_message_signature(self.buffer, data, signature)
         return ok
 
+    def verify_many(self, data_items: Sequence[bytes], signatures: Sequence[bytes]) -> list[bool]:
+        public_keys = [self.buffer] * len(data_items)
+        return get_bls_facade().verify_messages_signatures(public_keys, data_items, signatures)
+
     def hex(self) -> str:
         return self.buffer.hex()
 
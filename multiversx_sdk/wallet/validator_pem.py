@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from multiversx_sdk.wallet.pem_entry import PemEntry
+from multiversx_sdk.wallet.pem_reader import PemReader
 from multiversx_sdk.wallet.validator_keys import ValidatorSecretKey
 
 
@@ -11,7 +12,11 @@ class ValidatorPEM:
 
     @classmethod
     def from_file(cls, path: Path, index: int = 0) -> "ValidatorPEM":
-        return cls.from_file_all(path)[index]
+        # Only the requested entry is parsed (see "PemReader").
+        with PemReader(path) as reader:
+            entry = reader[index]
+
+        return cls(entry.label, ValidatorSecretKey(entry.message))
 
     @classmethod
     def from_file_all(cls, path: Path) -> list["ValidatorPEM"]:
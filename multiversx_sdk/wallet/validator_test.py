@@ -18,6 +18,17 @@ def test_validator_secret_key_generate_public_key():
     )
 
 
+def test_validator_secret_key_public_key_follows_buffer():
+    secret_key = ValidatorSecretKey.from_string("7cff99bd671502db7d15bc8abc0c9a804fb925406fbdd50f1e4c17a4cd774247")
+    public_key = secret_key.generate_public_key()
+    other_secret_key = ValidatorSecretKey.generate()
+
+    secret_key.buffer = other_secret_key.buffer
+
+    assert secret_key.generate_public_key().hex() == other_secret_key.generate_public_key().hex()
+    assert secret_key.generate_public_key().hex() != public_key.hex()
+
+
 def test_sign_message():
     signer = ValidatorSigner.from_pem_file(testwallets / "validatorKey00.pem")
     message = b"hello"
@@ -0,0 +1,25 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Sequence
+
+
+def run_in_worker_processes(
+    function: Callable[..., list[Any]], num_processes: int, *columns: Sequence[Any]
+) -> list[Any]:
+    """
+    **FOR INTERNAL USE ONLY.**
+    Splits the columns (of equal length) into contiguous chunks, processed by a pool of worker processes.
+    The results of the chunks are concatenated, in order.
+
+    The function must be picklable (e.g. a module-level function or a `functools.partial` of one).
+    """
+    length = len(columns[0])
+    if not length:
+        return []
+
+    chunk_size = -(-length // num_processes)
+    starts = range(0, length, chunk_size)
+    chunked_columns = [[list(column[start : start + chunk_size]) for start in starts] for column in columns]
+
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        results = executor.map(function, *chunked_columns)
+        return [item for chunk_results in results for item in chunk_results]